@@ -74,6 +74,8 @@ class FinderKeywords(LibraryContext):
     def __init__(self, ctx):
         super().__init__(ctx)
         self._resolver = syntax.Resolver(self._find)
+        self._watcher: Optional[screen.ScreenWatcher] = None
+        self._waiting = False
 
         self.timeout = 3.0
         if HAS_RECOGNITION:
@@ -228,11 +230,22 @@ class FinderKeywords(LibraryContext):
         matches = []
         screenshots = []
 
+        # Use the latest frames when waiting for screen changes,
+        # the screen is watched only once a locator needs it
+        if self._waiting and self._watcher is None:
+            self._watcher = screen.ScreenWatcher()
+
+        if self._watcher is not None:
+            frames = self._watcher.images()
+        else:
+            frames = ((display, None) for display in screen.displays())
+
         # Search all displays, and map results to combined virtual display
 
         start_time = time.time()
-        for display in screen.displays():
-            image = screen.grab(display)
+        for display, image in frames:
+            if image is None:
+                image = screen.grab(display)
             regions = finder(image)
 
             for region in regions:
@@ -320,6 +333,10 @@ class FinderKeywords(LibraryContext):
         """Wait for an element defined by locator to exist, or
         raise a TimeoutException if none were found within timeout.
 
+        For image and OCR locators, the displays are checked for changes
+        every ``interval`` seconds, and the locator is searched again only
+        when the screen has changed.
+
         :param locator: Locator string
 
         Example:
@@ -336,16 +353,26 @@ class FinderKeywords(LibraryContext):
         end_time = time.time() + float(timeout)
 
         error = "Operation timed out"
-        while time.time() <= end_time:
-            start = time.time()
-            try:
-                return self.find_element(locator)
-            except (ElementNotFound, MultipleElementsFound) as err:
-                error = err
-
-            duration = time.time() - start
-            if duration < interval:
-                time.sleep(interval - duration)
+        self._waiting = True
+        try:
+            while time.time() <= end_time:
+                start = time.time()
+                # Search result can not change if the screen has not,
+                # watcher is created by the first search that reads the screen
+                if self._watcher is None or self._watcher.update():
+                    try:
+                        return self.find_element(locator)
+                    except (ElementNotFound, MultipleElementsFound) as err:
+                        error = err
+
+                duration = time.time() - start
+                if duration < interval:
+                    time.sleep(interval - duration)
+        finally:
+            self._waiting = False
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
 
         raise TimeoutException(error)
 
@@ -3,7 +3,7 @@ import os
 from itertools import count
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union, List, Dict
+from typing import Optional, Union, List, Dict, Tuple
 
 import mss
 from PIL import Image
@@ -94,6 +94,59 @@ def grab(region: Optional[Region] = None) -> Image.Image:
     return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
 
 
+class ScreenWatcher:
+    """Grabs all displays with a persistent mss handle, and keeps track
+    of which displays have changed since the previous grab.
+
+    Frames are compared using the raw screenshot data, and only converted
+    to Pillow images when requested.
+    """
+
+    def __init__(self):
+        self._sct = mss.mss()
+        self._displays = [_monitor_to_region(m) for m in self._sct.monitors[1:]]
+        self._frames: List[Optional[mss.screenshot.ScreenShot]] = [None] * len(
+            self._displays
+        )
+        self._images: Dict[int, Image.Image] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._sct.close()
+
+    def update(self) -> bool:
+        """Grab all displays, and return True if any of them changed."""
+        changed = False
+        for index, display in enumerate(self._displays):
+            screenshot = self._sct.grab(display.as_tuple())
+            previous = self._frames[index]
+            if previous is None or previous.raw != screenshot.raw:
+                self._frames[index] = screenshot
+                self._images.pop(index, None)
+                changed = True
+        return changed
+
+    def images(self) -> List[Tuple[Region, Image.Image]]:
+        """Latest frames of all displays as Pillow images."""
+        if any(frame is None for frame in self._frames):
+            self.update()
+
+        images = []
+        for index, display in enumerate(self._displays):
+            if index not in self._images:
+                frame = self._frames[index]
+                self._images[index] = Image.frombytes(
+                    "RGB", frame.size, frame.bgra, "raw", "BGRX"
+                )
+            images.append((display, self._images[index]))
+        return images
+
+
 def log_image(image: Image.Image, size=1024):
     """Embed image into Robot Framework log."""
     if EXECUTION_CONTEXTS.current is None:
@@ -3,15 +3,17 @@ import pathlib
 from collections import defaultdict
 from contextlib import contextmanager
 from io import BytesIO
+from itertools import islice
 
 import openpyxl
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import get_column_letter, range_boundaries
 
 import xlrd
 import xlwt
 from xlutils.copy import copy as xlutils_copy
 from PIL import Image
 
+from RPA.core.types import is_list_like
 from RPA.Tables import Tables, Table
 
 
@@ -57,6 +59,16 @@ def ensure_unique(values):
     return output
 
 
+def iter_chunks(iterable, size):
+    """Iterate lists of at most `size` consecutive items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            break
+        yield chunk
+
+
 class Files:
     """The `Excel.Files` library can be used to read and write Excel
     files without the need to start the actual Excel application.
@@ -170,13 +182,13 @@ class Files:
         self.logger = logging.getLogger(__name__)
         self.workbook = None
 
-    def _load_workbook(self, path):
+    def _load_workbook(self, path, read_only=False):
         # pylint: disable=broad-except
         path = pathlib.Path(path).resolve(strict=True)
 
         try:
             book = XlsxWorkbook(path)
-            book.open()
+            book.open(read_only=read_only)
             return book
         except Exception as err:
             self.logger.debug(err)
@@ -215,15 +227,23 @@ class Files:
         self.workbook.create()
         return self.workbook
 
-    def open_workbook(self, path):
+    def open_workbook(self, path, read_only=False):
         """Open an existing Excel workbook.
 
-        :param path: path to Excel file
+        :param path:      path to Excel file
+        :param read_only: open workbook in read-only mode, default `False`
+
+        In read-only mode worksheets of .xlsx workbooks are parsed lazily
+        when they are read, which makes opening large files faster
+        and uses a constant amount of memory when used together with
+        ``Iterate Worksheet``. A workbook in read-only mode can not
+        be modified or saved. Legacy .xls workbooks are always
+        loaded on demand, and the argument has no effect for them.
         """
         if self.workbook:
             self.close_workbook()
 
-        self.workbook = self._load_workbook(path)
+        self.workbook = self._load_workbook(path, read_only)
         self.logger.info("Opened workbook: %s", self.workbook)
         return self.workbook
 
@@ -326,6 +346,43 @@ class Files:
         sheet = self.read_worksheet(name, header, start)
         return tables.create_table(sheet, trim)
 
+    def iterate_worksheet(self, name=None, header=False, start=None, chunk_size=None):
+        """Iterate the content of a worksheet lazily, one row at a time.
+
+        Rows are dictionaries with the same keys as in ``Read Worksheet``.
+        If ``chunk_size`` is given, lists of at most that many rows are
+        returned instead of single rows.
+
+        :param name:       Name of worksheet to read
+        :param header:     If `True`, use the first row of the worksheet
+                           as headers for the rest of the rows.
+        :param start:      Row index to start reading data from (1-indexed)
+        :param chunk_size: Amount of rows to return at a time
+
+        Together with ``Open Workbook`` in read-only mode this allows
+        processing large worksheets without loading them fully into memory.
+        The result must not be expanded as ``@{rows}``, e.g. in a ``FOR``
+        loop, as that reads all the rows to memory first. Instead, give it
+        as ``${rows}`` to a keyword which consumes it one row at a time:
+
+        .. code-block:: robotframework
+
+            Open workbook    ${LARGE_FILE}    read_only=${TRUE}
+            ${rows}=    Iterate worksheet    header=${TRUE}
+            RPA.Tables.Write rows to CSV    ${rows}    orders.csv
+        """
+        assert self.workbook, "No active workbook"
+        rows = self.workbook.iter_worksheet(name, header, start)
+
+        if chunk_size is None:
+            return rows
+
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be a positive integer")
+
+        return iter_chunks(rows, chunk_size)
+
     def append_rows_to_worksheet(self, content, name=None, header=False, start=None):
         """Append values to the end of the worksheet.
 
@@ -373,6 +430,74 @@ class Files:
         assert self.workbook, "No active workbook"
         self.workbook.set_cell_value(row, column, value, name)
 
+    def get_cell_values(self, cells, name=None, as_table=False):
+        """Get values from a range of cells in the given worksheet.
+
+        :param cells:    Range of cells, e.g. B2:F10
+        :param name:     Name of worksheet
+        :param as_table: Return values as a Table, instead of a list of rows
+
+        Values are returned as a list of rows, where each row is a list
+        of values. When returned as a Table, the columns are named with
+        Excel-style column letters. Whole columns (e.g. ``A:C``) or
+        rows (e.g. ``2:5``) can also be used as the range.
+
+        .. code-block:: robotframework
+
+            ${values}=    Get cell values    B2:F5000
+            ${table}=     Get cell values    B2:F5000    as_table=${TRUE}
+        """
+        assert self.workbook, "No active workbook"
+        min_col, min_row, max_col, max_row = range_boundaries(str(cells))
+
+        rows = self.workbook.get_cell_values(min_row, min_col, max_row, max_col, name)
+
+        if not as_table:
+            return rows
+
+        start = min_col or 1
+        width = max((len(row) for row in rows), default=0)
+        columns = [get_column_letter(col) for col in range(start, start + width)]
+        return Table(rows, columns=columns)
+
+    def set_cell_values(self, cells, values, name=None, header=False):
+        """Set values of a range of cells in the given worksheet.
+
+        :param cells:  Start cell, e.g. B2, or range of cells, e.g. B2:F10
+        :param values: Rows of values as a list of lists, or a Table
+        :param name:   Name of worksheet
+        :param header: If values is a Table, also write the column names
+                       as the first row
+
+        All values are written in a single pass, which is considerably
+        faster than setting each cell separately. If a range of cells is
+        given, the dimensions of the values should match it.
+
+        .. code-block:: robotframework
+
+            Set cell values    B2    ${rows}
+            Set cell values    A1    ${table}    header=${TRUE}
+        """
+        assert self.workbook, "No active workbook"
+
+        if isinstance(values, Table):
+            rows = [values.columns] if header else []
+            rows.extend(values.iter_lists(with_index=False))
+        else:
+            rows = [list(row) if is_list_like(row) else [row] for row in values]
+
+        min_col, min_row, max_col, max_row = range_boundaries(str(cells))
+        if None in (min_col, min_row):
+            raise ValueError(f"Invalid start cell: {cells}")
+
+        if ":" in str(cells):
+            height = max_row - min_row + 1
+            width = max_col - min_col + 1
+            if len(rows) != height or any(len(row) != width for row in rows):
+                raise ValueError(f"Values do not match cell range: {cells}")
+
+        self.workbook.set_cell_values(min_row, min_col, rows, name)
+
     def insert_image_to_worksheet(self, row, column, path, scale=1.0, name=None):
         """Insert an image into the given cell.
 
@@ -460,7 +585,7 @@ class XlsxWorkbook:
         self._book = openpyxl.Workbook()
         self._extension = None
 
-    def open(self, path=None):
+    def open(self, path=None, read_only=False):
         path = path or self.path
 
         if not path:
@@ -471,11 +596,11 @@ class XlsxWorkbook:
         except TypeError:
             extension = None
 
+        options = {"filename": path, "read_only": read_only}
         if extension in (".xlsm", ".xltm"):
-            self._book = openpyxl.load_workbook(filename=path, keep_vba=True)
-        else:
-            self._book = openpyxl.load_workbook(filename=path)
+            options["keep_vba"] = True
 
+        self._book = openpyxl.load_workbook(**options)
         self._extension = extension
 
     def close(self):
@@ -496,29 +621,39 @@ class XlsxWorkbook:
         self.active = name
 
     def read_worksheet(self, name=None, header=False, start=None):
+        return list(self.iter_worksheet(name, header, start))
+
+    def iter_worksheet(self, name=None, header=False, start=None):
         name = self._get_sheetname(name)
         sheet = self._book[name]
         start = self._to_index(start)
 
+        self.active = name
+        return self._iter_rows(sheet, header, start)
+
+    def _iter_rows(self, sheet, header, start):
+        rows = sheet.iter_rows(min_row=start)
+
         if header:
-            columns = [cell.value for cell in sheet[start]]
-            start += 1
+            columns = [cell.value for cell in next(rows, ())]
         else:
-            columns = [get_column_letter(i + 1) for i in range(sheet.max_column)]
+            # Dimensions might be unknown for worksheets in read-only mode
+            columns = [get_column_letter(i + 1) for i in range(sheet.max_column or 0)]
 
         columns = ensure_unique(columns)
 
-        data = []
-        for cells in sheet.iter_rows(min_row=start):
+        for cells in rows:
             row = {}
             for c, cell in enumerate(cells):
+                if c >= len(columns):
+                    if header:
+                        break
+                    columns.append(get_column_letter(c + 1))
+
                 column = columns[c]
                 if column is not None:
                     row[column] = cell.value
-            data.append(row)
-
-        self.active = name
-        return data
+            yield row
 
     def append_worksheet(self, name=None, content=None, header=False, start=None):
         content = Table(content)
@@ -581,6 +716,27 @@ class XlsxWorkbook:
 
         sheet[cell] = value
 
+    def get_cell_values(self, min_row, min_col, max_row, max_col, name=None):
+        name = self._get_sheetname(name)
+        sheet = self._book[name]
+
+        rows = sheet.iter_rows(
+            min_row=min_row,
+            min_col=min_col,
+            max_row=max_row,
+            max_col=max_col,
+            values_only=True,
+        )
+        return [list(row) for row in rows]
+
+    def set_cell_values(self, row, column, values, name=None):
+        name = self._get_sheetname(name)
+        sheet = self._book[name]
+
+        for r, row_values in enumerate(values, int(row)):
+            for c, value in enumerate(row_values, int(column)):
+                sheet.cell(row=r, column=c, value=value)
+
     def insert_image(self, row, column, image, name=None):
         name = self._get_sheetname(name)
         sheet = self._book[name]
@@ -606,6 +762,7 @@ class XlsWorkbook:
         self._extension = None
         self._active = None
         self._images = []
+        self._pending = None
 
     @property
     def sheetnames(self):
@@ -706,6 +863,7 @@ class XlsWorkbook:
 
         self._extension = extension
         self._images = []
+        self._pending = None
 
     def close(self):
         self._book.release_resources()
@@ -713,11 +871,23 @@ class XlsWorkbook:
         self._extension = None
         self._active = None
         self._images = []
+        self._pending = None
 
     @contextmanager
     def _book_write(self):
-        book = xlutils_copy(self._book)
-        yield book
+        # Changes are collected into a single writable copy of the workbook,
+        # which is only parsed again when the content is read or saved
+        if self._pending is None:
+            self._pending = xlutils_copy(self._book)
+        yield self._pending
+
+    def _flush(self):
+        """Re-parse workbook to include pending changes."""
+        if self._pending is None:
+            return
+
+        book, self._pending = self._pending, None
+        active, extension, images = self._active, self._extension, self._images
 
         fd = BytesIO()
         try:
@@ -728,11 +898,17 @@ class XlsWorkbook:
         finally:
             fd.close()
 
+        self._extension = extension
+        self._images = images
+        if active in self.sheetnames:
+            self.active = active
+
     def save(self, path=None):
         path = path or self.path
         if not path:
             raise ValueError("No path defined for workbook")
 
+        self._flush()
         book = xlutils_copy(self._book)
         self._insert_images(book)
         book.save(path)
@@ -741,13 +917,22 @@ class XlsWorkbook:
         with self._book_write() as book:
             book.add_sheet(name)
 
+        self._flush()
         self.active = name
 
     def read_worksheet(self, name=None, header=False, start=None):
+        return list(self.iter_worksheet(name, header, start))
+
+    def iter_worksheet(self, name=None, header=False, start=None):
+        self._flush()
         name = self._get_sheetname(name)
         sheet = self._book.sheet_by_name(name)
         start = self._to_index(start)
 
+        self.active = name
+        return self._iter_rows(sheet, header, start)
+
+    def _iter_rows(self, sheet, header, start):
         if header:
             columns = [
                 cell.value if cell.value != "" else None for cell in sheet.row(start)
@@ -758,7 +943,6 @@ class XlsWorkbook:
 
         columns = ensure_unique(columns)
 
-        data = []
         for r in range(start, sheet.nrows):
             row = {}
             for c in range(sheet.ncols):
@@ -766,10 +950,7 @@ class XlsWorkbook:
                 if column is not None:
                     cell = sheet.cell(r, c)
                     row[column] = self._parse_type(cell)
-            data.append(row)
-
-        self.active = name
-        return data
+            yield row
 
     def _parse_type(self, cell):
         value = cell.value
@@ -790,6 +971,10 @@ class XlsWorkbook:
         if not content:
             return
 
+        if header:
+            # Existing header row is read from the parsed workbook
+            self._flush()
+
         name = self._get_sheetname(name)
         sheet_read = self._book.sheet_by_name(name)
         start = self._to_index(start)
@@ -802,7 +987,8 @@ class XlsWorkbook:
 
         with self._book_write() as book:
             sheet_write = book.get_sheet(name)
-            start_row = sheet_read.nrows
+            rows = sheet_write.get_rows()
+            start_row = max(sheet_read.nrows, max(rows, default=-1) + 1)
 
             if header and is_empty:
                 for column, value in enumerate(columns):
@@ -829,6 +1015,8 @@ class XlsWorkbook:
                 sheet for sheet in book._Workbook__worksheets if sheet.name != name
             ]
 
+        self._flush()
+
     def rename_worksheet(self, title, name=None):
         title = str(title)
         name = self._get_sheetname(name)
@@ -837,9 +1025,11 @@ class XlsWorkbook:
             sheet = book.get_sheet(name)
             sheet.name = title
 
+        self._flush()
         self.active = title
 
     def find_empty_row(self, name=None):
+        self._flush()
         name = self._get_sheetname(name)
         sheet = self._book.sheet_by_name(name)
 
@@ -859,6 +1049,39 @@ class XlsWorkbook:
             sheet = book.get_sheet(name)
             sheet.write(row, column, value)
 
+    def get_cell_values(self, min_row, min_col, max_row, max_col, name=None):
+        self._flush()
+        name = self._get_sheetname(name)
+        sheet = self._book.sheet_by_name(name)
+
+        # Convert to 0-based indexing, and default to used area
+        min_row = (min_row or 1) - 1
+        min_col = (min_col or 1) - 1
+        max_row = max_row if max_row is not None else sheet.nrows
+        max_col = max_col if max_col is not None else sheet.ncols
+
+        rows = []
+        for r in range(min_row, max_row):
+            row = []
+            for c in range(min_col, max_col):
+                if r < sheet.nrows and c < sheet.ncols:
+                    row.append(self._parse_type(sheet.cell(r, c)))
+                else:
+                    row.append(None)
+            rows.append(row)
+
+        return rows
+
+    def set_cell_values(self, row, column, values, name=None):
+        name = self._get_sheetname(name)
+        row, column = self._get_cell(row, column)
+
+        with self._book_write() as book:
+            sheet = book.get_sheet(name)
+            for r, row_values in enumerate(values, row):
+                for c, value in enumerate(row_values, column):
+                    sheet.write(r, c, value)
+
     def insert_image(self, row, column, image, name=None):
         name = self._get_sheetname(name)
         row, column = self._get_cell(row, column)
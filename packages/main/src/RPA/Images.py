@@ -1,4 +1,5 @@
 import logging
+import math
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,13 +13,21 @@ from PIL import ImageOps
 from RPA.core.geometry import Region, to_point, to_region
 from RPA.core.notebook import notebook_image
 
+try:
+    # Check if numpy is available,
+    # for vectorized template matching
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 try:
     # Check if opencv is available,
     # for improved template matching
     import cv2
-    import numpy
 
-    HAS_OPENCV = True
+    HAS_OPENCV = HAS_NUMPY
 except ImportError:
     HAS_OPENCV = False
 
@@ -40,6 +49,38 @@ def chunks(obj, size, start=0):
     return [obj[i : i + size] for i in range(start, len(obj), size)]
 
 
+def fft_size(size):
+    """Smallest size not less than `size`, which only has the prime
+    factors 2, 3 and 5 and is therefore fast for FFT.
+    """
+    best = 2 ** math.ceil(math.log2(size))
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            value = power35
+            while value < size:
+                value *= 2
+            best = min(best, value)
+            power35 *= 3
+        power5 *= 5
+    return best
+
+
+def window_sums(array, height, width):
+    """Sums of all `height` x `width` windows in a 2D array,
+    calculated from its integral image.
+    """
+    integral = numpy.zeros((array.shape[0] + 1, array.shape[1] + 1), dtype=numpy.int64)
+    integral[1:, 1:] = array.cumsum(axis=0, dtype=numpy.int64).cumsum(axis=1)
+    return (
+        integral[height:, width:]
+        - integral[:-height, width:]
+        - integral[height:, :-width]
+        + integral[:-height, :-width]
+    )
+
+
 @dataclass
 class RGB:
     """Container for a single RGB value."""
@@ -100,6 +141,9 @@ class Images:
 
     ``pip install rpaframework[cv]``
 
+    If only NumPy is available, it is used for template matching instead,
+    which also supports the ``tolerance`` argument.
+
     **Examples**
 
     **Robot Framework**
@@ -339,6 +383,8 @@ class TemplateMatcher:
         """
         if self._opencv:
             match_func = self._iter_match_opencv
+        elif HAS_NUMPY:
+            match_func = self._iter_match_numpy
         else:
             match_func = self._iter_match_pillow
 
@@ -393,8 +439,111 @@ class TemplateMatcher:
 
             yield Region.from_size(match_x, match_y, template_width, template_height)
 
+    def _iter_match_numpy(self, image, template, tolerance):
+        """Search for template image with numpy, when opencv is not available.
+
+        Without a tolerance, only exact matches are returned. Otherwise the
+        matches are filtered by correlation coefficients, as with opencv.
+        """
+        if tolerance is None:
+            return self._iter_match_numpy_exact(image, template)
+        return self._iter_match_numpy_correlation(image, template, tolerance)
+
+    def _iter_match_numpy_exact(self, image, template):
+        """Find exact matches for template image in grayscale.
+
+        Candidates are found by comparing the sums and squared sums
+        of all template-sized areas, and then verified pixel by pixel.
+        """
+        image = numpy.asarray(ImageOps.grayscale(image), dtype=numpy.int64)
+        template = numpy.asarray(ImageOps.grayscale(template), dtype=numpy.int64)
+        template_height, template_width = template.shape
+
+        sums = window_sums(image, template_height, template_width)
+        squares = window_sums(image**2, template_height, template_width)
+        candidates = (sums == template.sum()) & (squares == (template**2).sum())
+
+        for match_y, match_x in zip(*numpy.nonzero(candidates)):
+            area = image[
+                match_y : match_y + template_height, match_x : match_x + template_width
+            ]
+            if numpy.array_equal(area, template):
+                yield Region.from_size(
+                    int(match_x), int(match_y), template_width, template_height
+                )
+
+    def _iter_match_numpy_correlation(self, image, template, tolerance):
+        """Calculate the same normalized correlation coefficients as opencv's
+        matchTemplate() with TM_CCOEFF_NORMED, using FFT for the correlation
+        and integral images for the normalization.
+        """
+        image = numpy.asarray(image.convert("RGB"), dtype=numpy.int64)
+        template = numpy.asarray(template.convert("RGB"), dtype=numpy.float64)
+
+        image_height, image_width = image.shape[:2]
+        template_height, template_width = template.shape[:2]
+        coeff_height = image_height - template_height + 1
+        coeff_width = image_width - template_width + 1
+        count = template_height * template_width
+
+        # Correlation is circular, but it does not wrap around to the
+        # valid area as long as the image itself fits in the padded size
+        shape = (fft_size(image_height), fft_size(image_width))
+
+        numerator = numpy.zeros((coeff_height, coeff_width))
+        image_norm = numpy.zeros((coeff_height, coeff_width))
+        template_norm = 0.0
+
+        for channel in range(3):
+            image_channel = image[..., channel]
+            template_channel = template[..., channel]
+            template_channel = template_channel - template_channel.mean()
+
+            spectrum = numpy.fft.rfft2(image_channel, s=shape) * numpy.conj(
+                numpy.fft.rfft2(template_channel, s=shape)
+            )
+            correlation = numpy.fft.irfft2(spectrum, s=shape)
+            numerator += correlation[:coeff_height, :coeff_width]
+
+            sums = window_sums(image_channel, template_height, template_width)
+            squares = window_sums(image_channel**2, template_height, template_width)
+            image_norm += squares - sums.astype(numpy.float64) ** 2 / count
+            template_norm += (template_channel**2).sum()
+
+        denominator = numpy.sqrt(numpy.maximum(image_norm, 0) * template_norm)
+        coefficients = numpy.divide(
+            numerator,
+            denominator,
+            out=numpy.zeros_like(numerator),
+            where=denominator > 1e-6,
+        )
+
+        # Best matches first, ties in the same order as with opencv.
+        # A match suppresses other matches in a template-sized region
+        # around it, to prevent duplicate matches for the same element.
+        rows, cols = numpy.nonzero(coefficients >= tolerance)
+        order = numpy.argsort(-coefficients[rows, cols], kind="stable")
+        suppressed = numpy.zeros(coefficients.shape, dtype=bool)
+
+        for match_y, match_x in zip(rows[order], cols[order]):
+            if suppressed[match_y, match_x]:
+                continue
+
+            top = max(match_y - template_height // 2, 0)
+            left = max(match_x - template_width // 2, 0)
+            bottom = max(match_y + template_height // 2, 0)
+            right = max(match_x + template_width // 2, 0)
+
+            suppressed[top:bottom, left:right] = True
+            suppressed[match_y, match_x] = True
+
+            yield Region.from_size(
+                int(match_x), int(match_y), template_width, template_height
+            )
+
     def _iter_match_pillow(self, image, template, tolerance):
-        """Brute-force search for template image in larger image.
+        """Brute-force search for template image in larger image,
+        when numpy is not available.
 
         Use optimized string search for finding the first row and then
         check if whole template matches.
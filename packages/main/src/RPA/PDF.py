@@ -1,43 +1,25 @@
-import collections
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import glob
+import io
+from itertools import repeat
 import logging
 import math
-import os
 from pathlib import Path
 import re
-import sys
-import tempfile
 from typing import Any, Iterable
 
 from fpdf import FPDF, HTMLMixin
 from PIL import Image
+from pdfminer.layout import LAParams
 from pdfminer.pdfdocument import PDFDocument
 from pdfminer.pdfparser import PDFParser
 from pdfminer.pdfpage import PDFPage
-
-from pdfminer.layout import (
-    LAParams,
-    LTPage,
-    LTText,
-    LTTextBox,
-    LTLine,
-    LTRect,
-    LTCurve,
-    LTFigure,
-    LTTextLine,
-    LTTextBoxVertical,
-    LTChar,
-    LTImage,
-    LTTextGroup,
-)
-
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer.pdftypes import resolve1
-from pdfminer.utils import enc, bbox2str
-from pdfminer.converter import PDFConverter
 
 from PyPDF2 import PdfFileWriter, PdfFileReader
 from PyPDF2.generic import NameObject, BooleanObject, IndirectObject
+from PyPDF2.pdf import PageObject
 import PyPDF2
 
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
@@ -45,347 +27,84 @@ from RPA.RobotLogListener import RobotLogListener
 from RPA.core.helpers import required_param
 from RPA.core.notebook import notebook_print
 
+# Parsing classes are also available from this module, as before
+from RPA.PDFParsing import (  # noqa: F401 pylint: disable=unused-import
+    DEFAULT_LAPARAMS,
+    RPAConverter,
+    RpaFigure,
+    RpaPdfDocument,
+    RpaPdfPage,
+    RpaPdfPageCache,
+    RpaPdfParser,
+    RpaTextBox,
+    TargetObject,
+    TextBoxIndex,
+    get_page_text,
+    iterable_items_to_int,
+    parse_pdf_pages,
+)
+
 try:
     BuiltIn().import_library("RPA.RobotLogListener")
 except RobotNotRunningError:
     pass
 
 
-def iterable_items_to_int(bbox):
-    if bbox is None:
-        return list()
-    return list(map(int, bbox))
-
-
-logging.getLogger("pdfminer").setLevel(logging.WARNING)
-
-
-class TargetObject:
-    """Container for Target text box"""
-
-    boxid: int
-    bbox: tuple
-    text: str
-
-
-class RpaFigure:
-    """Class for each LTFigure element in the PDF"""
-
-    figure_name: str
-    figure_bbox: list
-    item: dict
-    image_name: str
-
-    def __init__(self, name: str, bbox: Iterable) -> None:
-        self.figure_name = name
-        self.figure_bbox = iterable_items_to_int(bbox)
-        self.image_name = None
-        self.item = None
-
-    def set_item(self, item: Any):
-        # LTImage
-        self.item = item
-
-    def details(self):
-        return '<image src="%s" width="%d" height="%d" />' % (
-            self.image_name,
-            self.item["width"],
-            self.item["height"],
-        )
-
-
-class RpaPdfPage:
-    """Class for each PDF page"""
-
-    bbox: list
-    content: OrderedDict
-    content_id: int
-    pageid: str
-    rotate: int
-
-    def __init__(self, pageid: int, bbox: Iterable, rotate: int) -> None:
-        self.pageid = pageid
-        self.bbox = iterable_items_to_int(bbox)
-        self.rotate = rotate
-        self.content = collections.OrderedDict()
-        self.content_id = 0
-
-    def add_content(self, content: Any) -> None:
-        self.content[self.content_id] = content
-        self.content_id += 1
-
-    def get_content(self) -> OrderedDict:
-        return self.content
-
-    def get_figures(self) -> OrderedDict:
-        return {k: v for k, v in self.content.items() if isinstance(v, RpaFigure)}
-
-    def get_textboxes(self) -> OrderedDict:
-        return {k: v for k, v in self.content.items() if isinstance(v, RpaTextBox)}
-
-    def __str__(self) -> str:
-        page_as_str = '<page id="%s" bbox="%s" rotate="%d">\n' % (
-            self.pageid,
-            bbox2str(self.bbox),
-            self.rotate,
-        )
-        for _, c in self.content.items():
-            page_as_str += f"{c}\n"
-        return page_as_str
-
-
-class RpaTextBox:
-    """Class for each LTTextBox element in the PDF"""
-
-    item: dict
-    textbox_bbox: list
-    textbox_id: int
-    textbox_wmode: str
-
-    def __init__(self, boxid: int, bbox: Iterable, wmode: str) -> None:
-        self.textbox_id = boxid
-        self.textbox_bbox = iterable_items_to_int(bbox)
-        self.textbox_wmode = wmode
-
-    def set_item(self, item: Any):
-        self.item = {
-            "bbox": iterable_items_to_int(item.bbox),
-            "text": item.get_text().strip(),
-        }
-
-    @property
-    def left(self) -> Any:
-        return self.bbox[0] if (self.bbox and len(self.bbox) == 4) else None
-
-    @property
-    def bottom(self) -> Any:
-        return self.bbox[1] if (self.bbox and len(self.bbox) == 4) else None
-
-    @property
-    def right(self) -> Any:
-        return self.bbox[2] if (self.bbox and len(self.bbox) == 4) else None
-
-    @property
-    def top(self) -> Any:
-        return self.bbox[3] if (self.bbox and len(self.bbox) == 4) else None
-
-    @property
-    def boxid(self) -> int:
-        return self.textbox_id
-
-    @property
-    def text(self) -> str:
-        return self.item["text"]
-
-    @text.setter
-    def text(self, newtext):
-        self.item["text"] = newtext
-
-    @property
-    def bbox(self) -> list:
-        return self.item["bbox"]
-
-    def __str__(self) -> str:
-        return self.text
-
-
-class RpaPdfDocument:
-    """Class for parsed PDF document"""
-
-    encoding: str = "utf-8"
-    pages: OrderedDict
-    xml_content: bytearray = bytearray()
-
-    def __init__(self) -> None:
-        self.pages = collections.OrderedDict()
-
-    def append_xml(self, xml: bytes) -> None:
-        self.xml_content += xml
-
-    def add_page(self, page: RpaPdfPage) -> None:
-        self.pages[page.pageid] = page
-
-    def get_pages(self) -> OrderedDict:
-        return self.pages
-
-    def get_page(self, pagenum: int) -> RpaPdfPage:
-        return self.pages[pagenum]
-
-    def dump_xml(self) -> str:
-        return self.xml_content.decode("utf-8")
-
-
-class RPAConverter(PDFConverter):
-    """Class for converting PDF into RPA classes"""
-
-    CONTROL = re.compile("[\x00-\x08\x0b-\x0c\x0e-\x1f]")
-
-    def __init__(
-        self,
-        rsrcmgr,
-        codec="utf-8",
-        pageno=1,
-        laparams=None,
-        imagewriter=None,
-        stripcontrol=False,
-    ):
-        PDFConverter.__init__(
-            self, rsrcmgr, sys.stdout, codec=codec, pageno=pageno, laparams=laparams
-        )
-        self.rpa_pdf_document = RpaPdfDocument()
-        self.figure = None
-        self.current_page = None
-        self.imagewriter = imagewriter
-        self.stripcontrol = stripcontrol
-        self.write_header()
-
-    def write(self, text):
-        if self.codec:
-            text = text.encode(self.codec)
-        self.rpa_pdf_document.append_xml(text)
-
-    def write_header(self):
-        if self.codec:
-            self.write('<?xml version="1.0" encoding="%s" ?>\n' % self.codec)
-        else:
-            self.write('<?xml version="1.0" ?>\n')
-        self.write("<pages>\n")
-
-    def write_footer(self):
-        self.write("</pages>\n")
-
-    def write_text(self, text):
-        if self.stripcontrol:
-            text = self.CONTROL.sub("", text)
-        self.write(enc(text))
-
-    def receive_layout(self, ltpage):  # noqa: C901 pylint: disable=R0915
-        def show_group(item):
-            if isinstance(item, LTTextBox):
-                self.write(
-                    '<textbox id="%d" bbox="%s" />\n'
-                    % (item.index, bbox2str(item.bbox))
-                )
-            elif isinstance(item, LTTextGroup):
-                self.write('<textgroup bbox="%s">\n' % bbox2str(item.bbox))
-                for child in item:
-                    show_group(child)
-                self.write("</textgroup>\n")
-
-        #  pylint: disable=R0912, R0915
-        def render(item):
-            if isinstance(item, LTPage):
-                s = '<page id="%s" bbox="%s" rotate="%d">\n' % (
-                    item.pageid,
-                    bbox2str(item.bbox),
-                    item.rotate,
-                )
-                self.current_page = RpaPdfPage(item.pageid, item.bbox, item.rotate)
-
-                self.write(s)
-                for child in item:
-                    render(child)
-                if item.groups is not None:
-                    self.write("<layout>\n")
-                    for group in item.groups:
-                        show_group(group)
-                    self.write("</layout>\n")
-                self.write("</page>\n")
-                self.rpa_pdf_document.add_page(self.current_page)
-            elif isinstance(item, LTLine):
-                s = '<line linewidth="%d" bbox="%s" />\n' % (
-                    item.linewidth,
-                    bbox2str(item.bbox),
-                )
-                self.write(s)
-            elif isinstance(item, LTRect):
-                s = '<rect linewidth="%d" bbox="%s" />\n' % (
-                    item.linewidth,
-                    bbox2str(item.bbox),
-                )
-                self.write(s)
-            elif isinstance(item, LTCurve):
-                s = '<curve linewidth="%d" bbox="%s" pts="%s"/>\n' % (
-                    item.linewidth,
-                    bbox2str(item.bbox),
-                    item.get_pts(),
-                )
-                self.write(s)
-            elif isinstance(item, LTFigure):
-                self.figure = RpaFigure(item.name, item.bbox)
-                if self.figure:
-                    s = '<figure name="%s" bbox="%s">\n' % (
-                        item.name,
-                        bbox2str(item.bbox),
-                    )
-                    self.write(s)
-                    for child in item:
-                        if self.figure:
-                            self.figure.set_item(item)
-                        render(child)
-                    self.write("</figure>\n")
-                    self.current_page.add_content(self.figure)
-                    self.figure = None
-            elif isinstance(item, LTTextLine):
-                self.write('<textline bbox="%s">\n' % bbox2str(item.bbox))
-                for child in item:
-                    render(child)
-                self.write("</textline>\n")
-            elif isinstance(item, LTTextBox):
-                wmode = ""
-
-                if isinstance(item, LTTextBoxVertical):
-                    wmode = ' wmode="vertical"'
-                s = '<textbox id="%d" bbox="%s"%s>\n' % (
-                    item.index,
-                    bbox2str(item.bbox),
-                    wmode,
-                )
-                box = RpaTextBox(item.index, item.bbox, wmode)
-                self.write(s)
-                box.set_item(item)
-                self.current_page.add_content(box)
-                for child in item:
-                    render(child)
-                self.write("</textbox>\n")
-            elif isinstance(item, LTChar):
-                s = (
-                    '<text font="%s" bbox="%s" colourspace="%s" '
-                    'ncolour="%s" size="%.3f">'
-                    % (
-                        enc(item.fontname),
-                        bbox2str(item.bbox),
-                        item.ncs.name,
-                        item.graphicstate.ncolor,
-                        item.size,
-                    )
-                )
-                self.write(s)
-                self.write_text(item.get_text())
-                self.write("</text>\n")
-            elif isinstance(item, LTText):
-                self.write("<text>%s</text>\n" % item.get_text())
-            elif isinstance(item, LTImage):
-                if self.figure:
-                    self.figure.set_item(item)
-                if self.imagewriter is not None:
-                    name = self.imagewriter.export_image(item)
-                    self.write(
-                        '<image src="%s" width="%d" height="%d" />\n'
-                        % (enc(name), item.width, item.height)
-                    )
-                else:
-                    self.write(
-                        '<image width="%d" height="%d" />\n' % (item.width, item.height)
-                    )
-            else:
-                assert False, str(("Unhandled", item))
+class PipelinePage:
+    """Class for a page in queued page operations"""
+
+    def __init__(self, reader: PdfFileReader, index: int) -> None:
+        self.reader = reader
+        self.index = index
+        self.rotate = 0
+        self.overlays = []
+
+    def copy(self) -> "PipelinePage":
+        page = PipelinePage(self.reader, self.index)
+        page.rotate = self.rotate
+        page.overlays = list(self.overlays)
+        return page
+
+    def create_page(self) -> PageObject:
+        # Operations are done on a copy, so the source reader
+        # can still be used for other pages and keywords
+        page = PageObject(self.reader)
+        page.update(self.reader.getPage(self.index))
+        if self.rotate % 360:
+            page.rotateClockwise(self.rotate % 360)
+        for overlay in self.overlays:
+            page.mergePage(overlay)
+        return page
+
+
+class PagePipeline:
+    """Class for page operations, which are written in one pass"""
+
+    def __init__(self, reader: PdfFileReader) -> None:
+        self.pages = [PipelinePage(reader, i) for i in range(reader.getNumPages())]
+        self.encryption = None
+        self.exit_stack = ExitStack()
+
+    def get_pages(self, pages: Iterable = None) -> list:
+        if pages is None:
+            return list(self.pages)
+        result = []
+        for pagenum in pages:
+            if not 1 <= pagenum <= len(self.pages):
+                raise ValueError(f"Page {pagenum} does not exist in the pipeline")
+            result.append(self.pages[pagenum - 1])
+        return result
 
-        render(ltpage)
+    def write(self, fileobject: Any) -> None:
+        writer = PdfFileWriter()
+        for page in self.pages:
+            writer.addPage(page.create_page())
+        if self.encryption:
+            writer.encrypt(*self.encryption)
+        writer.write(fileobject)
 
-    def close(self):
-        self.write_footer()
-        return self.rpa_pdf_document
+    def close(self) -> None:
+        self.exit_stack.close()
 
 
 class PageGenerator:
@@ -451,12 +170,15 @@ class PDF(FPDF, HTMLMixin):
 
     anchor_element: dict
     active_fileobject: object
+    cache_directory: Path
     fileobjects: dict
     modified_reader: PdfFileReader
+    page_pipeline: PagePipeline
+    parsers: dict
+    readers: dict
     output_directory: Path
-    rpa_pdf_document: RpaPdfDocument
 
-    def __init__(self, outdir: str = ".") -> None:
+    def __init__(self, outdir: str = ".", cache_dir: str = None) -> None:
         FPDF.__init__(self)
         HTMLMixin.__init__(self)
         self.logger = logging.getLogger(__name__)
@@ -467,9 +189,12 @@ class PDF(FPDF, HTMLMixin):
         self.anchor_element = None
         self.fileobjects = {}
         self.modified_reader = None
-        self.rpa_pdf_document = None
+        self.page_pipeline = None
+        self.parsers = {}
+        self.readers = {}
 
         self.set_output_directory(outdir)
+        self.set_cache_directory(cache_dir)
 
         listener = RobotLogListener()
         listener.register_protected_keywords(["RPA.PDF.decrypt"])
@@ -477,17 +202,32 @@ class PDF(FPDF, HTMLMixin):
     def __del__(self):
         self.close_all_pdf_documents()
 
+    @property
+    def rpa_pdf_parser(self) -> RpaPdfParser:
+        """Parser of the active document, if it has been created."""
+        return self.parsers.get(self.active_pdf)
+
+    @property
+    def rpa_pdf_document(self) -> RpaPdfDocument:
+        """Parsed pages of the active document, if it has been parsed."""
+        parser = self.rpa_pdf_parser
+        return parser.rpa_pdf_document if parser is not None else None
+
     def close_all_pdf_documents(self) -> None:
         """Close all opened PDF file descriptors."""
+        if self.page_pipeline is not None:
+            self.page_pipeline.close()
+            self.page_pipeline = None
         for filename, fileobject in self.fileobjects.items():
             fileobject.close()
             self.logger.debug('PDF "%s" closed', filename)
         self.anchor_element = None
         self.fileobjects = {}
+        self.parsers = {}
+        self.readers = {}
         self.active_pdf = None
         self.active_fileobject = None
         self.active_fields = None
-        self.rpa_pdf_document = None
 
     def close_pdf_document(self, source_pdf: str = None):
         """Close PDF file descriptor for certain file.
@@ -498,12 +238,13 @@ class PDF(FPDF, HTMLMixin):
         if str(source_pdf) not in self.fileobjects.keys():
             raise ValueError('PDF "%s" is not open' % source_pdf)
         self.logger.info("Closing PDF document: %s", source_pdf)
-        self.fileobjects[source_pdf].close()
-        del self.fileobjects[source_pdf]
+        self.fileobjects[str(source_pdf)].close()
+        del self.fileobjects[str(source_pdf)]
+        self.parsers.pop(str(source_pdf), None)
+        self.readers.pop(str(source_pdf), None)
         self.active_pdf = None
         self.active_fileobject = None
         self.active_fields = None
-        self.rpa_pdf_document = None
 
     def set_output_directory(self, outdir: str = ".") -> None:
         """Set output directory where target files are saved to.
@@ -512,6 +253,26 @@ class PDF(FPDF, HTMLMixin):
         """
         self.output_directory = Path(outdir)
 
+    def set_cache_directory(self, cache_dir: str = None) -> None:
+        """Set directory where parsed pages are cached between robot runs.
+
+        :param cache_dir: cache directory path, caching is disabled by default
+            or when `None` is given
+
+        The pages are cached by the content of the PDF file, so the same
+        document is not parsed again even if it is opened from a different
+        path. The setting is used for documents opened after calling this
+        keyword.
+
+        Example:
+
+        .. code-block:: robotframework
+
+            Set Cache Directory    ${OUTPUT_DIR}${/}pdf-cache
+            ${text}=    Get Text From PDF    invoice.pdf
+        """
+        self.cache_directory = Path(cache_dir) if cache_dir else None
+
     def get_output_directory(self) -> str:
         """Get output directory where target files are saved to.
 
@@ -536,8 +297,7 @@ class PDF(FPDF, HTMLMixin):
         self.active_pdf = str(source_pdf)
         self.active_fileobject = open(source_pdf, "rb")
         self.active_fields = None
-        self.fileobjects[source_pdf] = self.active_fileobject
-        self.rpa_pdf_document = None
+        self.fileobjects[str(source_pdf)] = self.active_fileobject
 
     def switch_to_pdf_document(self, source_pdf: str = None) -> None:
         """Switch library's current fileobject to already open file
@@ -554,13 +314,31 @@ class PDF(FPDF, HTMLMixin):
             raise ValueError("No PDF is open")
         if (
             source_pdf is not None
-            and self.active_fileobject != self.fileobjects[source_pdf]
+            and self.active_fileobject != self.fileobjects[str(source_pdf)]
         ):
             self.logger.debug("Switching to another open document")
             self.active_pdf = str(source_pdf)
             self.active_fileobject = self.fileobjects[str(source_pdf)]
             self.active_fields = None
-            self.rpa_pdf_document = None
+
+    def _get_reader(self) -> PdfFileReader:
+        # One reader is kept for each open document, so that the
+        # cross-reference table is read only once
+        reader = self.readers.get(self.active_pdf)
+        if reader is None:
+            reader = PyPDF2.PdfFileReader(self.active_fileobject)
+            self.readers[self.active_pdf] = reader
+        return reader
+
+    def _invalidate_document(self, source_pdf: str) -> None:
+        # Drop the reader and the parsed pages of an open document,
+        # after its pages were modified or the file was written over
+        path = Path(source_pdf).resolve()
+        for filename in list(self.fileobjects):
+            if Path(filename).resolve() != path:
+                continue
+            self.parsers.pop(filename, None)
+            self.readers.pop(filename, None)
 
     def add_pages(self, pages: int = 1) -> None:
         """Adds pages into PDF documents.
@@ -581,12 +359,12 @@ class PDF(FPDF, HTMLMixin):
             to `output_directory`
         """
         self.switch_to_pdf_document(source_pdf)
-        reader = PyPDF2.PdfFileReader(self.active_fileobject)
+        reader = self._get_reader()
         source_page = reader.getPage(0)
 
         writer = PyPDF2.PdfFileWriter()
         output_filepath = Path(self.output_directory / target_pdf)
-        pageobject = PyPDF2.pdf.PageObject.createBlankPage(
+        pageobject = PageObject.createBlankPage(
             None, source_page.mediaBox.getWidth(), source_page.mediaBox.getHeight()
         )
         writer.appendPagesFromReader(reader)
@@ -594,6 +372,7 @@ class PDF(FPDF, HTMLMixin):
             writer.addPage(pageobject)
         with open(output_filepath, "wb") as f:
             writer.write(f)
+        self._invalidate_document(output_filepath)
 
     def template_html_to_pdf(
         self,
@@ -662,7 +441,9 @@ class PDF(FPDF, HTMLMixin):
         pdf_content = self.output(dest="S").encode("latin-1")
         with open(output_path, "wb") as outfile:
             outfile.write(pdf_content)
-        self.__init__()
+        # Reset only the document generation state, not the opened documents
+        # or the library settings
+        FPDF.__init__(self)
 
     def get_info(self, source_pdf: str = None) -> dict:
         """Get information from PDF document.
@@ -671,13 +452,11 @@ class PDF(FPDF, HTMLMixin):
         :return: dictionary of PDF information
         """
         self.switch_to_pdf_document(source_pdf)
-        pdf = PyPDF2.PdfFileReader(self.active_fileobject)
+        pdf = self._get_reader()
         docinfo = pdf.getDocumentInfo()
-        parser = PDFParser(self.active_fileobject)
-        document = PDFDocument(parser)
         fields = None
         try:
-            fields = resolve1(document.catalog["AcroForm"])["Fields"]
+            fields = pdf.trailer["/Root"]["/AcroForm"]["/Fields"]
         except KeyError:
             pass
         info = {
@@ -687,7 +466,7 @@ class PDF(FPDF, HTMLMixin):
             "Subject": docinfo.subject,
             "Title": docinfo.title,
             "Pages": pdf.getNumPages(),
-            "Encrypted": self.is_pdf_encrypted(source_pdf),
+            "Encrypted": pdf.isEncrypted,
             "Fields": bool(fields),
         }
         return info
@@ -706,7 +485,7 @@ class PDF(FPDF, HTMLMixin):
         Page numbers starting from 1.
         """
         self.switch_to_pdf_document(source_pdf)
-        reader = PyPDF2.PdfFileReader(self.active_fileobject)
+        reader = self._get_reader()
         writer = PyPDF2.PdfFileWriter()
         output_filepath = Path(self.output_directory / target_pdf)
         if pages and not isinstance(pages, list):
@@ -718,35 +497,79 @@ class PDF(FPDF, HTMLMixin):
             writer.addPage(reader.getPage(int(pagenum) - 1))
         with open(str(output_filepath), "wb") as f:
             writer.write(f)
+        self._invalidate_document(output_filepath)
 
     def get_text_from_pdf(
-        self, source_pdf: str = None, pages: Any = None, details: bool = False
+        self,
+        source_pdf: str = None,
+        pages: Any = None,
+        details: bool = False,
+        workers: int = None,
     ) -> dict:
         """Get text from set of pages in source PDF document.
 
         :param source_pdf: filepath to the source pdf
-        :param pages: page numbers to get text (numbers start from 0)
+        :param pages: page numbers to get text (numbers start from 1),
+            defaults to all pages
         :param details: set to `True` to return textboxes, default `False`
+        :param workers: number of processes used for parsing the pages,
+            by default pages are parsed in the current process
         :return: dictionary of pages and their texts
 
-        PDF needs to be parsed before text can be read.
+        Only the requested pages are parsed, if they have not been parsed
+        already.
         """
         self.switch_to_pdf_document(source_pdf)
-        if self.rpa_pdf_document is None:
-            self.parse_pdf()
-        if pages and not isinstance(pages, list):
-            pages = pages.split(",")
-        if pages is not None:
-            pages = list(map(int, pages))
-        pdf_text = {}
-        for idx, page in self.rpa_pdf_document.get_pages().items():
-            pdf_text[idx] = [] if details else ""
-            for _, item in page.get_textboxes().items():
-                if details:
-                    pdf_text[idx].append(item)
-                else:
-                    pdf_text[idx] += item.text
-        return pdf_text
+        parser = self._get_parser()
+        pages = self._get_page_numbers(pages)
+        if pages is None:
+            pages = range(1, parser.get_number_of_pages() + 1)
+        self._parse_pages(pages, workers)
+        return {idx: get_page_text(parser.parse_page(idx), details) for idx in pages}
+
+    def get_text_from_pdfs(
+        self,
+        sources: Any,
+        pages: Any = None,
+        details: bool = False,
+        workers: int = None,
+    ) -> dict:
+        """Get text from multiple PDF documents, parsed in parallel processes.
+
+        :param sources: list of filepaths or a glob pattern, e.g. ``invoices/*.pdf``
+        :param pages: page numbers to get text (numbers start from 1),
+            defaults to all pages
+        :param details: set to `True` to return textboxes, default `False`
+        :param workers: number of processes, defaults to number of CPUs
+        :return: dictionary of filepaths and their pages and texts
+
+        The documents are not opened in the library, and the currently
+        active document is not changed.
+
+        Example:
+
+        .. code-block:: robotframework
+
+            ${documents}=    Get Text From PDFs    invoices/*.pdf
+            FOR    ${path}    IN    @{documents}
+                Log    ${documents}[${path}][${1}]
+            END
+        """
+        if isinstance(sources, (str, Path)):
+            sources = sorted(glob.glob(str(sources)))
+        sources = [str(source) for source in sources]
+        pages = self._get_page_numbers(pages)
+
+        texts = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                parse_pdf_pages, sources, repeat(pages), repeat(self.cache_directory)
+            )
+            for source, parsed in zip(sources, results):
+                texts[source] = {
+                    page.pageid: get_page_text(page, details) for page in parsed
+                }
+        return texts
 
     def page_rotate(
         self,
@@ -766,7 +589,7 @@ class PDF(FPDF, HTMLMixin):
         :param angle: number of degrees to rotate, default 90
         """
         self.switch_to_pdf_document(source_pdf)
-        reader = PyPDF2.PdfFileReader(self.active_fileobject)
+        reader = self._get_reader()
         output_filepath = Path(self.output_directory / target_pdf)
         writer = PyPDF2.PdfFileWriter()
 
@@ -786,6 +609,9 @@ class PDF(FPDF, HTMLMixin):
             writer.addPage(source_page)
         with open(str(output_filepath), "wb") as f:
             writer.write(f)
+        # Rotating changes the pages of the shared reader
+        self.readers.pop(self.active_pdf, None)
+        self._invalidate_document(output_filepath)
 
     def is_pdf_encrypted(self, source_pdf: str = None) -> bool:
         """Check if PDF is encrypted.
@@ -796,8 +622,7 @@ class PDF(FPDF, HTMLMixin):
         :return: True if file is encrypted
         """
         self.switch_to_pdf_document(source_pdf)
-        reader = PyPDF2.PdfFileReader(self.active_fileobject)
-        return reader.isEncrypted
+        return self._get_reader().isEncrypted
 
     def pdf_encrypt(
         self,
@@ -819,7 +644,7 @@ class PDF(FPDF, HTMLMixin):
             encryption is used, default True
         """
         self.switch_to_pdf_document(source_pdf)
-        reader = PyPDF2.PdfFileReader(self.active_fileobject)
+        reader = self._get_reader()
         output_filepath = Path(self.output_directory / target_pdf)
         if owner_pwd is None:
             owner_pwd = user_pwd
@@ -828,6 +653,7 @@ class PDF(FPDF, HTMLMixin):
         writer.encrypt(user_pwd, owner_pwd, use_128bit)
         with open(str(output_filepath), "wb") as f:
             writer.write(f)
+        self._invalidate_document(output_filepath)
 
     def pdf_decrypt(
         self, source_pdf: str = None, target_pdf: str = None, password: str = None
@@ -878,32 +704,74 @@ class PDF(FPDF, HTMLMixin):
         :raises PdfReadError: if file is encrypted or other restrictions are in place
         """
         self.switch_to_pdf_document(source_pdf)
-        reader = PyPDF2.PdfFileReader(self.active_fileobject)
-        return reader.getNumPages()
+        return self._get_reader().getNumPages()
 
-    def parse_pdf(self, source_pdf: str = None) -> None:
+    def parse_pdf(
+        self, source_pdf: str = None, pages: Any = None, workers: int = None
+    ) -> None:
         """Parse source PDF into entities which can be
         used for text searches for example.
 
         :param source_pdf: source
+        :param pages: page numbers to parse (numbers start from 1),
+            defaults to all pages
+        :param workers: number of processes used for parsing the pages,
+            by default pages are parsed in the current process
+
+        Parsed pages are kept in memory while the document is active,
+        and each page is parsed only once.
         """
         if source_pdf is not None:
             self.switch_to_pdf_document(source_pdf)
-        source_parser = PDFParser(self.active_fileobject)
-        source_document = PDFDocument(source_parser)
-        source_pages = PDFPage.create_pages(source_document)
-        rsrcmgr = PDFResourceManager()
-        laparams = LAParams(
-            detect_vertical=True,
-            all_texts=True,
+        self._parse_pages(self._get_page_numbers(pages), workers)
+
+    def _parse_pages(self, pages: Iterable = None, workers: int = None) -> None:
+        parser = self._get_parser()
+        if pages is None:
+            pages = range(1, parser.get_number_of_pages() + 1)
+        missing = [pagenum for pagenum in pages if not parser.has_page(pagenum)]
+        workers = min(int(workers or 1), len(missing))
+        if workers <= 1:
+            parser.parse_pages(missing)
+            return
+
+        # Each process parses a continuous range of pages
+        size = math.ceil(len(missing) / workers)
+        chunks = [missing[i : i + size] for i in range(0, len(missing), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(parse_pdf_pages, repeat(self.active_pdf), chunks)
+            for parsed in results:
+                for page in parsed:
+                    parser.add_page(page)
+
+    def _create_parser(self, outfp: Any = None) -> RpaPdfParser:
+        if self.active_fileobject is None:
+            raise ValueError("No PDF is open")
+        laparams = LAParams(**DEFAULT_LAPARAMS)
+        # Cached pages can't be used for the XML dump
+        cache_dir = self.cache_directory if outfp is None else None
+        return RpaPdfParser(
+            self.active_fileobject, laparams=laparams, outfp=outfp, cache_dir=cache_dir
         )
-        device = RPAConverter(rsrcmgr, laparams=laparams)
-        interpreter = PDFPageInterpreter(rsrcmgr, device)
 
-        # # Look at all (nested) objects on each page
-        for _, page in enumerate(source_pages, 0):
-            interpreter.process_page(page)
-        self.rpa_pdf_document = device.close()
+    def _get_parser(self) -> RpaPdfParser:
+        # One parser is kept for each open document, so that switching
+        # between documents does not parse the same pages again
+        parser = self.parsers.get(self.active_pdf)
+        if parser is None:
+            parser = self._create_parser()
+            self.parsers[self.active_pdf] = parser
+        return parser
+
+    @staticmethod
+    def _get_page_numbers(pages: Any) -> list:
+        if not pages:
+            return None
+        if isinstance(pages, int):
+            pages = [pages]
+        elif isinstance(pages, str):
+            pages = pages.split(",")
+        return [int(page) for page in pages]
 
     def _set_need_appearances_writer(self, writer: PdfFileWriter):
         # See 12.7.2 and 7.7.2 for more information:
@@ -973,6 +841,7 @@ class PDF(FPDF, HTMLMixin):
             target_pdf = self.active_pdf
         with open(target_pdf, "wb") as f:
             writer.write(f)
+        self._invalidate_document(target_pdf)
 
     def get_input_fields(
         self, source_pdf: str = None, replace_none_value: bool = False
@@ -1037,21 +906,19 @@ class PDF(FPDF, HTMLMixin):
         self.active_fields = record_fields if record_fields else None
         return record_fields
 
-    def set_anchor_to_element(self, locator: str) -> bool:
+    def set_anchor_to_element(self, locator: str, pagenum: int = None) -> bool:
         """Sets anchor point in the document for further searches.
 
-        PDF needs to be parsed before elements can be found.
-
         :param locator: element to search for
+        :param pagenum: page number where the element is searched from,
+            defaults to all pages
         :return: True if element was found
         """
         self.logger.info("Set anchor to element: ('locator=%s')", locator)
-        if self.rpa_pdf_document is None:
-            self.parse_pdf()
         if locator.startswith("text:"):
             criteria = "text"
             _, locator = locator.split(":", 1)
-            match = self._find_matching_textbox(criteria, locator)
+            match = self._find_matching_textbox(criteria, locator, pagenum)
             if match:
                 self.anchor_element = match
                 return True
@@ -1079,24 +946,28 @@ class PDF(FPDF, HTMLMixin):
         else:
             # use "text" criteria by default
             criteria = "text"
-            match = self._find_matching_textbox(criteria, locator)
+            match = self._find_matching_textbox(criteria, locator, pagenum)
             if match:
                 self.anchor_element = match
                 return True
         self.anchor_element = None
         return False
 
-    def _find_matching_textbox(self, criteria: str, locator: str) -> str:
+    def _find_matching_textbox(
+        self, criteria: str, locator: str, pagenum: int = None
+    ) -> str:
         self.logger.info(
             "find_matching_textbox: ('criteria=%s', 'locator=%s')", criteria, locator
         )
+        parser = self._get_parser()
+        if pagenum is None:
+            pages = parser.parse_pages().get_pages().values()
+        else:
+            pages = [parser.parse_page(int(pagenum))]
         matches = []
-        for _, page in self.rpa_pdf_document.get_pages().items():
-            content = page.get_textboxes()
-            for _, item in content.items():
-                # Only text matching at the moment
-                if item.text.lower() == locator.lower():
-                    matches.append(item)
+        for page in pages:
+            # Only text matching at the moment
+            matches.extend(page.get_textbox_index().find_by_text(locator))
         match_count = len(matches)
         if match_count == 1:
             self.logger.debug("Found 1 match for locator '%s'", locator)
@@ -1120,7 +991,8 @@ class PDF(FPDF, HTMLMixin):
     ) -> str:
         """Get closest text (value) to anchor element.
 
-        PDF needs to be parsed before elements can be found.
+        Only the page given with `pagenum` is parsed, if it has
+        not been parsed already.
 
         :param locator: element to set anchor to
         :param pagenum: page number where search if performed on, default 1 (first)
@@ -1139,12 +1011,12 @@ class PDF(FPDF, HTMLMixin):
             direction,
             regexp,
         )
-        self.set_anchor_to_element(locator)
+        self.set_anchor_to_element(locator, pagenum)
         possibles = []
         if self.anchor_element:
             self.logger.debug("we have anchor: %s", self.anchor_element.bbox)
-            page = self.rpa_pdf_document.get_page(int(pagenum))
-            for _, item in page.get_textboxes().items():
+            page = self._get_parser().parse_page(int(pagenum))
+            for item in self._get_anchor_candidates(page, direction):
                 possible = None
                 # Skip anchor element from matching
                 if item.boxid == self.anchor_element.boxid:
@@ -1166,13 +1038,29 @@ class PDF(FPDF, HTMLMixin):
         self.logger.info("NO ANCHOR")
         return possibles
 
+    def _get_anchor_candidates(self, page, direction):
+        # Narrow down textboxes with the page index, the exact
+        # matching is still done by the direction specific checks
+        index = page.get_textbox_index()
+        _, bottom, _, top = self.anchor_element.bbox
+        if direction in ["left", "right"]:
+            low = max(top - self.PIXEL_TOLERANCE, 0)
+            return index.find_by_top(low, top + self.PIXEL_TOLERANCE)
+        elif direction in ["bottom", "down"]:
+            return index.find_by_top(high=bottom)
+        elif direction in ["top", "up"]:
+            return index.find_by_bottom(low=top)
+        elif direction == "box":
+            return index.find_by_bottom(bottom, top)
+        return []
+
     def _is_within_tolerance(self, base, target):
         max_target = target + self.PIXEL_TOLERANCE
         min_target = max(target - self.PIXEL_TOLERANCE, 0)
         return min_target <= base <= max_target
 
     def _is_match_on_horizontal(self, direction, item, regexp):
-        (left, _, right, top) = self.anchor_element.bbox
+        left, _, right, top = self.anchor_element.bbox
         match = False
         direction_ok = False
         if (
@@ -1194,7 +1082,7 @@ class PDF(FPDF, HTMLMixin):
         return item if match else None
 
     def _is_match_on_vertical(self, direction, item, strict, regexp):
-        (left, bottom, right, top) = self.anchor_element.bbox
+        left, bottom, right, top = self.anchor_element.bbox
         text = None
         direction_down = direction in ["bottom", "down"]
         direction_up = direction in ["top", "up"]
@@ -1218,7 +1106,7 @@ class PDF(FPDF, HTMLMixin):
         return None
 
     def _is_match_in_box(self, item):
-        (left, bottom, right, top) = self.anchor_element.bbox
+        left, bottom, right, top = self.anchor_element.bbox
         if (
             left <= item.left
             and right >= item.right
@@ -1231,7 +1119,7 @@ class PDF(FPDF, HTMLMixin):
     def _get_closest_from_possibles(self, direction, possibles):
         distance = 500000
         closest = None
-        (_, bottom, right, top) = self.anchor_element.bbox
+        _, bottom, right, top = self.anchor_element.bbox
         direction_down = direction in ["bottom", "down"]
         for p in possibles:
             if direction_down:
@@ -1310,13 +1198,16 @@ class PDF(FPDF, HTMLMixin):
 
         :param text: this text will be replaced
         :param replace: used to replace `text`
+
+        Pages are parsed one at a time until the text is found.
         """
-        if self.rpa_pdf_document is None:
-            self.parse_pdf()
-        for _, page in self.rpa_pdf_document.get_pages().items():
+        parser = self._get_parser()
+        for pagenum in range(1, parser.get_number_of_pages() + 1):
+            page = parser.parse_page(pagenum)
             for _, textbox in page.get_textboxes().items():
                 if textbox.text == text:
                     textbox.text = replace
+                    page.textbox_index = None
                     return
         self.logger.info("Did not find any matching text")
 
@@ -1339,12 +1230,24 @@ class PDF(FPDF, HTMLMixin):
             source = self.active_pdf
         elif source is None and self.active_pdf is None:
             raise ValueError("No source PDF exists")
-        temp_pdf = os.path.join(tempfile.gettempdir(), "temp.pdf")
         writer = PdfFileWriter()
+        reader = PdfFileReader(str(source))
+        watermark = self._create_image_page(
+            imagefile, reader.getPage(0).mediaBox, coverage
+        )
+        for n in range(reader.getNumPages()):
+            page = reader.getPage(n)
+            page.mergePage(watermark)
+            writer.addPage(page)
+
+        with open(target, "wb") as f:
+            writer.write(f)
+        self._invalidate_document(target)
+
+    def _create_image_page(self, imagefile, mediabox, coverage):
+        imagefile = str(imagefile)
         pdf = FPDF()
         pdf.add_page()
-        reader = PdfFileReader(source)
-        mediabox = reader.getPage(0).mediaBox
         im = Image.open(imagefile)
         width, height = im.size
         max_width = int(float(mediabox.getWidth()) * coverage)
@@ -1357,17 +1260,143 @@ class PDF(FPDF, HTMLMixin):
             width = int(coverage * width)
 
         pdf.image(name=imagefile, x=40, y=60, w=width, h=height)
-        pdf.output(name=temp_pdf, dest="F")
+        # The image page is kept in memory instead of a temporary file
+        content = pdf.output(dest="S").encode("latin-1")
+        return PdfFileReader(io.BytesIO(content)).getPage(0)
 
-        img = PdfFileReader(temp_pdf)
-        watermark = img.getPage(0)
-        for n in range(reader.getNumPages()):
-            page = reader.getPage(n)
-            page.mergePage(watermark)
-            writer.addPage(page)
+    def start_page_operations(self, source_pdf: str = None) -> None:
+        """Start collecting page operations for a PDF document.
 
-        with open(target, "wb") as f:
-            writer.write(f)
+        :param source_pdf: filepath to the source pdf
+
+        The operations are not done until keyword ``Write Page Operations``
+        is called, which writes the result in one pass. Page numbers given
+        to the operations refer to the pages of the result so far, so the
+        operations work as if they were done one after another.
+
+        Example:
+
+        .. code-block:: robotframework
+
+            Start Page Operations    invoice.pdf
+            Select Pages             3,1,2
+            Rotate Pages             1    angle=180
+            Append PDF Pages         attachment.pdf
+            Overlay Image On Pages   stamp.png
+            Encrypt Pages            secret
+            Write Page Operations    processed.pdf
+        """
+        self.switch_to_pdf_document(source_pdf)
+        if self.page_pipeline is not None:
+            self.page_pipeline.close()
+        self.page_pipeline = PagePipeline(self._get_reader())
+
+    def _get_page_pipeline(self) -> PagePipeline:
+        if self.page_pipeline is None:
+            raise ValueError("Page operations have not been started")
+        return self.page_pipeline
+
+    def select_pages(self, pages: Any) -> None:
+        """Select pages and their order for the result of page operations.
+
+        :param pages: page numbers in the new order (numbers start from 1),
+            the same page can be given more than once
+        """
+        pipeline = self._get_page_pipeline()
+        # Each selected page is a separate copy, so that later operations
+        # on a repeated page do not change its other copies
+        selected = pipeline.get_pages(self._get_page_numbers(pages))
+        pipeline.pages = [page.copy() for page in selected]
+
+    def rotate_pages(
+        self, pages: Any = None, clockwise: bool = True, angle: int = 90
+    ) -> None:
+        """Rotate pages in page operations.
+
+        :param pages: page numbers to rotate (numbers start from 1),
+            defaults to all pages
+        :param clockwise: directorion that page will be rotated to, default True
+        :param angle: number of degrees to rotate, multiple of 90, default 90
+        """
+        angle = int(angle)
+        if angle % 90:
+            raise ValueError("Rotation angle must be a multiple of 90")
+        pipeline = self._get_page_pipeline()
+        for page in pipeline.get_pages(self._get_page_numbers(pages)):
+            page.rotate += angle if clockwise else -angle
+
+    def overlay_image_on_pages(
+        self, imagefile: str, pages: Any = None, coverage: float = 0.2
+    ) -> None:
+        """Add image on top of pages in page operations.
+
+        :param imagefile: filepath to image file
+        :param pages: page numbers to add the image on (numbers start from 1),
+            defaults to all pages
+        :param coverage: maximum portion of the first page covered
+            by the image, defaults to 0.2
+        """
+        pipeline = self._get_page_pipeline()
+        targets = pipeline.get_pages(self._get_page_numbers(pages))
+        if not targets:
+            return
+        first = targets[0].reader.getPage(targets[0].index)
+        overlay = self._create_image_page(imagefile, first.mediaBox, float(coverage))
+        for page in targets:
+            page.overlays.append(overlay)
+
+    def append_pdf_pages(self, source_pdf: str, pages: Any = None) -> None:
+        """Append pages from another PDF document in page operations.
+
+        :param source_pdf: filepath to the PDF to append
+        :param pages: page numbers to append (numbers start from 1),
+            defaults to all pages
+        """
+        pipeline = self._get_page_pipeline()
+        fileobject = pipeline.exit_stack.enter_context(open(source_pdf, "rb"))
+        reader = PyPDF2.PdfFileReader(fileobject)
+        pages = self._get_page_numbers(pages)
+        if pages is None:
+            pages = range(1, reader.getNumPages() + 1)
+        for pagenum in pages:
+            if not 1 <= pagenum <= reader.getNumPages():
+                raise ValueError(f"Page {pagenum} does not exist in {source_pdf}")
+            pipeline.pages.append(PipelinePage(reader, pagenum - 1))
+
+    def encrypt_pages(
+        self, user_pwd: str = "", owner_pwd: str = None, use_128bit: bool = True
+    ) -> None:
+        """Encrypt the result of page operations.
+
+        :param user_pwd: allows opening and reading PDF with restrictions
+        :param owner_pwd: allows opening PDF without any restrictions, by
+            default same `user_pwd`
+        :param use_128bit: whether to 128bit encryption, when false 40bit
+            encryption is used, default True
+        """
+        if owner_pwd is None:
+            owner_pwd = user_pwd
+        self._get_page_pipeline().encryption = (user_pwd, owner_pwd, use_128bit)
+
+    def write_page_operations(self, target_pdf: str = None) -> None:
+        """Write the result of page operations into a PDF document.
+
+        :param target_pdf: filename to the target pdf, stored by default
+            to `output_directory`
+
+        Source documents are read only once and the target is written once,
+        no matter how many operations were collected.
+        """
+        required_param(target_pdf, "write_page_operations")
+        pipeline = self._get_page_pipeline()
+        output_filepath = Path(self.output_directory / target_pdf)
+        try:
+            with open(str(output_filepath), "wb") as f:
+                pipeline.write(f)
+        finally:
+            pipeline.close()
+            self.page_pipeline = None
+        self._invalidate_document(output_filepath)
 
     def save_pdf(
         self, source: str = None, target: str = None, use_modified_reader: bool = False
@@ -1406,6 +1435,7 @@ class PDF(FPDF, HTMLMixin):
                 target = self.active_pdf
             with open(target, "wb") as f:
                 writer.write(f)
+            self._invalidate_document(target)
 
     def dump_pdf_as_xml(self, source_pdf: str = None):
         """Get PDFMiner format XML dump of the PDF
@@ -1414,6 +1444,12 @@ class PDF(FPDF, HTMLMixin):
         :return: XML content
         """
         self.switch_to_pdf_document(source_pdf)
-        if self.rpa_pdf_document is None:
-            self.parse_pdf()
-        return self.rpa_pdf_document.dump_xml()
+        # XML is only generated for the dump, always from a complete parse
+        # because pages parsed on demand can be in any order
+        xml = io.BytesIO()
+        parser = self._create_parser(outfp=xml)
+        parser.parse_pages()
+        parser.device.close()
+        if self.rpa_pdf_parser is None:
+            self.parsers[self.active_pdf] = parser
+        return xml.getvalue().decode("utf-8")
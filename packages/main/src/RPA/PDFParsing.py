@@ -0,0 +1,667 @@
+from bisect import bisect_left, bisect_right
+import collections
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import tempfile
+from typing import Any, Callable, Iterable
+
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdfpage import PDFPage
+
+from pdfminer.layout import (
+    LAParams,
+    LTPage,
+    LTText,
+    LTTextBox,
+    LTLine,
+    LTRect,
+    LTCurve,
+    LTFigure,
+    LTTextLine,
+    LTTextBoxVertical,
+    LTChar,
+    LTImage,
+    LTTextGroup,
+)
+
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer.utils import enc, bbox2str
+from pdfminer.converter import PDFConverter, PDFLayoutAnalyzer
+
+
+def iterable_items_to_int(bbox):
+    if bbox is None:
+        return list()
+    return list(map(int, bbox))
+
+
+logging.getLogger("pdfminer").setLevel(logging.WARNING)
+
+DEFAULT_LAPARAMS = {"detect_vertical": True, "all_texts": True}
+
+
+class TargetObject:
+    """Container for Target text box"""
+
+    boxid: int
+    bbox: tuple
+    text: str
+
+
+class RpaFigure:
+    """Class for each LTFigure element in the PDF"""
+
+    figure_name: str
+    figure_bbox: list
+    item: dict
+    image_name: str
+
+    def __init__(self, name: str, bbox: Iterable) -> None:
+        self.figure_name = name
+        self.figure_bbox = iterable_items_to_int(bbox)
+        self.image_name = None
+        self.item = None
+
+    def set_item(self, item: Any):
+        # LTFigure or LTImage, only the details are kept so that
+        # the figure can be passed between processes
+        self.item = {
+            "bbox": iterable_items_to_int(item.bbox),
+            "width": item.width,
+            "height": item.height,
+        }
+
+    def details(self):
+        return '<image src="%s" width="%d" height="%d" />' % (
+            self.image_name,
+            self.item["width"],
+            self.item["height"],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "figure",
+            "name": self.figure_name,
+            "bbox": self.figure_bbox,
+            "item": self.item,
+            "image_name": self.image_name,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RpaFigure":
+        figure = cls(data["name"], data["bbox"])
+        figure.item = data["item"]
+        figure.image_name = data["image_name"]
+        return figure
+
+
+class RpaPdfPage:
+    """Class for each PDF page"""
+
+    bbox: list
+    content: OrderedDict
+    content_id: int
+    pageid: str
+    rotate: int
+
+    def __init__(self, pageid: int, bbox: Iterable, rotate: int) -> None:
+        self.pageid = pageid
+        self.bbox = iterable_items_to_int(bbox)
+        self.rotate = rotate
+        self.content = collections.OrderedDict()
+        self.content_id = 0
+        self.textbox_index = None
+
+    def add_content(self, content: Any) -> None:
+        self.content[self.content_id] = content
+        self.content_id += 1
+        self.textbox_index = None
+
+    def get_textbox_index(self) -> "TextBoxIndex":
+        if self.textbox_index is None:
+            self.textbox_index = TextBoxIndex(self.get_textboxes().values())
+        return self.textbox_index
+
+    def get_content(self) -> OrderedDict:
+        return self.content
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.pageid,
+            "bbox": self.bbox,
+            "rotate": self.rotate,
+            "content": [content.to_dict() for content in self.content.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RpaPdfPage":
+        page = cls(data["id"], data["bbox"], data["rotate"])
+        types = {"figure": RpaFigure, "textbox": RpaTextBox}
+        for content in data["content"]:
+            page.add_content(types[content["type"]].from_dict(content))
+        return page
+
+    def get_figures(self) -> OrderedDict:
+        return {k: v for k, v in self.content.items() if isinstance(v, RpaFigure)}
+
+    def get_textboxes(self) -> OrderedDict:
+        return {k: v for k, v in self.content.items() if isinstance(v, RpaTextBox)}
+
+    def __str__(self) -> str:
+        page_as_str = '<page id="%s" bbox="%s" rotate="%d">\n' % (
+            self.pageid,
+            bbox2str(self.bbox),
+            self.rotate,
+        )
+        for _, c in self.content.items():
+            page_as_str += f"{c}\n"
+        return page_as_str
+
+
+class RpaTextBox:
+    """Class for each LTTextBox element in the PDF"""
+
+    item: dict
+    textbox_bbox: list
+    textbox_id: int
+    textbox_wmode: str
+
+    def __init__(self, boxid: int, bbox: Iterable, wmode: str) -> None:
+        self.textbox_id = boxid
+        self.textbox_bbox = iterable_items_to_int(bbox)
+        self.textbox_wmode = wmode
+
+    def set_item(self, item: Any):
+        self.item = {
+            "bbox": iterable_items_to_int(item.bbox),
+            "text": item.get_text().strip(),
+        }
+
+    @property
+    def left(self) -> Any:
+        return self.bbox[0] if (self.bbox and len(self.bbox) == 4) else None
+
+    @property
+    def bottom(self) -> Any:
+        return self.bbox[1] if (self.bbox and len(self.bbox) == 4) else None
+
+    @property
+    def right(self) -> Any:
+        return self.bbox[2] if (self.bbox and len(self.bbox) == 4) else None
+
+    @property
+    def top(self) -> Any:
+        return self.bbox[3] if (self.bbox and len(self.bbox) == 4) else None
+
+    @property
+    def boxid(self) -> int:
+        return self.textbox_id
+
+    @property
+    def text(self) -> str:
+        return self.item["text"]
+
+    @text.setter
+    def text(self, newtext):
+        self.item["text"] = newtext
+
+    @property
+    def bbox(self) -> list:
+        return self.item["bbox"]
+
+    def __str__(self) -> str:
+        return self.text
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "textbox",
+            "id": self.textbox_id,
+            "bbox": self.textbox_bbox,
+            "wmode": self.textbox_wmode,
+            "item": self.item,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RpaTextBox":
+        box = cls(data["id"], data["bbox"], data["wmode"])
+        box.item = data["item"]
+        return box
+
+
+class TextBoxIndex:
+    """Index of page textboxes by their text and coordinates"""
+
+    def __init__(self, textboxes: Iterable) -> None:
+        self.textboxes = list(textboxes)
+        self.texts = {}
+        for position, item in enumerate(self.textboxes):
+            self.texts.setdefault(item.text.lower(), []).append(position)
+        self.tops = self._sort_by(lambda item: item.top)
+        self.bottoms = self._sort_by(lambda item: item.bottom)
+
+    def _sort_by(self, key: Callable) -> tuple:
+        order = sorted(range(len(self.textboxes)), key=lambda i: key(self.textboxes[i]))
+        return [key(self.textboxes[i]) for i in order], order
+
+    def _items(self, positions: Iterable) -> list:
+        # Results are always in the same order as on the page
+        return [self.textboxes[position] for position in sorted(positions)]
+
+    def _between(self, index: tuple, low: Any = None, high: Any = None) -> list:
+        values, order = index
+        start = 0 if low is None else bisect_left(values, low)
+        end = len(values) if high is None else bisect_right(values, high)
+        return self._items(order[start:end])
+
+    def find_by_text(self, text: str) -> list:
+        return self._items(self.texts.get(text.lower(), []))
+
+    def find_by_top(self, low: Any = None, high: Any = None) -> list:
+        return self._between(self.tops, low, high)
+
+    def find_by_bottom(self, low: Any = None, high: Any = None) -> list:
+        return self._between(self.bottoms, low, high)
+
+
+class RpaPdfDocument:
+    """Class for parsed PDF document"""
+
+    encoding: str = "utf-8"
+    pages: OrderedDict
+
+    def __init__(self) -> None:
+        self.pages = collections.OrderedDict()
+
+    def add_page(self, page: RpaPdfPage) -> None:
+        self.pages[page.pageid] = page
+
+    def has_page(self, pagenum: int) -> bool:
+        return pagenum in self.pages
+
+    def get_pages(self) -> OrderedDict:
+        # Pages can be parsed in any order, but are always returned in page order
+        return collections.OrderedDict(sorted(self.pages.items()))
+
+    def get_page(self, pagenum: int) -> RpaPdfPage:
+        return self.pages[pagenum]
+
+
+class RPAConverter(PDFConverter):
+    """Class for converting PDF into RPA classes
+
+    PDFMiner format XML is written only if a binary output stream `outfp`
+    is given, e.g. a file or a buffer.
+    """
+
+    CONTROL = re.compile("[\x00-\x08\x0b-\x0c\x0e-\x1f]")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        rsrcmgr,
+        outfp=None,
+        codec="utf-8",
+        pageno=1,
+        laparams=None,
+        imagewriter=None,
+        stripcontrol=False,
+    ):
+        # PDFConverter expects a writable stream, which is optional here
+        PDFLayoutAnalyzer.__init__(  # pylint: disable=non-parent-init-called
+            self, rsrcmgr, pageno=pageno, laparams=laparams
+        )
+        self.outfp = outfp
+        self.codec = codec
+        self.rpa_pdf_document = RpaPdfDocument()
+        self.figure = None
+        self.current_page = None
+        self.imagewriter = imagewriter
+        self.stripcontrol = stripcontrol
+        if self.outfp is not None:
+            self.write_header()
+
+    def write(self, text):
+        if self.codec:
+            text = text.encode(self.codec)
+        self.outfp.write(text)
+
+    def write_header(self):
+        if self.codec:
+            self.write('<?xml version="1.0" encoding="%s" ?>\n' % self.codec)
+        else:
+            self.write('<?xml version="1.0" ?>\n')
+        self.write("<pages>\n")
+
+    def write_footer(self):
+        self.write("</pages>\n")
+
+    def write_text(self, text):
+        if self.stripcontrol:
+            text = self.CONTROL.sub("", text)
+        self.write(enc(text))
+
+    def receive_layout(self, ltpage):  # noqa: C901
+        def render(item):
+            if isinstance(item, LTPage):
+                self.current_page = RpaPdfPage(item.pageid, item.bbox, item.rotate)
+                for child in item:
+                    render(child)
+                self.rpa_pdf_document.add_page(self.current_page)
+            elif isinstance(item, LTFigure):
+                self.figure = RpaFigure(item.name, item.bbox)
+                self.figure.set_item(item)
+                for child in item:
+                    render(child)
+                self.current_page.add_content(self.figure)
+                self.figure = None
+            elif isinstance(item, LTTextBox):
+                wmode = ""
+                if isinstance(item, LTTextBoxVertical):
+                    wmode = ' wmode="vertical"'
+                box = RpaTextBox(item.index, item.bbox, wmode)
+                box.set_item(item)
+                self.current_page.add_content(box)
+            elif isinstance(item, LTImage):
+                if self.figure:
+                    self.figure.set_item(item)
+
+        render(ltpage)
+        if self.outfp is not None:
+            self.write_layout(ltpage)
+
+    def write_layout(self, ltpage):  # noqa: C901 pylint: disable=R0915
+        def show_group(item):
+            if isinstance(item, LTTextBox):
+                self.write(
+                    '<textbox id="%d" bbox="%s" />\n'
+                    % (item.index, bbox2str(item.bbox))
+                )
+            elif isinstance(item, LTTextGroup):
+                self.write('<textgroup bbox="%s">\n' % bbox2str(item.bbox))
+                for child in item:
+                    show_group(child)
+                self.write("</textgroup>\n")
+
+        #  pylint: disable=R0912, R0915
+        def render(item):
+            if isinstance(item, LTPage):
+                s = '<page id="%s" bbox="%s" rotate="%d">\n' % (
+                    item.pageid,
+                    bbox2str(item.bbox),
+                    item.rotate,
+                )
+                self.write(s)
+                for child in item:
+                    render(child)
+                if item.groups is not None:
+                    self.write("<layout>\n")
+                    for group in item.groups:
+                        show_group(group)
+                    self.write("</layout>\n")
+                self.write("</page>\n")
+            elif isinstance(item, LTLine):
+                s = '<line linewidth="%d" bbox="%s" />\n' % (
+                    item.linewidth,
+                    bbox2str(item.bbox),
+                )
+                self.write(s)
+            elif isinstance(item, LTRect):
+                s = '<rect linewidth="%d" bbox="%s" />\n' % (
+                    item.linewidth,
+                    bbox2str(item.bbox),
+                )
+                self.write(s)
+            elif isinstance(item, LTCurve):
+                s = '<curve linewidth="%d" bbox="%s" pts="%s"/>\n' % (
+                    item.linewidth,
+                    bbox2str(item.bbox),
+                    item.get_pts(),
+                )
+                self.write(s)
+            elif isinstance(item, LTFigure):
+                s = '<figure name="%s" bbox="%s">\n' % (
+                    item.name,
+                    bbox2str(item.bbox),
+                )
+                self.write(s)
+                for child in item:
+                    render(child)
+                self.write("</figure>\n")
+            elif isinstance(item, LTTextLine):
+                self.write('<textline bbox="%s">\n' % bbox2str(item.bbox))
+                for child in item:
+                    render(child)
+                self.write("</textline>\n")
+            elif isinstance(item, LTTextBox):
+                wmode = ""
+                if isinstance(item, LTTextBoxVertical):
+                    wmode = ' wmode="vertical"'
+                s = '<textbox id="%d" bbox="%s"%s>\n' % (
+                    item.index,
+                    bbox2str(item.bbox),
+                    wmode,
+                )
+                self.write(s)
+                for child in item:
+                    render(child)
+                self.write("</textbox>\n")
+            elif isinstance(item, LTChar):
+                s = (
+                    '<text font="%s" bbox="%s" colourspace="%s" '
+                    'ncolour="%s" size="%.3f">'
+                    % (
+                        enc(item.fontname),
+                        bbox2str(item.bbox),
+                        item.ncs.name,
+                        item.graphicstate.ncolor,
+                        item.size,
+                    )
+                )
+                self.write(s)
+                self.write_text(item.get_text())
+                self.write("</text>\n")
+            elif isinstance(item, LTText):
+                self.write("<text>%s</text>\n" % item.get_text())
+            elif isinstance(item, LTImage):
+                if self.imagewriter is not None:
+                    name = self.imagewriter.export_image(item)
+                    self.write(
+                        '<image src="%s" width="%d" height="%d" />\n'
+                        % (enc(name), item.width, item.height)
+                    )
+                else:
+                    self.write(
+                        '<image width="%d" height="%d" />\n' % (item.width, item.height)
+                    )
+            else:
+                assert False, str(("Unhandled", item))
+
+        render(ltpage)
+
+    def close(self):
+        if self.outfp is not None:
+            self.write_footer()
+        return self.rpa_pdf_document
+
+
+class RpaPdfPageCache:
+    """Class for storing parsed PDF pages on disk
+
+    Pages are stored as JSON files into a directory named by the hash
+    of the file content and the layout analysis parameters, so a changed
+    file or different parameters never match the old pages.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: str, fileobject: Any, laparams: LAParams) -> None:
+        self.path = Path(directory) / self._get_key(fileobject, laparams)
+
+    def _get_key(self, fileobject: Any, laparams: LAParams) -> str:
+        digest = hashlib.sha256()
+        position = fileobject.tell()
+        fileobject.seek(0)
+        for chunk in iter(lambda: fileobject.read(1024 * 1024), b""):
+            digest.update(chunk)
+        fileobject.seek(position)
+        params = vars(laparams) if laparams is not None else None
+        digest.update(json.dumps([self.VERSION, params], sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _read(self, name: str) -> Any:
+        try:
+            with open(self.path / name, "r", encoding="utf-8") as infile:
+                return json.load(infile)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, name: str, data: Any) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Write through a temporary file so that parallel writers
+        # never leave a partially written file behind
+        fd, temp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with open(fd, "w", encoding="utf-8") as outfile:
+                json.dump(data, outfile, separators=(",", ":"))
+            os.replace(temp, self.path / name)
+        except Exception:
+            os.unlink(temp)
+            raise
+
+    def load_page_count(self) -> int:
+        try:
+            data = self._read("document.json")
+            return data["pages"] if data else None
+        except (ValueError, KeyError) as err:
+            logging.getLogger(__name__).warning(
+                "Ignoring invalid cached page count: %s", err
+            )
+            return None
+
+    def save_page_count(self, count: int) -> None:
+        self._write("document.json", {"pages": count})
+
+    def load(self, pagenum: int) -> RpaPdfPage:
+        try:
+            data = self._read(f"{pagenum}.json")
+            return RpaPdfPage.from_dict(data) if data else None
+        except (ValueError, KeyError) as err:
+            logging.getLogger(__name__).warning(
+                "Ignoring invalid cached page %d: %s", pagenum, err
+            )
+            return None
+
+    def save(self, page: RpaPdfPage) -> None:
+        self._write(f"{page.pageid}.json", page.to_dict())
+
+
+class RpaPdfParser:
+    """Class for parsing PDF pages into RPA classes on demand"""
+
+    def __init__(
+        self,
+        fileobject: Any,
+        laparams: LAParams = None,
+        outfp: Any = None,
+        cache_dir: str = None,
+    ) -> None:
+        self.fileobject = fileobject
+        # The source document is read only when pages need to be parsed
+        self.source_document = None
+        self.source_pages = None
+        self.loaded_pages = []
+        self.page_count = None
+        rsrcmgr = PDFResourceManager()
+        self.device = RPAConverter(rsrcmgr, outfp=outfp, laparams=laparams)
+        self.interpreter = PDFPageInterpreter(rsrcmgr, self.device)
+        self.cache = None
+        if cache_dir is not None:
+            self.cache = RpaPdfPageCache(cache_dir, fileobject, laparams)
+
+    @property
+    def rpa_pdf_document(self) -> RpaPdfDocument:
+        return self.device.rpa_pdf_document
+
+    def _load_pages(self, count: int = None) -> None:
+        # Walking the page tree is cheap compared to layout analysis,
+        # so page objects are collected only as far as needed
+        if self.source_pages is None:
+            self.source_document = PDFDocument(PDFParser(self.fileobject))
+            self.source_pages = PDFPage.create_pages(self.source_document)
+        while count is None or len(self.loaded_pages) < count:
+            try:
+                self.loaded_pages.append(next(self.source_pages))
+            except StopIteration:
+                break
+
+    def get_number_of_pages(self) -> int:
+        if self.page_count is None and self.cache is not None:
+            self.page_count = self.cache.load_page_count()
+        if self.page_count is None:
+            self._load_pages()
+            self.page_count = len(self.loaded_pages)
+            if self.cache is not None:
+                self.cache.save_page_count(self.page_count)
+        return self.page_count
+
+    def has_page(self, pagenum: int) -> bool:
+        """Check if page is already parsed, or can be loaded from the cache."""
+        if self.rpa_pdf_document.has_page(pagenum):
+            return True
+        page = self.cache.load(pagenum) if self.cache is not None else None
+        if page is None:
+            return False
+        self.rpa_pdf_document.add_page(page)
+        return True
+
+    def add_page(self, page: RpaPdfPage) -> None:
+        self.rpa_pdf_document.add_page(page)
+        if self.cache is not None:
+            self.cache.save(page)
+
+    def parse_page(self, pagenum: int) -> RpaPdfPage:
+        if not self.has_page(pagenum):
+            self._load_pages(pagenum)
+            if not 1 <= pagenum <= len(self.loaded_pages):
+                raise ValueError(f"Page {pagenum} does not exist in the document")
+            self.device.pageno = pagenum
+            self.interpreter.process_page(self.loaded_pages[pagenum - 1])
+            if self.cache is not None:
+                self.cache.save(self.rpa_pdf_document.get_page(pagenum))
+        return self.rpa_pdf_document.get_page(pagenum)
+
+    def parse_pages(self, pages: Iterable = None) -> RpaPdfDocument:
+        if pages is None:
+            pages = range(1, self.get_number_of_pages() + 1)
+        for pagenum in pages:
+            self.parse_page(pagenum)
+        return self.rpa_pdf_document
+
+
+def parse_pdf_pages(
+    source_pdf: str, pages: Iterable = None, cache_dir: str = None
+) -> list:
+    """Parse pages of a PDF file in a separate process.
+
+    :param source_pdf: filepath to the source pdf
+    :param pages: page numbers to parse, defaults to all pages
+    :param cache_dir: directory of cached pages, not used by default
+    :return: list of parsed pages
+    """
+    with open(source_pdf, "rb") as fileobject:
+        parser = RpaPdfParser(
+            fileobject, laparams=LAParams(**DEFAULT_LAPARAMS), cache_dir=cache_dir
+        )
+        return list(parser.parse_pages(pages).get_pages().values())
+
+
+def get_page_text(page: RpaPdfPage, details: bool = False) -> Any:
+    textboxes = page.get_textboxes().values()
+    if details:
+        return list(textboxes)
+    return "".join(item.text for item in textboxes)
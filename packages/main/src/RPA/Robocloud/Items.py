@@ -1,14 +1,19 @@
 import copy
 import fnmatch
+import io
 import json
 import logging
 import os
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from shutil import copy2
+from shutil import copy2, copyfile
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
 from robot.libraries.BuiltIn import BuiltIn
 
 from RPA.FileSystem import FileSystem
@@ -43,9 +48,83 @@ def is_json_equal(left, right):
     return json_dump_safe(left, sort_keys=True) == json_dump_safe(right, sort_keys=True)
 
 
+def format_header_param(name, value):
+    """Format parameter of multipart header, escaped as done by HTML5 forms."""
+    replace = {'"': "%22", "\\": "\\\\"}
+    replace.update({chr(cc): f"%{cc:02X}" for cc in range(0x20) if cc != 0x1B})
+    value = "".join(replace.get(char, char) for char in str(value))
+    return f'{name}="{value}"'
+
+
+class MultipartStream:
+    """Multipart form data request body, which reads the file part in chunks
+    while the request is sent. The total length is known beforehand,
+    so that the request does not need chunked transfer encoding.
+
+    :param fields:  Form fields before the file
+    :param name:    Filename of the file part
+    :param fileobj: File object to read content from
+    :param size:    Size of the file content
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, fields, name, fileobj, size):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = b""
+        for key, value in fields.items():
+            head += (
+                f"--{boundary}\r\n"
+                f"Content-Disposition: form-data; {format_header_param('name', key)}"
+                "\r\n\r\n"
+                f"{value}\r\n"
+            ).encode("utf-8")
+
+        head += (
+            f"--{boundary}\r\n"
+            "Content-Disposition: form-data; "
+            f"{format_header_param('name', 'file')}; "
+            f"{format_header_param('filename', name)}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+        self._length = len(head) + size + len(tail)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        chunk = self.read(self.CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = self.read(self.CHUNK_SIZE)
+
+    def read(self, size=-1):
+        """Read next `size` bytes of the body, or all remaining if negative."""
+        chunks = []
+        while self._parts and size != 0:
+            data = self._parts[0].read(size)
+            if not data:
+                self._parts.pop(0)
+                continue
+
+            chunks.append(data)
+            if size > 0:
+                size -= len(data)
+
+        return b"".join(chunks)
+
+
 class BaseAdapter(ABC):
     """Abstract base class for work item adapters."""
 
+    #: Maximum number of concurrent file transfers,
+    #: adapters which are not thread-safe should only use one
+    MAX_TRANSFERS = 1
+
     def __init__(self, workspace_id, item_id):
         self.workspace_id = workspace_id
         self.item_id = item_id
@@ -80,6 +159,20 @@ class BaseAdapter(ABC):
         """Remove attached file from work item."""
         raise NotImplementedError
 
+    def add_file_from_path(self, name, path):
+        """Attach file from local path to work item.
+        Adapters can override this to avoid reading the whole file to memory.
+        """
+        with open(path, "rb") as infile:
+            self.add_file(name, infile.read())
+
+    def get_file_to_path(self, name, path):
+        """Write file's contents from work item to local path.
+        Adapters can override this to avoid reading the whole file to memory.
+        """
+        with open(path, "wb") as outfile:
+            outfile.write(self.get_file(name))
+
 
 class RobocorpAdapter(BaseAdapter):
     """Adapter for saving/loading work items from Robocorp Cloud.
@@ -90,10 +183,39 @@ class RobocorpAdapter(BaseAdapter):
     * RC_API_WORKITEM_TOKEN:    Work item API access token
     """
 
+    MAX_TRANSFERS = 8
+
+    # Size of chunks in file downloads
+    CHUNK_SIZE = 1024 * 1024
+
+    # Retries for failed connections and temporary server errors
+    RETRY_TOTAL = 5
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.host = required_env("RC_API_WORKITEM_HOST")
         self.token = required_env("RC_API_WORKITEM_TOKEN")
+        self.session = self._create_session()
+        #: Cached mapping of filenames to file IDs
+        self._file_ids = None
+
+    def _create_session(self):
+        """Create HTTP session which keeps connections alive between
+        requests, and retries requests with exponential backoff.
+        """
+        retries = Retry(
+            total=self.RETRY_TOTAL,
+            backoff_factor=self.RETRY_BACKOFF,
+            status_forcelist=self.RETRY_STATUSES,
+            raise_on_status=False,
+        )
+
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(max_retries=retries))
+        session.mount("https://", HTTPAdapter(max_retries=retries))
+        return session
 
     @property
     def headers(self):
@@ -104,7 +226,7 @@ class RobocorpAdapter(BaseAdapter):
         url = self.url("data")
         logging.info("Loading work item data: %s", url)
 
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         if response.ok:
             return response.json()
         elif response.status_code == 404:
@@ -118,7 +240,7 @@ class RobocorpAdapter(BaseAdapter):
         data = json_dump_safe(data)
         logging.info("Saving work item data: %s", url)
 
-        response = requests.put(url, headers=self.headers, data=data)
+        response = self.session.put(url, headers=self.headers, data=data)
         self.handle_error(response)
 
         return response.json()
@@ -128,21 +250,51 @@ class RobocorpAdapter(BaseAdapter):
         url = self.url("files")
         logging.info("Listing work item files: %s", url)
 
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         self.handle_error(response)
 
-        return [item["fileName"] for item in response.json()]
+        files = response.json()
+
+        # Duplicate filenames should never exist,
+        # but use last item just in case
+        self._file_ids = {item["fileName"]: item["fileId"] for item in files}
+
+        return [item["fileName"] for item in files]
 
     def get_file(self, name):
         """Download attached file content.
 
         :param name: Name of file
         """
+        response = self._download(name)
+        return response.content
+
+    def get_file_to_path(self, name, path):
+        """Download attached file to disk in chunks.
+
+        :param name: Name of file
+        :param path: Destination path
+        """
+        # Write to a temporary file first, so that a failed download
+        # never leaves a partial file at the destination
+        temp = f"{path}.{uuid.uuid4().hex}.tmp"
+        with self._download(name, stream=True) as response:
+            try:
+                with open(temp, "xb") as outfile:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        outfile.write(chunk)
+                os.replace(temp, path)
+            except BaseException:
+                if os.path.exists(temp):
+                    os.unlink(temp)
+                raise
+
+    def _download(self, name, stream=False):
         # Robocorp API returns URL for S3 download
         url = self.url("files", self.file_id(name))
         logging.info("Downloading work item file: %s", url)
 
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         self.handle_error(response)
         data = response.json()
 
@@ -150,10 +302,10 @@ class RobocorpAdapter(BaseAdapter):
         url = data["url"]
         logging.debug("File download URL: %s", url)
 
-        response = requests.get(url)
+        response = self.session.get(url, stream=stream)
         response.raise_for_status()
 
-        return response.content
+        return response
 
     def add_file(self, name, content):
         """Attach and upload file.
@@ -161,9 +313,21 @@ class RobocorpAdapter(BaseAdapter):
         :param name:    Destination name
         :param content: Content of file
         """
+        self._upload(name, io.BytesIO(content), len(content))
+
+    def add_file_from_path(self, name, path):
+        """Attach and upload file from disk in chunks.
+
+        :param name: Destination name
+        :param path: Path to file
+        """
+        with open(path, "rb") as infile:
+            self._upload(name, infile, os.path.getsize(path))
+
+    def _upload(self, name, fileobj, size):
         # Robocorp API returns pre-signed POST details for S3 upload
         url = self.url("files")
-        info = {"fileName": str(name), "fileSize": len(content)}
+        info = {"fileName": str(name), "fileSize": size}
         logging.info(
             "Adding work item file: %s (name: %s, size: %s)",
             url,
@@ -171,17 +335,25 @@ class RobocorpAdapter(BaseAdapter):
             info["fileSize"],
         )
 
-        response = requests.post(url, headers=self.headers, data=json.dumps(info))
+        response = self.session.post(url, headers=self.headers, data=json.dumps(info))
         self.handle_error(response)
         data = response.json()
 
+        # File ID is resolved again when needed, if not returned here
+        if self._file_ids is not None:
+            if "fileId" in data:
+                self._file_ids[str(name)] = data["fileId"]
+            else:
+                self._file_ids.pop(str(name), None)
+
         # Perform actual file upload
         url = data["url"]
-        fields = data["fields"]
-        files = {"file": (name, content)}
+        body = MultipartStream(data["fields"], name, fileobj, size)
         logging.debug("File upload URL: %s", url)
 
-        response = requests.post(url, data=fields, files=files)
+        response = self.session.post(
+            url, data=body, headers={"Content-Type": body.content_type}
+        )
         response.raise_for_status()
 
     def remove_file(self, name):
@@ -192,36 +364,37 @@ class RobocorpAdapter(BaseAdapter):
         url = self.url("files", self.file_id(name))
         logging.info("Removing work item file: %s", url)
 
-        response = requests.delete(url, headers=self.headers)
+        response = self.session.delete(url, headers=self.headers)
         self.handle_error(response)
 
+        if self._file_ids is not None:
+            self._file_ids.pop(str(name), None)
+
         return response.json()
 
     def file_id(self, name):
         """Convert filename to ID used by Robocorp API.
 
+        Files are listed again only if the name is not
+        in the previously listed files.
+
         :param name: Name of file
         """
-        url = self.url("files")
+        name = str(name)
+        if self._file_ids is None or name not in self._file_ids:
+            self.list_files()
 
-        response = requests.get(url, headers=self.headers)
-        self.handle_error(response)
-
-        files = response.json()
-        if not files:
+        if not self._file_ids:
             raise FileNotFoundError("No files in work item")
 
-        matches = [item for item in files if item["fileName"] == name]
-        if not matches:
+        if name not in self._file_ids:
             raise FileNotFoundError(
                 "File with name '{name}' not in: {names}".format(
-                    name=name, names=", ".join(item["fileName"] for item in files)
+                    name=name, names=", ".join(self._file_ids)
                 )
             )
 
-        # Duplicate filenames should never exist,
-        # but use last item just in case
-        return matches[-1]["fileId"]
+        return self._file_ids[name]
 
     def url(self, *parts):
         """Create full URL to Robocorp endpoint."""
@@ -310,6 +483,18 @@ class FileAdapter(BaseAdapter):
         with open(dirname / name, "wb") as outfile:
             outfile.write(content)
 
+    def get_file_to_path(self, name, path):
+        """Copy file to given path."""
+        source = Path(self.path).parent / name
+        if source.resolve() != Path(path).resolve():
+            copyfile(source, path)
+
+    def add_file_from_path(self, name, path):
+        """Copy file from given path."""
+        destination = Path(self.path).parent / name
+        if destination.resolve() != Path(path).resolve():
+            copyfile(path, destination)
+
     def remove_file(self, name):
         """Do not remove local files."""
         del name
@@ -401,9 +586,7 @@ class WorkItem:
         for name in self._files_to_remove:
             self.adapter.remove_file(name)
 
-        for name, path in self._files_to_add.items():
-            with open(path, "rb") as infile:
-                self.adapter.add_file(name, infile.read())
+        self._transfer(self.adapter.add_file_from_path, self._files_to_add.items())
 
         # Empty unsaved values
         self._data = self._data_cache
@@ -432,13 +615,38 @@ class WorkItem:
             if Path(local_path).resolve() != Path(path).resolve():
                 copy2(local_path, path)
         else:
-            data = self.adapter.get_file(name)
-            with open(path, "wb") as outfile:
-                outfile.write(data)
+            self.adapter.get_file_to_path(name, path)
 
         # Always return absolute path
         return str(Path(path).resolve())
 
+    def get_files(self, names, dirname=None):
+        """Load multiple attached files concurrently, and store them
+        on the local filesystem.
+
+        :param names:   Names of attached files
+        :param dirname: Destination directory. Default to current working directory.
+        :returns:       Paths to created files
+        """
+        if dirname:
+            items = [(name, os.path.join(dirname, name)) for name in names]
+        else:
+            items = [(name, None) for name in names]
+
+        return self._transfer(self.get_file, items)
+
+    def _transfer(self, func, items):
+        """Call `func` for each argument pair in `items`, concurrently
+        if supported by the adapter, and return results in order.
+        """
+        items = list(items)
+        workers = min(self.adapter.MAX_TRANSFERS, len(items))
+        if workers <= 1:
+            return [func(*item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: func(*item), items))
+
     def add_file(self, path, name=None):
         """Add file to current work item. Does not upload
         until ``save()`` is called.
@@ -920,14 +1128,16 @@ class Items:
                 Handle customer file    ${path}
             END
         """
-        paths = []
-        for name in self.list_work_item_files():
-            if fnmatch.fnmatch(name, pattern):
-                if dirname:
-                    path = self.get_work_item_file(name, os.path.join(dirname, name))
-                else:
-                    path = self.get_work_item_file(name)
-                paths.append(path)
+        names = [
+            name
+            for name in self.list_work_item_files()
+            if fnmatch.fnmatch(name, pattern)
+        ]
+
+        # Files are downloaded concurrently
+        paths = self.current.get_files(names, dirname)
+        for path in paths:
+            logging.info("Downloaded file to: %s", path)
 
         logging.info("Downloaded %d file(s)", len(paths))
         return paths
@@ -9,11 +9,13 @@ import copy
 import csv
 import keyword
 import logging
+import os
 import re
+from array import array
 from collections import OrderedDict, namedtuple
 from typing import List, Union, NamedTuple, Dict
 
-from itertools import groupby, zip_longest
+from itertools import chain, compress, groupby, islice, zip_longest
 from numbers import Number
 from operator import itemgetter
 
@@ -63,6 +65,28 @@ def uniq(seq):
     return result
 
 
+# Typed array codes for homogeneous column values
+TYPECODES = {int: "q", float: "d"}
+
+
+def pack_column(values):
+    """Store column values as a typed array if they are all integers
+    or all floats, and otherwise as a list.
+    """
+    values = list(values)
+
+    kinds = set(type(value) for value in values)
+    typecode = TYPECODES.get(kinds.pop()) if len(kinds) == 1 else None
+
+    if typecode is not None:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            pass
+
+    return values
+
+
 Row = Union[NamedTuple, dict, list, tuple]
 Tableable = Union[
     None,
@@ -95,6 +119,10 @@ class Table:
         self._columns = []
         self._index = []
 
+        # Lookup tables from index/column names to locations
+        self._index_map = {}
+        self._columns_map = {}
+
         # Use public setters to validate data
         if columns is not None:
             self.columns = list(columns)
@@ -128,6 +156,7 @@ class Table:
         if not self.index:
             self.index = table.index
         self._data = table.data
+        self._update_index_map()
 
     def _init_list(self, data):
         """Initialize table from list-like container."""
@@ -146,7 +175,7 @@ class Table:
             for column in column_names(obj):
                 # Dictionaries and namedtuples can
                 # contain unknown columns
-                if column not in self._columns:
+                if column not in self._columns_map:
                     if not add_columns:
                         continue
 
@@ -162,23 +191,26 @@ class Table:
             # Generate range-based index if not predefined
             if add_index:
                 self._index.append(idx)
+                self._index_map[idx] = idx
 
     def _init_dict(self, data):
         """Initialize table from dict-like container."""
         if not self._columns:
             self._columns = list(data.keys())
+            self._update_columns_map()
 
         # Filter values by defined columns
         columns = (
             to_list(values)
             for column, values in data.items()
-            if column in self._columns
+            if column in self._columns_map
         )
 
         # Convert columns to rows
         self._data = [list(row) for row in zip_longest(*columns)]
 
         self._index = self._index or list(range(len(self._data)))
+        self._update_index_map()
 
     def __repr__(self):
         return "Table(columns={}, rows={})".format(self.columns, len(self))
@@ -195,7 +227,7 @@ class Table:
         return (
             self._index == other._index
             and self._columns == other._columns
-            and self._data == other._data
+            and list(self._iter_rows()) == list(other._iter_rows())
         )
 
     @property
@@ -215,6 +247,7 @@ class Table:
         """Rename columns with given values."""
         self._validate_columns(names)
         self._columns = list(names)
+        self._update_columns_map()
 
     def _validate_columns(self, names):
         """Validate that given column names can be used."""
@@ -224,7 +257,7 @@ class Table:
         if len(set(names)) != len(names):
             raise ValueError("Duplicate column names")
 
-        if self._data and len(names) != len(self._data[0]):
+        if self._data and len(names) != self._shape()[1]:
             raise ValueError("Invalid columns length")
 
     def _column_name_getter(self, obj):
@@ -298,7 +331,8 @@ class Table:
         cols = [self.column_location(column) for column in order]
 
         self._columns = [self._columns[col] for col in cols]
-        self._data = [[row[col] for col in cols] for row in self._data]
+        self._reorder_columns(cols)
+        self._update_columns_map()
 
     @property
     def index(self):
@@ -309,6 +343,7 @@ class Table:
         """Renames index with given values."""
         self._validate_index(names)
         self._index = list(names)
+        self._update_index_map()
 
     def _validate_index(self, names):
         """Validate that given index names can be used."""
@@ -318,7 +353,7 @@ class Table:
         if len(set(names)) != len(names):
             raise ValueError("Duplicate index names")
 
-        if self._data and len(names) != len(self._data):
+        if self._data and len(names) != self._shape()[0]:
             raise ValueError("Invalid index length")
 
     def _validate_self(self):
@@ -326,27 +361,88 @@ class Table:
         self._validate_columns(self._columns)
         self._validate_index(self._index)
 
-        if self._data:
-            head = self._data[0]
-            if len(head) != len(self._columns):
-                raise ValueError("Columns length does not match data")
+        rows, columns = self._shape()
+        if rows and columns != len(self._columns):
+            raise ValueError("Columns length does not match data")
 
-        if len(self._data) != len(self._index):
+        if rows != len(self._index):
             raise ValueError("Index length does not match data")
 
+    def _shape(self):
+        """Dimensions of stored data, as (rows, columns)."""
+        if not self._data:
+            return 0, 0
+        return len(self._data), len(self._data[0])
+
+    def _get_value(self, idx, col):
+        """Get stored value by row and column location."""
+        return self._data[idx][col]
+
+    def _set_value(self, idx, col, value):
+        """Set stored value by row and column location."""
+        self._data[idx][col] = value
+
+    def _set_row_values(self, idx, values):
+        """Replace all stored values in row."""
+        self._data[idx] = values
+
+    def _get_column_values(self, col):
+        """Get all stored values in column, as a list."""
+        return [row[col] for row in self._data]
+
+    def _iter_rows(self):
+        """Iterate stored rows as lists of values."""
+        return iter(self._data)
+
+    def _append_empty_row(self):
+        """Add row of None values to stored data."""
+        self._data.append([None] * len(self._columns))
+
+    def _append_empty_column(self):
+        """Add column of None values to stored data."""
+        for row in self._data:
+            row.append(None)
+
+    def _compress_rows(self, keep):
+        """Remove stored rows where `keep` is falsy."""
+        self._data = list(compress(self._data, keep))
+
+    def _delete_column(self, col):
+        """Remove column from stored data."""
+        for row in self._data:
+            del row[col]
+
+    def _reorder_rows(self, idxs):
+        """Re-order stored rows by given locations."""
+        self._data = [self._data[idx] for idx in idxs]
+
+    def _reorder_columns(self, cols):
+        """Re-order stored columns by given locations."""
+        self._data = [[row[col] for col in cols] for row in self._data]
+
+    def _update_index_map(self):
+        """Rebuild lookup table from index names to row locations."""
+        self._index_map = {index: idx for idx, index in enumerate(self._index)}
+
+    def _update_columns_map(self):
+        """Rebuild lookup table from column names to column locations."""
+        self._columns_map = {column: col for col, column in enumerate(self._columns)}
+
     def column_location(self, value):
-        return self._location("column", self._columns, value)
+        return self._location("column", self._columns, self._columns_map, value)
 
     def index_location(self, value):
-        return self._location("index", self._index, value)
+        return self._location("index", self._index, self._index_map, value)
 
     @staticmethod
-    def _location(name, container, value):
-        """Find location for index/column value."""
+    def _location(name, container, locations, value):
+        """Find location for index/column value,
+        using `locations` as a lookup table for names in `container`.
+        """
         # Directly indexing columns
         if isinstance(value, int):
-            if value in container:
-                location = container.index(value)
+            if value in locations:
+                location = locations[value]
             elif value < 0:
                 location = value + len(container)
             else:
@@ -358,8 +454,8 @@ class Table:
         # Finding index by name
         else:
             try:
-                location = container.index(value)
-            except ValueError as e:
+                location = locations[value]
+            except (KeyError, TypeError) as e:
                 raise ValueError(f"Unknown {name} name: {value}") from e
 
         return location
@@ -475,7 +571,7 @@ class Table:
         """Get single cell value."""
         idx = self.index_location(index)
         col = self.column_location(column)
-        return self._data[idx][col]
+        return self._get_value(idx, col)
 
     def get_row(self, index, columns=None, as_list=False):
         """Get column values from row.
@@ -491,13 +587,13 @@ class Table:
             row = []
             for column in columns:
                 col = self.column_location(column)
-                row.append(self._data[idx][col])
+                row.append(self._get_value(idx, col))
             return row
         else:
             row = {}
             for column in columns:
                 col = self.column_location(column)
-                row[self._columns[col]] = self._data[idx][col]
+                row[self._columns[col]] = self._get_value(idx, col)
             return row
 
     def get_column(self, column, indexes=None, as_list=False):
@@ -507,21 +603,20 @@ class Table:
         :param indexes: row indexes to include, or all if not given
         :param as_list: return column as dictionary, instead of list
         """
-        indexes = if_none(indexes, self._index)
         col = self.column_location(column)
 
+        if indexes is None:
+            names = self._index
+            values = self._get_column_values(col)
+        else:
+            idxs = [self.index_location(index) for index in indexes]
+            names = [self._index[idx] for idx in idxs]
+            values = [self._get_value(idx, col) for idx in idxs]
+
         if as_list:
-            column = []
-            for index in indexes:
-                idx = self.index_location(index)
-                column.append(self._data[idx][col])
-            return column
+            return values
         else:
-            column = {}
-            for index in indexes:
-                idx = self.index_location(index)
-                column[self._index[idx]] = self._data[idx][col]
-            return column
+            return dict(zip(names, values))
 
     def get_table(self, indexes=None, columns=None, as_list=False):
         """Get a new table from all cells matching indexes and columns."""
@@ -533,12 +628,12 @@ class Table:
 
         idxs = [self.index_location(index) for index in indexes]
         cols = [self.column_location(column) for column in columns]
-        data = [[self._data[idx][col] for col in cols] for idx in idxs]
+        data = [[self._get_value(idx, col) for col in cols] for idx in idxs]
 
         if as_list:
             return data
         else:
-            return Table(data=data, index=indexes, columns=columns)
+            return self.__class__(data=data, index=indexes, columns=columns)
 
     def get_slice(self, start=None, end=None):
         """Get a new table from rows between start and end index."""
@@ -556,7 +651,7 @@ class Table:
         if index is None:
             index = len(self._index)
 
-        if index in self._index:
+        if index in self._index_map:
             raise ValueError(f"Duplicate row index: {index}")
 
         if isinstance(index, int):
@@ -565,7 +660,8 @@ class Table:
                 self._add_row(empty)
 
         self._index.append(index)
-        self._data.append([None] * len(self._columns))
+        self._index_map[index] = len(self._index) - 1
+        self._append_empty_row()
 
         return len(self._index) - 1
 
@@ -574,7 +670,7 @@ class Table:
         if column is None:
             column = len(self._columns)
 
-        if column in self._columns:
+        if column in self._columns_map:
             raise ValueError(f"Duplicate column name: {column}")
 
         if isinstance(column, int):
@@ -583,9 +679,8 @@ class Table:
                 self._add_column(empty)
 
         self._columns.append(column)
-        for idx, _ in enumerate(self._index):
-            row = self._data[idx]
-            row.append(None)
+        self._columns_map[column] = len(self._columns) - 1
+        self._append_empty_column()
 
         return len(self._columns) - 1
 
@@ -627,7 +722,7 @@ class Table:
         except (IndexError, ValueError):
             col = self._add_column(column)
 
-        self._data[idx][col] = value
+        self._set_value(idx, col, value)
 
     def set_row(self, index, values):
         """Set values in row. If index is missing, it is created."""
@@ -639,7 +734,7 @@ class Table:
         column_values = self._column_value_getter(values)
         row = [column_values(values, column) for column in self._columns]
 
-        self._data[idx] = row
+        self._set_row_values(idx, row)
 
     def set_column(self, column, values):
         """Set values in column. If column is missing, it is created."""
@@ -648,7 +743,7 @@ class Table:
         if len(values) != len(self._index):
             raise ValueError("Index and values lengths should match")
 
-        if column not in self._columns:
+        if column not in self._columns_map:
             self._add_column(column)
 
         for index in self._index:
@@ -657,7 +752,7 @@ class Table:
 
     def append_row(self, row=None, index=None):
         """Append new row to table."""
-        if index is not None and index in self._index:
+        if index is not None and index in self._index_map:
             raise IndexError(f"Index already exists: {index}")
 
         self.set_row(index, row)
@@ -674,7 +769,7 @@ class Table:
             self.append_row(row, index)
 
     def append_column(self, column=None, values=None):
-        if column is not None and column in self._columns:
+        if column is not None and column in self._columns_map:
             raise ValueError(f"Column already exists: {column}")
 
         self.set_column(column, values)
@@ -688,10 +783,14 @@ class Table:
             names = ", ".join(str(name) for name in unknown)
             raise ValueError(f"Unable to remove unknown rows: {names}")
 
-        for index in indexes:
-            idx = self.index_location(index)
-            del self._index[idx]
-            del self._data[idx]
+        removed = set(self.index_location(index) for index in indexes)
+        self._keep_rows([idx not in removed for idx in range(len(self._index))])
+
+    def _keep_rows(self, keep):
+        """Remove all rows where `keep` is falsy, in a single pass."""
+        self._index = list(compress(self._index, keep))
+        self._compress_rows(keep)
+        self._update_index_map()
 
     def delete_columns(self, columns):
         """Remove columns with matching names."""
@@ -704,14 +803,14 @@ class Table:
 
         for column in columns:
             col = self.column_location(column)
-            for index in self.index:
-                idx = self.index_location(index)
-                del self._data[idx][col]
+            self._delete_column(col)
             del self._columns[col]
+            self._update_columns_map()
 
         # All data has been removed
         if not self._columns:
             self._index = []
+            self._update_index_map()
 
     def append_table(self, table):
         """Append data from table to current data."""
@@ -722,7 +821,7 @@ class Table:
         for idx, index in enumerate(table.index):
             if isinstance(index, int):
                 index = len(self) + idx
-            elif index in self._index:
+            elif index in self._index_map:
                 raise ValueError(f"Duplicate index name: {index}")
             indexes.append(index)
 
@@ -752,7 +851,7 @@ class Table:
     def _sort_by(self, values, reverse=False):
         """Sort index and data by using `values` as sorting criteria."""
         assert is_list_like(values)
-        assert len(values) == len(self._data)
+        assert len(values) == len(self._index)
 
         def sorter(row):
             """Sort table by given values, while allowing for disparate types.
@@ -787,7 +886,9 @@ class Table:
                 indexes.append(index)
 
         # Re-order data
-        self._data = [self._data[idx] for idx in idxs]
+        self._index = indexes
+        self._reorder_rows(idxs)
+        self._update_index_map()
 
     def group_by_column(self, column):
         """Group rows by column value and return as list of tables."""
@@ -811,17 +912,13 @@ class Table:
         """Remove rows by evaluating `condition` for all `column`
         values. All rows where it evaluates to falsy are removed.
         """
-        filtered = []
-        for index in self.index:
-            value = self.get_cell(index, column)
-            if not condition(value):
-                filtered.append(index)
-
-        self.delete_rows(filtered)
+        col = self.column_location(column)
+        values = self._get_column_values(col)
+        self._keep_rows([condition(value) for value in values])
 
     def iter_lists(self, with_index=True):
         """Iterate rows with values as lists."""
-        for idx, row in zip(self._index, self._data):
+        for idx, row in zip(self._index, self._iter_rows()):
             if with_index:
                 yield idx, list(row)
             else:
@@ -829,10 +926,9 @@ class Table:
 
     def iter_dicts(self, with_index=True):
         """Iterate rows with values as dicts."""
-        for index in self._index:
+        for index, values in zip(self._index, self._iter_rows()):
             row = {"index": index} if with_index else {}
-            for column in self._columns:
-                row[column] = self.get_cell(index, column)
+            row.update(zip(self._columns, values))
             yield row
 
     def iter_tuples(self, with_index=True, name="Row"):
@@ -854,12 +950,11 @@ class Table:
         """Convert table to list representation."""
         export = []
 
-        for index in self._index:
+        for index, values in zip(self._index, self._iter_rows()):
             row = OrderedDict()
             if with_index:
                 row["index"] = index
-            for column in self._columns:
-                row[column] = self.get_cell(index, column)
+            row.update(zip(self._columns, values))
             export.append(row)
 
         return export
@@ -871,17 +966,166 @@ class Table:
         if with_index:
             export["index"] = self.index
 
-        for column in self._columns:
-            export[column] = []
-
-        for index in self._index:
-            for column in self._columns:
-                value = self.get_cell(index, column)
-                export[column].append(value)
+        for col, column in enumerate(self._columns):
+            export[column] = self._get_column_values(col)
 
         return export
 
 
+class ColumnarTable(Table):
+    """Table which stores values column-wise, instead of row-wise.
+
+    Columns with only integer or only float values are packed
+    into typed arrays, and other columns are stored as lists.
+    Empty (None) values in typed columns, e.g. from added rows,
+    are tracked separately so that the column stays packed.
+    A typed column is converted to a list when a value of some
+    other type is added to it.
+
+    Accepts the same arguments as `Table`.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, data: Tableable = None, columns=None, index=None):
+        # Parse input as a row-based table, and convert it afterwards
+        table = Table(data, columns, index)
+
+        self._columns = table._columns
+        self._index = table._index
+        self._columns_map = table._columns_map
+        self._index_map = table._index_map
+
+        if table._data:
+            values = zip(*table._data)
+        else:
+            values = [[] for _ in self._columns]
+
+        self._data = [pack_column(column) for column in values]
+        # Row locations of None values in typed columns
+        self._nulls = [set() for _ in self._data]
+
+    @property
+    def data(self):
+        return list(self._iter_rows())
+
+    def _shape(self):
+        rows = len(self._data[0]) if self._data else len(self._index)
+        return rows, len(self._data)
+
+    def _unpack_column(self, col):
+        """Convert typed array column to a list."""
+        column = self._data[col]
+        if isinstance(column, array):
+            column = self._data[col] = self._column_values(col)
+            self._nulls[col] = set()
+        return column
+
+    def _column_values(self, col):
+        """Get column values as a list, with None values restored."""
+        values = list(self._data[col])
+        for idx in self._nulls[col]:
+            values[idx] = None
+        return values
+
+    def _get_value(self, idx, col):
+        if idx < 0:
+            idx += len(self._data[col])
+        if idx in self._nulls[col]:
+            return None
+        return self._data[col][idx]
+
+    def _set_value(self, idx, col, value):
+        column = self._data[col]
+
+        if isinstance(column, array):
+            if idx < 0:
+                idx += len(column)
+            if value is None:
+                column[idx] = 0
+                self._nulls[col].add(idx)
+                return
+            if TYPECODES.get(type(value)) == column.typecode:
+                try:
+                    column[idx] = value
+                    self._nulls[col].discard(idx)
+                    return
+                except OverflowError:
+                    pass
+            column = self._unpack_column(col)
+
+        column[idx] = value
+
+    def _set_row_values(self, idx, values):
+        for col, value in enumerate(values):
+            self._set_value(idx, col, value)
+
+    def _get_column_values(self, col):
+        return self._column_values(col)
+
+    def _iter_rows(self):
+        if not self._data:
+            for _ in self._index:
+                yield []
+        else:
+            columns = [
+                self._column_values(col) if nulls else column
+                for col, (column, nulls) in enumerate(zip(self._data, self._nulls))
+            ]
+            for row in zip(*columns):
+                yield list(row)
+
+    def _append_empty_row(self):
+        for column, nulls in zip(self._data, self._nulls):
+            if isinstance(column, array):
+                nulls.add(len(column))
+                column.append(0)
+            else:
+                column.append(None)
+
+    def _append_empty_column(self):
+        self._data.append([None] * len(self._index))
+        self._nulls.append(set())
+
+    def _compress_rows(self, keep):
+        data = []
+        for column in self._data:
+            values = compress(column, keep)
+            if isinstance(column, array):
+                data.append(array(column.typecode, values))
+            else:
+                data.append(list(values))
+        self._data = data
+
+        idxs = list(compress(range(len(keep)), keep))
+        self._nulls = [self._remap_nulls(nulls, idxs) for nulls in self._nulls]
+
+    def _delete_column(self, col):
+        del self._data[col]
+        del self._nulls[col]
+
+    def _reorder_rows(self, idxs):
+        data = []
+        for column in self._data:
+            values = map(column.__getitem__, idxs)
+            if isinstance(column, array):
+                data.append(array(column.typecode, values))
+            else:
+                data.append(list(values))
+        self._data = data
+        self._nulls = [self._remap_nulls(nulls, idxs) for nulls in self._nulls]
+
+    def _reorder_columns(self, cols):
+        self._data = [self._data[col] for col in cols]
+        self._nulls = [self._nulls[col] for col in cols]
+
+    @staticmethod
+    def _remap_nulls(nulls, idxs):
+        """Move None locations to new rows, given their previous locations."""
+        if not nulls:
+            return set()
+        return {new for new, old in enumerate(idxs) if old in nulls}
+
+
 class Tables:
     """`Tables` is a library for manipulating tabular data inside Robot Framework.
 
@@ -978,19 +1222,28 @@ class Tables:
         if not isinstance(obj, Table):
             raise TypeError("Keyword requires Table object")
 
-    def create_table(self, data=None, trim=False, columns=None, index=None):
+    def create_table(
+        self, data=None, trim=False, columns=None, index=None, columnar=False
+    ):
         """Create Table object from data.
 
         Data can be a combination of various iterable containers, e.g.
         list of lists, list of dicts, dict of lists.
 
-        :param data:    source data for table
-        :param trim:    remove all empty rows from the end of the worksheet,
-                        default `False`
-        :param columns: names of columns (optional)
-        :param index:   names of rows (optional)
+        :param data:     source data for table
+        :param trim:     remove all empty rows from the end of the worksheet,
+                         default `False`
+        :param columns:  names of columns (optional)
+        :param index:    names of rows (optional)
+        :param columnar: store values column-wise, default `False`
+
+        A columnar table stores each column in a single container,
+        packing integer and float columns into typed arrays. This uses
+        less memory for large tables and speeds up column operations,
+        like sorting and filtering, while other keywords work as before.
         """
-        table = Table(data, columns, index)
+        container = ColumnarTable if columnar else Table
+        table = container(data, columns, index)
 
         if trim:
             self.trim_empty_rows(table)
@@ -1030,15 +1283,25 @@ class Tables:
         self._requires_table(table)
         table.clear()
 
-    def merge_tables(self, *tables, index=None):
+    def merge_tables(self, *tables, index=None, how="outer"):
         """Create a union of two tables and their contents.
 
         :param tables: Tables to merge
-        :param index:  Column name to use as index for merge
+        :param index:  Column name, or list of column names,
+                       to use as index for merge
+        :param how:    Type of merge when using ``index``, one of
+                       ``outer``, ``inner``, or ``left``
 
         By default rows from all tables are appended one after the other.
         Optionally a column name can be given with ``index``, which is
-        used to merge rows together.
+        used to merge rows together. A list of column names can be
+        given to use a combination of their values as the key.
+
+        The type of merge is defined by ``how``:
+
+        - ``outer``: Include rows with keys found in any of the tables (default)
+        - ``inner``: Include rows with keys found in all of the tables
+        - ``left``:  Include rows with keys found in the first table
 
         Example:
 
@@ -1071,11 +1334,14 @@ class Tables:
                 ...    Price: ${product}[Price]
                 ...    Stock: ${product}[Stock]
             END
+
+            ${in_stock}=    Merge tables    ${prices}    ${stock}
+            ...    index=Name    how=inner
         """
         if index is None:
             return self._merge_by_append(tables)
         else:
-            return self._merge_by_index(tables, index)
+            return self._merge_by_index(tables, index, how)
 
     def _merge_by_append(self, tables):
         """Merge tables by appending columns and rows."""
@@ -1087,34 +1353,42 @@ class Tables:
 
         return merged
 
-    def _merge_by_index(self, tables, index):
-        """Merge tables by using a column as shared key."""
-        columns = uniq(column for table in tables for column in table.columns)
-        merged = Table(columns=columns)
-
-        seen = {}
-
-        def find_index(row):
-            """Find index for row, if key already exists."""
-            value = row[index]
-            if value in seen:
-                return seen[value]
-            for row_ in merged.iter_dicts(True):
-                if row_[index] == value:
-                    seen[value] = row_["index"]
-                    return row_["index"]
-            return None
+    def _merge_by_index(self, tables, index, how):
+        """Merge tables by using one or more columns as shared key."""
+        how = str(how).lower().strip()
+        if how not in ("outer", "inner", "left"):
+            raise ValueError(f"Unknown merge type: {how}")
 
+        keys = to_list(index)
         for table in tables:
+            missing = set(keys) - set(table.columns)
+            if missing:
+                names = ", ".join(str(name) for name in missing)
+                raise ValueError(f"Table missing index columns: {names}")
+
+        columns = uniq(column for table in tables for column in table.columns)
+
+        # Combined values and source tables for each key, in order of appearance
+        rows, sources = OrderedDict(), {}
+        for source, table in enumerate(tables):
             for row in table.iter_dicts(False):
-                row_index = find_index(row)
-                if row_index is None:
-                    merged.append_row(row)
+                key = tuple(row[column] for column in keys)
+                if key in rows:
+                    rows[key].update(row)
                 else:
-                    for column, value in row.items():
-                        merged.set_cell(row_index, column, value)
+                    rows[key] = row
+                sources.setdefault(key, set()).add(source)
+
+        if how == "inner":
+            merged = [
+                row for key, row in rows.items() if len(sources[key]) == len(tables)
+            ]
+        elif how == "left":
+            merged = [row for key, row in rows.items() if 0 in sources[key]]
+        else:
+            merged = list(rows.values())
 
-        return merged
+        return Table(merged, columns=columns)
 
     def get_table_dimensions(self, table):
         """Return table dimensions, as (rows, columns).
@@ -1417,7 +1691,13 @@ class Tables:
         ]
 
     def read_table_from_csv(
-        self, path, header=None, columns=None, dialect=None, delimiters=None
+        self,
+        path,
+        header=None,
+        columns=None,
+        dialect=None,
+        delimiters=None,
+        columnar=False,
     ):
         """Read a CSV file as a table.
 
@@ -1426,6 +1706,7 @@ class Tables:
         :param columns:     names of columns in resulting table
         :param dialect:     format of CSV file
         :param delimiters:  string of possible delimiters
+        :param columnar:    store values column-wise, see ``Create Table``
 
         By default attempts to deduce the CSV format and headers
         from a sample of the input file. If it's unable to determine
@@ -1440,25 +1721,126 @@ class Tables:
         in the resulting table. The amount of columns must match the input
         data.
         """
-        sniffer = csv.Sniffer()
-        with open(path, newline="") as fd:
+        rows = list(self._read_csv(path, header, dialect, delimiters))
+
+        container = ColumnarTable if columnar else Table
+        table = container(rows, columns)
+        notebook_table(self.table_head(table, 10))
+        return table
+
+    def iterate_table_from_csv(
+        self,
+        path,
+        chunk_size=1000,
+        header=None,
+        columns=None,
+        dialect=None,
+        delimiters=None,
+        columnar=False,
+    ):
+        """Read a CSV file as consecutive tables of at most ``chunk_size`` rows.
+
+        :param path:        path to CSV file
+        :param chunk_size:  maximum amount of rows in each table
+        :param header:      CSV file includes header
+        :param columns:     names of columns in resulting tables
+        :param dialect:     format of CSV file
+        :param delimiters:  string of possible delimiters
+        :param columnar:    store values column-wise, see ``Create Table``
+
+        The file is opened and its format deduced immediately, but rows are
+        read lazily, so only one chunk of rows is kept in memory at a time.
+        The row indexes continue from one table to the next.
+        Other arguments work the same as in ``Read Table From CSV``.
+
+        Note that expanding the result as ``@{chunks}``, e.g. in a ``FOR``
+        loop, reads all the chunks to memory before the first round.
+        To keep memory usage low, give it as ``${chunks}`` to a keyword
+        which consumes it one table at a time:
+
+        .. code-block:: robotframework
+
+            ${chunks}=    Iterate table from CSV    orders.csv    chunk_size=10000
+            Write rows to CSV    ${chunks}    orders-copy.csv
+        """
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be a positive integer")
+
+        container = ColumnarTable if columnar else Table
+        rows = self._read_csv(path, header, dialect, delimiters)
+
+        return self._iter_table_chunks(rows, chunk_size, columns, container)
+
+    @staticmethod
+    def _iter_table_chunks(rows, chunk_size, columns, container):
+        """Generator for tables created from consecutive chunks of rows."""
+        offset = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            index = range(offset, offset + len(chunk))
+            yield container(chunk, columns, index)
+            offset += len(chunk)
+
+    def iterate_rows_from_csv(self, path, header=None, dialect=None, delimiters=None):
+        """Read a CSV file lazily, one row at a time.
+
+        :param path:        path to CSV file
+        :param header:      CSV file includes header
+        :param dialect:     format of CSV file
+        :param delimiters:  string of possible delimiters
+
+        Rows are returned as dictionaries if the file includes a header,
+        and otherwise as lists. The format of the file is deduced
+        in the same way as in ``Read Table From CSV``, already when
+        this keyword is called.
+
+        As with ``Iterate Table From CSV``, give the result as ``${rows}``
+        to a keyword which consumes it, since expanding it as ``@{rows}``
+        reads all the rows to memory:
+
+        .. code-block:: robotframework
+
+            ${rows}=    Iterate rows from CSV    orders.csv
+            Write rows to CSV    ${rows}    orders-copy.csv
+        """
+        return self._read_csv(path, header, dialect, delimiters)
+
+    @staticmethod
+    def _read_csv(path, header=None, dialect=None, delimiters=None):
+        """Open a CSV file and return a generator for its rows. The format
+        and header are deduced from a sample of the file if not given,
+        so that invalid files raise an error before any rows are read.
+        """
+        fd = open(path, newline="")  # pylint: disable=consider-using-with
+        try:
+            sniffer = csv.Sniffer()
             sample = fd.read(1024)
 
-        if dialect is None:
-            dialect = sniffer.sniff(sample, delimiters)
-        if header is None:
-            header = sniffer.has_header(sample)
+            if dialect is None:
+                dialect = sniffer.sniff(sample, delimiters)
+            if header is None:
+                header = sniffer.has_header(sample)
 
-        with open(path, newline="") as fd:
+            fd.seek(0)
             if header:
                 reader = csv.DictReader(fd, dialect=dialect)
             else:
                 reader = csv.reader(fd, dialect=dialect)
-            rows = list(reader)
+        except Exception:
+            fd.close()
+            raise
 
-        table = Table(rows, columns)
-        notebook_table(self.table_head(table, 10))
-        return table
+        return Tables._iter_csv_reader(fd, reader)
+
+    @staticmethod
+    def _iter_csv_reader(fd, reader):
+        """Generator for rows from a CSV reader, which closes the file after."""
+        with fd:
+            yield from reader
 
     def write_table_to_csv(self, table, path, header=True, dialect="excel"):
         """Write a table as a CSV file.
@@ -1481,3 +1863,56 @@ class Tables:
 
             for row in table.iter_dicts(with_index=False):
                 writer.writerow(row)
+
+    def write_rows_to_csv(
+        self, rows, path, columns=None, header=True, dialect="excel", append=False
+    ):
+        """Write rows to a CSV file as they are received.
+
+        :param rows:    iterable of rows as dictionaries or lists,
+                        or an iterable of tables
+        :param path:    path to write to
+        :param columns: names of columns, read from the first row if not given
+        :param header:  write columns as header to CSV file
+        :param dialect: the format of output CSV
+        :param append:  add rows to the end of an existing file
+
+        Rows can come from a generator, such as ``Iterate Rows From CSV``
+        or ``Iterate Table From CSV``, so that the whole content never has
+        to be kept in memory. When appending to an existing file that is
+        not empty, the header is not written again.
+
+        Valid ``dialect`` values are ``excel``, ``excel-tab``, and ``unix``.
+        """
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            header = False
+
+        rows = self._iter_csv_rows(rows)
+
+        first = next(rows, None)
+        if columns is None and is_dict_like(first):
+            columns = list(first.keys())
+        if first is not None:
+            rows = chain([first], rows)
+
+        with open(path, mode="a" if append else "w", newline="") as fd:
+            writer = csv.writer(fd, dialect=dialect)
+
+            if header and columns:
+                writer.writerow(columns)
+
+            for row in rows:
+                if is_dict_like(row):
+                    if columns is None:
+                        raise ValueError("Columns required for dictionary rows")
+                    row = [row.get(column) for column in columns]
+                writer.writerow(row)
+
+    @staticmethod
+    def _iter_csv_rows(rows):
+        """Iterate rows from given rows, or rows of given tables."""
+        for row in rows:
+            if isinstance(row, Table):
+                yield from row.iter_dicts(with_index=False)
+            else:
+                yield row
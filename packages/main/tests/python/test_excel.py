@@ -268,3 +268,77 @@ def test_set_worksheet_value(library):
 def test_insert_image_to_worksheet(library):
     library.insert_image_to_worksheet(10, "B", "tests/resources/faces.jpeg", scale=4)
     library.save_workbook(BytesIO())
+
+
+def test_iterate_worksheet(library):
+    rows = library.iterate_worksheet("Second", header=True)
+    assert next(rows)["Index"] == 1
+    assert len(list(rows)) == 8
+
+
+def test_iterate_worksheet_chunks(library):
+    chunks = list(library.iterate_worksheet("First", chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert chunks[0][2]["B"] == "Mara"
+
+
+@pytest.mark.parametrize(
+    "filename", [r"tests/resources/example.xlsx", r"tests/resources/example.xls"]
+)
+def test_open_workbook_read_only(filename):
+    expected = Files()
+    expected.open_workbook(filename)
+
+    library = Files()
+    library.open_workbook(filename, read_only=True)
+    try:
+        assert library.read_worksheet("First") == expected.read_worksheet("First")
+        data = library.read_worksheet("Second", header=True)
+        assert len(data) == 9
+        assert data[5]["Date"] == datetime.datetime(2015, 5, 21)
+    finally:
+        library.close_workbook()
+        expected.close_workbook()
+
+
+def test_set_worksheet_value_buffered_xls():
+    library = Files()
+    library.open_workbook("tests/resources/example.xls")
+    book = library.workbook._book
+
+    for row in range(11, 21):
+        library.set_worksheet_value(row, "A", row)
+    library.append_rows_to_worksheet([{"A": "last"}])
+
+    # Changes are only parsed when the content is read
+    assert library.workbook._book is book
+
+    data = library.read_worksheet()
+    assert library.workbook._book is not book
+    assert [row["A"] for row in data[10:]] == list(range(11, 21)) + ["last"]
+
+    fd = BytesIO()
+    library.save_workbook(fd)
+    assert library.workbook.extension == ".xls"
+
+
+def test_get_cell_values(library):
+    values = library.get_cell_values("A3:C4", name="First")
+    assert values == [[2, "Mara", "Hashimoto"], [3, "Philip", "Gent"]]
+
+    table = library.get_cell_values("B3:C4", name="First", as_table=True)
+    assert isinstance(table, Table)
+    assert table.columns == ["B", "C"]
+    assert table[1, "C"] == "Gent"
+
+
+def test_set_cell_values(library):
+    library.set_cell_values("B12", [["one", "two"], ["three", 4]])
+    assert library.get_cell_values("B12:C13") == [["one", "two"], ["three", 4]]
+
+    table = Table([{"x": 1, "y": 2}, {"x": 3, "y": 4}])
+    library.set_cell_values("E20:F22", table, header=True)
+    assert library.get_cell_values("E20:F22") == [["x", "y"], [1, 2], [3, 4]]
+
+    with pytest.raises(ValueError):
+        library.set_cell_values("A1:B1", [[1, 2, 3]])
@@ -1,6 +1,13 @@
 import pytest
 from pathlib import Path
-from RPA.Images import Images, TemplateMatcher, Region, HAS_OPENCV, to_image
+from RPA.Images import (
+    Images,
+    TemplateMatcher,
+    Region,
+    HAS_NUMPY,
+    HAS_OPENCV,
+    to_image,
+)
 
 IMAGES = Path(__file__).resolve().parent / ".." / "resources" / "images"
 
@@ -79,6 +86,35 @@ def test_find_template(region_and_template):
     assert match.center == region.center
 
 
+@pytest.mark.skipif(not HAS_NUMPY, reason="Test requires numpy support")
+def test_find_template_numpy(region_and_template):
+    region, template = region_and_template
+    region = Region(*region)
+
+    library = Images()
+    library.matcher = TemplateMatcher(opencv=False)
+
+    matches = library.find_template_in_image(
+        image=IMAGES / "source.png", template=IMAGES / template, tolerance=0.95
+    )
+
+    assert len(matches) == 1
+    match = matches[0]
+    assert match.center == region.center
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="Test requires numpy support")
+def test_find_template_numpy_exact():
+    image = to_image(IMAGES / "source.png").convert("RGB")
+    template = image.crop((100, 100, 180, 150))
+
+    library = Images()
+    library.matcher = TemplateMatcher(opencv=False)
+
+    matches = library.find_template_in_image(image=image, template=template)
+    assert matches == [Region(100, 100, 180, 150)]
+
+
 @pytest.mark.skipif(not HAS_OPENCV, reason="Test requires opencv support")
 def test_wait_template(region_and_template):
     _, template = region_and_template
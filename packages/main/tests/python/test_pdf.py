@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 
 import pytest
+from PyPDF2 import PdfFileReader
 from RPA.PDF import PDF
 
 RESOURCE_DIR = Path(__file__).resolve().parent / ".." / "resources"
@@ -174,3 +175,201 @@ def test_get_texts_from_area(library):
     assert len(items) == len(expected)
     for item in items:
         assert item.text in expected
+
+
+def test_get_text_parses_only_requested_pages(library):
+    text = library.get_text_from_pdf(PYTEST_PDF, pages="7")
+    assert list(text.keys()) == [7]
+    assert list(library.rpa_pdf_document.get_pages().keys()) == [7]
+
+    library.get_text_from_pdf(pages=[2, 7])
+    assert list(library.rpa_pdf_document.get_pages().keys()) == [2, 7]
+
+
+def test_get_value_from_anchor_parses_only_given_page(library):
+    library.open_pdf_document(PYTEST_PDF)
+    library.get_value_from_anchor("text:does not exist", pagenum=3)
+    assert list(library.rpa_pdf_document.get_pages().keys()) == [3]
+
+
+def test_get_text_from_pdf_with_workers(library):
+    expected = PDF().get_text_from_pdf(PYTEST_PDF)
+    text = library.get_text_from_pdf(PYTEST_PDF, workers=3)
+    assert text == expected
+    assert len(library.rpa_pdf_document.get_pages()) == 9
+
+
+def test_get_text_from_pdfs(library):
+    texts = library.get_text_from_pdfs([INVOICE_PDF, VERO_PDF], workers=2)
+    assert list(texts.keys()) == [str(INVOICE_PDF), str(VERO_PDF)]
+    assert "INV-3337" in texts[str(INVOICE_PDF)][1]
+    assert len(texts[str(VERO_PDF)]) == 2
+
+    texts = library.get_text_from_pdfs(str(RESOURCE_DIR / "vero*.pdf"), pages=[1])
+    assert len(texts) == 2
+    assert all(list(pages.keys()) == [1] for pages in texts.values())
+
+
+def test_textbox_index(library):
+    library.open_pdf_document(INVOICE_PDF)
+    library.parse_pdf()
+    page = library.rpa_pdf_document.get_page(1)
+    index = page.get_textbox_index()
+    textboxes = list(page.get_textboxes().values())
+
+    assert [item.text for item in index.find_by_text("DUE DATE")] == ["Due Date"]
+    assert index.find_by_top(high=400) == [
+        item for item in textboxes if item.top <= 400
+    ]
+    assert index.find_by_bottom(400, 600) == [
+        item for item in textboxes if 400 <= item.bottom <= 600
+    ]
+
+    library.replace_text("Due Date", "Deadline")
+    assert page.get_textbox_index().find_by_text("due date") == []
+    assert len(page.get_textbox_index().find_by_text("deadline")) == 1
+
+
+def test_get_pdf_xml_dump_only_when_requested(library):
+    library.parse_pdf(INVOICE_PDF)
+    assert library.rpa_pdf_parser.device.outfp is None
+
+    xml = library.dump_pdf_as_xml()
+    assert xml.count("<pages>") == 1
+    assert xml.endswith("</pages>\n")
+    assert xml == PDF().dump_pdf_as_xml(INVOICE_PDF)
+
+
+def test_parse_pdf_with_cache(tmp_path):
+    library = PDF(cache_dir=tmp_path)
+    expected = library.get_text_from_pdf(VERO_PDF, details=True)
+    assert len(list(tmp_path.glob("*/[0-9].json"))) == 2
+
+    cached = PDF(cache_dir=tmp_path)
+    text = cached.get_text_from_pdf(VERO_PDF, pages=[1, 2], details=True)
+    # Cached pages are loaded without reading the document
+    assert cached.rpa_pdf_parser.source_document is None
+    for pagenum, textboxes in text.items():
+        assert [box.text for box in textboxes] == [
+            box.text for box in expected[pagenum]
+        ]
+        assert [box.bbox for box in textboxes] == [
+            box.bbox for box in expected[pagenum]
+        ]
+
+    anchor = "text:" + expected[1][0].text
+    value = library.get_value_from_anchor(anchor, direction="bottom")
+    assert value is not None
+    assert cached.get_value_from_anchor(anchor, direction="bottom").text == value.text
+
+
+def test_invalid_cache_is_ignored(tmp_path):
+    library = PDF(cache_dir=tmp_path)
+    expected = library.get_text_from_pdf(VERO_PDF)
+    (document,) = tmp_path.glob("*/document.json")
+    document.write_text('{"pag')
+
+    cached = PDF(cache_dir=tmp_path)
+    assert cached.get_text_from_pdf(VERO_PDF) == expected
+    assert not list(tmp_path.glob("*/*.tmp"))
+
+
+def test_html_to_pdf_keeps_state(tmp_path):
+    library = PDF(outdir=str(tmp_path), cache_dir=tmp_path / "cache")
+    library.get_info(VERO_PDF)
+    library.html_to_pdf("<p>first</p>", "first.pdf")
+    library.html_to_pdf("<p>second</p>", "second.pdf")
+
+    assert library.cache_directory == tmp_path / "cache"
+    assert library.output_directory == tmp_path
+    assert str(VERO_PDF) in library.readers
+    assert library.get_number_of_pages(tmp_path / "second.pdf") == 1
+
+
+def test_parser_is_kept_per_document(library):
+    library.get_text_from_pdf(VERO_PDF, pages=[1])
+    parser = library.rpa_pdf_parser
+    page = library.rpa_pdf_document.get_page(1)
+
+    library.get_text_from_pdf(INVOICE_PDF)
+    assert library.rpa_pdf_parser is not parser
+
+    library.switch_to_pdf_document(VERO_PDF)
+    assert library.rpa_pdf_parser is parser
+    assert library.rpa_pdf_document.get_page(1) is page
+
+    library.close_pdf_document(VERO_PDF)
+    assert str(VERO_PDF) not in library.parsers
+    assert str(INVOICE_PDF) in library.parsers
+
+
+def test_reader_is_reused(library):
+    library.get_info(PYTEST_PDF)
+    reader = library.readers[str(PYTEST_PDF)]
+    assert library.get_number_of_pages(PYTEST_PDF) == 9
+    assert not library.is_pdf_encrypted(PYTEST_PDF)
+    library.extract_pages_from_pdf(PYTEST_PDF, TEMP_DIR / "reused.pdf", [1])
+    assert library.readers[str(PYTEST_PDF)] is reader
+    assert len(library.fileobjects) == 1
+
+
+def test_reader_is_invalidated_on_rotate(library):
+    library.page_rotate(1, VERO_PDF, TEMP_DIR / "rotated_twice.pdf")
+    library.page_rotate(1, VERO_PDF, TEMP_DIR / "rotated_twice.pdf")
+    assert library.get_number_of_pages(TEMP_DIR / "rotated_twice.pdf") == 2
+    assert (
+        library.readers[str(TEMP_DIR / "rotated_twice.pdf")].getPage(1)["/Rotate"] == 90
+    )
+
+
+def test_page_operations(library):
+    target_pdf = TEMP_DIR / "operations.pdf"
+    library.start_page_operations(VERO_PDF)
+    library.select_pages("2,1")
+    library.rotate_pages(1)
+    library.rotate_pages([1, 2], clockwise=False, angle=180)
+    library.append_pdf_pages(INVOICE_PDF)
+    library.overlay_image_on_pages(RESOURCE_DIR / "faces.jpeg", pages=[3])
+    library.encrypt_pages("secret")
+    library.write_page_operations(target_pdf)
+
+    assert library.get_number_of_pages(VERO_PDF) == 2
+    assert not library.readers[str(VERO_PDF)].getPage(1).get("/Rotate")
+
+    reader = PdfFileReader(str(target_pdf))
+    assert reader.isEncrypted
+    reader.decrypt("secret")
+    assert reader.getNumPages() == 3
+    assert [reader.getPage(i).get("/Rotate", 0) for i in range(3)] == [270, 180, 0]
+    assert "(sivu 2/2)" in reader.getPage(0).extractText()
+    assert "/XObject" in reader.getPage(2)["/Resources"]
+
+    with pytest.raises(ValueError):
+        library.select_pages([1])
+
+
+def test_page_operations_duplicate_page(library):
+    target_pdf = TEMP_DIR / "operations_duplicate.pdf"
+    library.start_page_operations(VERO_PDF)
+    library.select_pages("1,1")
+    library.rotate_pages(1)
+    library.overlay_image_on_pages(RESOURCE_DIR / "faces.jpeg", pages=[2])
+    library.write_page_operations(target_pdf)
+
+    reader = PdfFileReader(str(target_pdf))
+    assert reader.getNumPages() == 2
+    assert [reader.getPage(i).get("/Rotate", 0) for i in range(2)] == [90, 0]
+    images = [len(reader.getPage(i)["/Resources"]["/XObject"]) for i in range(2)]
+    assert images[1] == images[0] + 1
+
+
+def test_page_operations_invalid_page(library):
+    library.start_page_operations(VERO_PDF)
+    with pytest.raises(ValueError):
+        library.rotate_pages([3])
+
+
+def test_add_image_to_pdf(library):
+    target_pdf = TEMP_DIR / "image_added.pdf"
+    library.add_image_to_pdf(RESOURCE_DIR / "faces.jpeg", INVOICE_PDF, target_pdf)
+    assert library.get_number_of_pages(target_pdf) == 1
@@ -5,7 +5,10 @@ import pytest
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from RPA.Robocloud.Items import BaseAdapter, FileAdapter, Items
+from unittest import mock
+from urllib3.fields import RequestField
+from urllib3.filepost import encode_multipart_formdata
+from RPA.Robocloud.Items import BaseAdapter, FileAdapter, Items, RobocorpAdapter
 
 
 VARIABLES_FIRST = {"username": "testguy", "address": "guy@company.com"}
@@ -424,6 +427,29 @@ class TestLibrary:
             paths = library.get_work_item_files("*.pdf", outdir)
             assert len(paths) == 0
 
+    def test_transfer_files_concurrently(self, library, monkeypatch):
+        monkeypatch.setattr(MockAdapter, "MAX_TRANSFERS", 4)
+        library.load_work_item("workspace-id", "workitem-id-second")
+
+        with tempfile.TemporaryDirectory() as outdir:
+            names = [f"new{index}.txt" for index in range(10)]
+            for name in names:
+                with open(os.path.join(outdir, name), "w") as fd:
+                    fd.write(name)
+
+            library.add_work_item_files(os.path.join(outdir, "*.txt"))
+            library.save_work_item()
+            for name in names:
+                assert MockAdapter.FILES[name] == name.encode()
+
+        with tempfile.TemporaryDirectory() as outdir:
+            paths = library.get_work_item_files("*.txt", outdir)
+            expected = ["file1.txt", "file2.txt"] + names
+            assert [os.path.basename(path) for path in paths] == expected
+            for name, path in zip(expected, paths):
+                with open(path, "rb") as fd:
+                    assert fd.read() == MockAdapter.FILES[name]
+
 
 class TestFileAdapter:
     @pytest.fixture
@@ -453,3 +479,160 @@ class TestFileAdapter:
     def test_add_file(self, adapter):
         adapter.add_file("secondfile2.txt", b"somedata")
         assert os.path.isfile(Path(adapter.path).parent / "secondfile2.txt")
+
+
+class MockSession:
+    """Fake HTTP session for Robocorp work item API and S3."""
+
+    FIELDS = {"key": "upload/path", "policy": "c2lnbmVk"}
+
+    def __init__(self, files):
+        self.files = dict(files)
+        self.requests = []
+        self.uploads = []
+
+    def _response(self, data=None, content=b""):
+        response = mock.MagicMock(ok=True, status_code=200, content=content)
+        response.json.return_value = data
+        response.iter_content.return_value = [content[:2], content[2:]]
+        response.__enter__.return_value = response
+        return response
+
+    def get(self, url, **kwargs):
+        self.requests.append(("GET", url))
+        if url.endswith("/files"):
+            return self._response(
+                [{"fileName": name, "fileId": f"id-{name}"} for name in self.files]
+            )
+        if url.startswith("https://s3/"):
+            return self._response(content=self.files[url[len("https://s3/") :]])
+        return self._response({"url": "https://s3/" + url.split("/id-")[-1]})
+
+    def post(self, url, **kwargs):
+        self.requests.append(("POST", url))
+        if url.endswith("/files"):
+            info = json.loads(kwargs["data"])
+            self.files[info["fileName"]] = b""
+            return self._response({"url": "https://s3/upload", "fields": self.FIELDS})
+        body = kwargs["data"]
+        self.uploads.append((kwargs["headers"], len(body), body.read()))
+        return self._response()
+
+    def delete(self, url, **kwargs):
+        self.requests.append(("DELETE", url))
+        del self.files[url.split("/id-")[-1]]
+        return self._response({})
+
+
+class TestRobocorpAdapter:
+    @pytest.fixture
+    def adapter(self, monkeypatch):
+        monkeypatch.setenv("RC_API_WORKITEM_HOST", "https://api.host")
+        monkeypatch.setenv("RC_API_WORKITEM_TOKEN", "token")
+        adapter = RobocorpAdapter(workspace_id="1", item_id="2")
+        adapter.session = MockSession(VALID_FILES)
+        yield adapter
+
+    def listings(self, adapter):
+        return [
+            url
+            for method, url in adapter.session.requests
+            if method == "GET" and url.endswith("/files")
+        ]
+
+    def test_session_retries(self, monkeypatch):
+        monkeypatch.setenv("RC_API_WORKITEM_HOST", "https://api.host")
+        monkeypatch.setenv("RC_API_WORKITEM_TOKEN", "token")
+        adapter = RobocorpAdapter(workspace_id="1", item_id="2")
+
+        retries = adapter.session.get_adapter("https://api.host").max_retries
+        assert retries.total == RobocorpAdapter.RETRY_TOTAL
+        assert 503 in retries.status_forcelist
+
+    def test_get_file_cached_id(self, adapter):
+        assert adapter.list_files() == list(VALID_FILES)
+        assert adapter.get_file("file1.txt") == b"data1"
+        assert adapter.get_file("file2.txt") == b"data2"
+        assert len(self.listings(adapter)) == 1
+
+    def test_get_file_lists_unknown(self, adapter):
+        assert adapter.get_file("file3.png") == b"data3"
+        assert len(self.listings(adapter)) == 1
+
+        with pytest.raises(FileNotFoundError):
+            adapter.get_file("file4.txt")
+        assert len(self.listings(adapter)) == 2
+
+    def test_remove_file_cached_id(self, adapter):
+        adapter.list_files()
+        adapter.remove_file("file1.txt")
+        assert "file1.txt" not in adapter.session.files
+
+        with pytest.raises(FileNotFoundError):
+            adapter.remove_file("file1.txt")
+        assert len(self.listings(adapter)) == 2
+
+    def test_file_id_path_name(self, adapter):
+        adapter.list_files()
+        assert adapter.get_file(Path("file1.txt")) == b"data1"
+        assert len(self.listings(adapter)) == 1
+
+        adapter.remove_file(Path("file1.txt"))
+        assert "file1.txt" not in adapter._file_ids
+
+        with pytest.raises(FileNotFoundError):
+            adapter.get_file(Path("file1.txt"))
+        assert len(self.listings(adapter)) == 2
+
+    def test_add_file_resolves_id(self, adapter):
+        adapter.list_files()
+        adapter.add_file("new.txt", b"content")
+        adapter.session.files["new.txt"] = b"content"
+
+        assert adapter.get_file("new.txt") == b"content"
+        assert len(self.listings(adapter)) == 2
+
+    def test_add_file_from_path_streamed(self, adapter):
+        content = os.urandom(4096)
+        with temp_filename(content) as path:
+            adapter.add_file_from_path('my "new".bin', path)
+
+        headers, length, body = adapter.session.uploads[0]
+        boundary = headers["Content-Type"].split("boundary=")[-1]
+        # File part as encoded by requests, i.e. without content type
+        field = RequestField(name="file", data=content, filename='my "new".bin')
+        field.make_multipart()
+        fields = list(MockSession.FIELDS.items()) + [field]
+
+        expected, _ = encode_multipart_formdata(fields, boundary=boundary)
+        assert body == expected
+        assert length == len(expected)
+
+    def test_get_file_to_path_streamed(self, adapter):
+        with temp_filename() as path:
+            adapter.get_file_to_path("file2.txt", path)
+            with open(path, "rb") as fd:
+                assert fd.read() == b"data2"
+
+    def test_get_file_to_path_interrupted(self, adapter, tmp_path):
+        def iter_content(chunk_size):
+            yield b"da"
+            raise ConnectionError("Connection lost")
+
+        session_get = adapter.session.get
+
+        def get(url, **kwargs):
+            response = session_get(url, **kwargs)
+            if url.startswith("https://s3/"):
+                response.iter_content.side_effect = iter_content
+            return response
+
+        adapter.session.get = get
+
+        path = tmp_path / "file2.txt"
+        path.write_bytes(b"previous")
+        with pytest.raises(ConnectionError):
+            adapter.get_file_to_path("file2.txt", str(path))
+
+        assert path.read_bytes() == b"previous"
+        assert os.listdir(tmp_path) == ["file2.txt"]
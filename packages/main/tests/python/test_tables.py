@@ -1,10 +1,11 @@
 import os
 import tempfile
+from array import array
 from collections import namedtuple, OrderedDict
 from pathlib import Path
 
 import pytest
-from RPA.Tables import Table, Tables
+from RPA.Tables import ColumnarTable, Table, Tables
 
 
 RESOURCES = Path(__file__).parent / ".." / "resources"
@@ -48,10 +49,17 @@ def library():
     return Tables()
 
 
-@pytest.fixture(params=DATA_FIXTURE)
+TABLE_FIXTURE = {"rows": Table, "columnar": ColumnarTable}
+
+
+@pytest.fixture(
+    params=[(data, kind) for data in DATA_FIXTURE for kind in TABLE_FIXTURE],
+    ids=lambda param: "-".join(param),
+)
 def table(request):
-    data, columns = DATA_FIXTURE[request.param]
-    return Table(data, columns)
+    data, kind = request.param
+    data, columns = DATA_FIXTURE[data]
+    return TABLE_FIXTURE[kind](data, columns)
 
 
 def test_table_columns(table):
@@ -92,6 +100,36 @@ def test_table_append_rows_index(table):
     assert table.index[-1] == 8
 
 
+class NoScanList(list):
+    """List which fails on linear membership checks."""
+
+    def __contains__(self, value):
+        raise AssertionError(f"Linear scan for: {value}")
+
+
+def test_table_append_without_scans(table):
+    table._index = NoScanList(table._index)
+    table._columns = NoScanList(table._columns)
+
+    table.append_row({"one": 1})
+    table.append_row({"two": 2}, index="named")
+    table.append_rows([{"three": 3}, {"four": 4}])
+    table.append_column("five", values=range(len(table)))
+    table.set_cell("new", "six", 6)
+
+    assert len(table) == 11
+    assert table.columns == ["one", "two", "three", "four", "five", "six"]
+    assert table.get_cell("named", "two") == 2
+    assert table.get_cell("new", "six") == 6
+
+    with pytest.raises(IndexError):
+        table.append_row({"one": 1}, index="named")
+    with pytest.raises(ValueError):
+        table.append_column("five")
+    with pytest.raises(ValueError):
+        table.append_table(Table([{"one": 1}], index=["named"]))
+
+
 def test_table_invalid_column(table):
     with pytest.raises(ValueError):
         table.get_column("not_exist")
@@ -519,3 +557,181 @@ def test_columns_and_index_without_data():
     index = ["one", "two", "three"]
     table = Table(data, columns=columns, index=index)
     assert table.dimensions == (3, 3)
+
+
+def test_table_location_after_modifications():
+    table = Table(DATA_DICT, index=["a", "b", "c", "d", "e", "f"])
+    assert table.index_location("c") == 2
+    assert table.column_location("three") == 2
+
+    table.delete_rows(["a", "b"])
+    assert table.index_location("c") == 0
+    assert table.get_cell("e", "four") == 4
+
+    table.delete_columns("one")
+    assert table.column_location("three") == 1
+
+    table.columns = ["x", "y", "z"]
+    assert table.column_location("z") == 2
+    with pytest.raises(ValueError):
+        table.column_location("three")
+
+    table.append_row({"x": "new"}, index="g")
+    assert table.index_location("g") == 4
+    assert table.get_cell("g", "x") == "new"
+
+
+def test_table_sort_keeps_named_index():
+    table = Table({"value": [3, 1, 2]}, index=["c", "a", "b"])
+    table.sort_by_column("value", ascending=True)
+    assert table.index == ["a", "b", "c"]
+    assert table.get_cell("a", "value") == 1
+    assert table.get_cell("c", "value") == 3
+
+
+def test_columnar_table_typed_columns():
+    table = ColumnarTable({"int": [1, 2, 3], "float": [0.5, 1.5, 2.5], "str": "a"})
+    assert table.get_column("int", as_list=True) == [1, 2, 3]
+    assert table == Table({"int": [1, 2, 3], "float": [0.5, 1.5, 2.5], "str": "a"})
+
+    table.set_cell(1, "int", "two")
+    table.append_row({"float": 3.5})
+    assert table.get_column("int", as_list=True) == [1, "two", 3, None]
+    assert table.get_column("float", as_list=True) == [0.5, 1.5, 2.5, 3.5]
+
+    table.sort_by_column("float")
+    assert table.get_column("float", as_list=True) == [3.5, 2.5, 1.5, 0.5]
+    assert table.get_column("int", as_list=True) == [None, 3, "two", 1]
+
+
+def test_columnar_table_typed_nulls():
+    table = ColumnarTable({"int": [1, 2, 3], "float": [0.5, 1.5, 2.5]})
+    table.append_row()
+    table.set_cell(3, "float", 3.5)
+    table.set_cell(0, "float", None)
+    assert isinstance(table._data[0], array)
+    assert isinstance(table._data[1], array)
+    assert table.get_column("int", as_list=True) == [1, 2, 3, None]
+    assert table.get_column("float", as_list=True) == [None, 1.5, 2.5, 3.5]
+    assert table.data == [[1, None], [2, 1.5], [3, 2.5], [None, 3.5]]
+
+    table.sort_by_column("int", ascending=False)
+    assert table.get_column("int", as_list=True) == [3, 2, 1, None]
+    assert table.get_column("float", as_list=True) == [2.5, 1.5, None, 3.5]
+
+    table.filter_by_column("float", lambda value: value != 2.5)
+    assert table.get_column("int", as_list=True) == [2, 1, None]
+    assert table.get_column("float", as_list=True) == [1.5, None, 3.5]
+
+    table.set_cell(3, "int", 4)
+    assert table.get_column("int", as_list=True) == [2, 1, 4]
+    assert isinstance(table._data[0], array)
+
+
+def test_keyword_create_table_columnar(library):
+    table = library.create_table(DATA_DICT, columnar=True)
+    assert isinstance(table, ColumnarTable)
+    assert table.dimensions == (6, 4)
+    assert table[2] == [1, 2, None, 4]
+
+
+def test_keyword_read_table_from_csv_columnar(library):
+    table = library.read_table_from_csv(RESOURCES / "easy.csv", columnar=True)
+    assert isinstance(table, ColumnarTable)
+    assert table == library.read_table_from_csv(RESOURCES / "easy.csv")
+
+
+def test_table_delete_rows(table):
+    table.delete_rows([5, 0, 3])
+    assert table.index == [1, 2, 4]
+    assert table[1] == ["a", "b", "c", None]
+    assert table.get_cell(4, "four") == 4
+
+    with pytest.raises(ValueError):
+        table.delete_rows([1, 7])
+    assert len(table) == 3
+
+
+def test_merge_tables_how(library):
+    prices = {"Name": ["Egg", "Cheese", "Ham"], "Price": [10.0, 15.0, 20.0]}
+    stock = {"Name": ["Egg", "Cheese", "Spider"], "Stock": [12, 99, 1]}
+
+    merged = library.merge_tables(
+        Table(prices), Table(stock), index="Name", how="inner"
+    )
+    assert merged[None, "Name"] == ["Egg", "Cheese"]
+    assert merged.get_row(1) == {"Name": "Cheese", "Price": 15.0, "Stock": 99}
+
+    merged = library.merge_tables(Table(prices), Table(stock), index="Name", how="left")
+    assert merged[None, "Name"] == ["Egg", "Cheese", "Ham"]
+    assert merged.get_row(2) == {"Name": "Ham", "Price": 20.0, "Stock": None}
+
+    with pytest.raises(ValueError):
+        library.merge_tables(Table(prices), Table(stock), index="Name", how="cross")
+
+
+def test_merge_tables_multiple_keys(library):
+    first = {"Name": ["Egg", "Egg", "Ham"], "Size": ["S", "L", "S"], "Price": [1, 2, 3]}
+    second = {"Name": ["Egg", "Ham"], "Size": ["L", "L"], "Stock": [10, 20]}
+
+    merged = library.merge_tables(Table(first), Table(second), index=["Name", "Size"])
+    assert len(merged) == 4
+    assert merged.get_row(1) == {"Name": "Egg", "Size": "L", "Price": 2, "Stock": 10}
+    assert merged.get_row(3) == {"Name": "Ham", "Size": "L", "Price": None, "Stock": 20}
+
+    with pytest.raises(ValueError):
+        library.merge_tables(Table(first), Table(second), index=["Name", "Price"])
+
+
+def test_keyword_iterate_table_from_csv(library):
+    chunks = list(
+        library.iterate_table_from_csv(
+            RESOURCES / "hard.csv", chunk_size=30, dialect="excel", header=True
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert chunks[1].index[0] == 30
+    assert chunks[-1].columns[0] == "Region"
+
+    table = library.read_table_from_csv(
+        RESOURCES / "hard.csv", dialect="excel", header=True
+    )
+    assert chunks[-1][-1] == table[-1]
+
+    with pytest.raises(ValueError):
+        library.iterate_table_from_csv(RESOURCES / "hard.csv", chunk_size=0)
+
+
+def test_keyword_iterate_rows_from_csv(library):
+    rows = library.iterate_rows_from_csv(RESOURCES / "easy.csv")
+    assert next(rows) == {"first": "1", "second": "2", "third": "3"}
+    assert len(list(rows)) == 2
+
+
+def test_keyword_iterate_rows_from_csv_errors(library):
+    with pytest.raises(FileNotFoundError):
+        library.iterate_rows_from_csv(RESOURCES / "not-a-file.csv")
+    with pytest.raises(FileNotFoundError):
+        library.iterate_table_from_csv(RESOURCES / "not-a-file.csv")
+
+
+def test_keyword_write_rows_to_csv(library, table):
+    path = None
+    data = None
+
+    with tempfile.NamedTemporaryFile() as fd:
+        path = fd.name
+
+    try:
+        library.write_rows_to_csv(table.iter_dicts(with_index=False), path)
+        library.write_rows_to_csv([table, table], path, append=True)
+        library.write_rows_to_csv(iter([["x", "y"]]), path, append=True)
+        with open(path) as fd:
+            data = fd.readlines()
+    finally:
+        os.unlink(path)
+
+    assert len(data) == 20
+    assert data[0] == "one,two,three,four\n"
+    assert data[1] == "1,2,3,\n"
+    assert data[-1] == "x,y\n"
@@ -1,8 +1,23 @@
+import hashlib
 import logging
-from collections import defaultdict
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Union, Dict, List, Generator, Optional
+from typing import (
+    Any,
+    Sequence,
+    Union,
+    Dict,
+    List,
+    Generator,
+    Optional,
+    Tuple,
+)
 
 import pytesseract
 from pytesseract import TesseractNotFoundError
@@ -22,6 +37,65 @@ INSTALL_PROMPT = (
 
 DEFAULT_CONFIDENCE = 80.0
 
+# Approximate size of OCR results kept in memory, by image content
+CACHE_BYTES = 16 * 1024 * 1024
+# Approximate size of row hashes and results of previous images,
+# which are compared to new images to only scan the areas which have changed
+REFERENCE_BYTES = 4 * 1024 * 1024
+# Changed area is expanded vertically by this many pixels,
+# so that text is not cut from its edges
+CHANGE_MARGIN = 8
+# Maximum share of image height which is scanned incrementally,
+# larger changes are scanned as a whole
+CHANGE_MAX_RATIO = 0.5
+
+# Maximum number of tesseract processes used for scanning a batch of regions
+BATCH_WORKERS = os.cpu_count() or 1
+
+
+class _Cache:
+    """Least recently used mapping, which is limited by the approximate
+    size of its values in bytes and can be shared between threads.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Any:
+        """Return cached value, or None if not found."""
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def set(self, key: Tuple, value: Any):
+        size = _sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self._bytes -= self._items.pop(key)[1]
+            self._items[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, removed) = self._items.popitem(last=False)
+                self._bytes -= removed
+
+    def values(self) -> List[Any]:
+        with self._lock:
+            return [value for value, _ in self._items.values()]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+
+_CACHE = _Cache(CACHE_BYTES)
+_REFERENCES = _Cache(REFERENCE_BYTES)
+
 
 def read(image: Union[Image.Image, Path]):
     """Scan image for text and return it as one string.
@@ -30,10 +104,16 @@ def read(image: Union[Image.Image, Path]):
     """
     image = to_image(image)
 
-    try:
-        return pytesseract.image_to_string(image).strip()
-    except TesseractNotFoundError as err:
-        raise EnvironmentError(INSTALL_PROMPT) from err
+    key = ("string", _digest(image))
+    text = _CACHE.get(key)
+    if text is None:
+        try:
+            text = pytesseract.image_to_string(image).strip()
+        except TesseractNotFoundError as err:
+            raise EnvironmentError(INSTALL_PROMPT) from err
+        _CACHE.set(key, text)
+
+    return text
 
 
 def find(
@@ -60,12 +140,7 @@ def find(
         region = geometry.to_region(region)
         image = image.crop(region.as_tuple())
 
-    try:
-        data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-    except TesseractNotFoundError as err:
-        raise EnvironmentError(INSTALL_PROMPT) from err
-
-    lines = _dict_lines(data)
+    lines = _scan_lines(image)
     matches = _match_lines(lines, text, confidence)
 
     if region is not None:
@@ -75,6 +150,248 @@ def find(
     return matches
 
 
+def read_regions(
+    image: Union[Image.Image, Path], regions: Sequence[Region]
+) -> List[str]:
+    """Scan multiple regions of an image for text, and return
+    the text of each region as one string.
+
+    All regions are scanned with as few tesseract runs as possible,
+    which are run in parallel.
+
+    :param image: Path to image or Image object
+    :param regions: Regions to scan
+    """
+    image = to_image(image)
+    crops = [image.crop(geometry.to_region(region).as_tuple()) for region in regions]
+    return _scan_batch(crops, "string")
+
+
+def find_regions(
+    image: Union[Image.Image, Path],
+    text: str,
+    regions: Sequence[Region],
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> List[List[Dict]]:
+    """Scan multiple regions of an image for text, and return
+    a list of regions that contain it for each scanned region.
+
+    All regions are scanned with as few tesseract runs as possible,
+    which are run in parallel.
+
+    :param image: Path to image or Image object
+    :param text: Text to find in image
+    :param regions: Regions to scan
+    :param confidence: Minimum confidence for text similarity
+    """
+    image = to_image(image)
+    confidence = clamp(1, float(confidence), 100)
+
+    text = str(text).strip()
+    if not text:
+        raise ValueError("Empty search string")
+
+    regions = [geometry.to_region(region) for region in regions]
+    crops = [image.crop(region.as_tuple()) for region in regions]
+
+    results = []
+    for region, lines in zip(regions, _scan_batch(crops, "lines")):
+        matches = _match_lines(lines, text, confidence)
+        for match in matches:
+            match["region"] = match["region"].move(region.left, region.top)
+        results.append(matches)
+
+    return results
+
+
+def clear_cache():
+    """Remove all cached OCR results from memory."""
+    _CACHE.clear()
+    _REFERENCES.clear()
+
+
+def _digest(image: Image.Image) -> Tuple:
+    """Key for image content, which ignores the image source."""
+    content = hashlib.sha1(image.tobytes()).hexdigest()
+    return (content, image.size, image.mode)
+
+
+def _row_digests(image: Image.Image) -> List[bytes]:
+    """Short hash of each pixel row, for finding the changed rows
+    between images without keeping the previous image in memory.
+    """
+    data = image.tobytes()
+    stride = len(data) // image.height if image.height else 1
+    return [
+        hashlib.blake2b(data[offset : offset + stride], digest_size=8).digest()
+        for offset in range(0, len(data), stride)
+    ]
+
+
+def _sizeof(value: Any) -> int:
+    """Approximate memory usage of a cached value in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_sizeof(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_sizeof(item) for item in value)
+    return size
+
+
+def _image_to_lines(image: Image.Image) -> List:
+    try:
+        data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+    except TesseractNotFoundError as err:
+        raise EnvironmentError(INSTALL_PROMPT) from err
+
+    return _dict_lines(data)
+
+
+def _scan_batch(images: List[Image.Image], kind: str) -> List[Any]:
+    """Scan images for either strings or lines of words. Images are combined
+    into multi-page files, so that one tesseract run scans many images.
+    """
+    keys = [(kind, _digest(image)) for image in images]
+
+    results = {key: _CACHE.get(key) for key in keys}
+    pending = {key: image for key, image in zip(keys, images) if results[key] is None}
+
+    if pending:
+        batches = [
+            list(pending.items())[index::BATCH_WORKERS]
+            for index in range(min(BATCH_WORKERS, len(pending)))
+        ]
+
+        def scan(batch):
+            return _scan_pages([image for _, image in batch], kind)
+
+        LOGGER.debug("Scanning %d images in %d batches", len(pending), len(batches))
+        with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+            for batch, values in zip(batches, pool.map(scan, batches)):
+                for (key, _), value in zip(batch, values):
+                    results[key] = value
+                    _CACHE.set(key, value)
+
+    return [results[key] for key in keys]
+
+
+def _scan_pages(images: List[Image.Image], kind: str) -> List[Any]:
+    """Scan images as pages of a single TIFF file with one tesseract run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "pages.tiff")
+        pages = [image.convert("RGB") for image in images]
+        pages[0].save(path, save_all=True, append_images=pages[1:])
+
+        try:
+            if kind == "string":
+                output = pytesseract.image_to_string(path)
+            else:
+                output = pytesseract.image_to_data(
+                    path, output_type=pytesseract.Output.DICT
+                )
+        except TesseractNotFoundError as err:
+            raise EnvironmentError(INSTALL_PROMPT) from err
+
+    if kind == "string":
+        # Each page ends with a form feed character
+        texts = output.split("\f")
+        return [
+            texts[index].strip() if index < len(texts) else ""
+            for index in range(len(images))
+        ]
+
+    rows: Dict[int, Dict[str, List]] = defaultdict(lambda: defaultdict(list))
+    for row in _iter_rows(output):
+        for name, value in row.items():
+            rows[int(row["page_num"])][name].append(value)
+
+    return [_dict_lines(rows[index + 1]) for index in range(len(images))]
+
+
+def _scan_lines(image: Image.Image) -> List:
+    """Scan image for lines of words. Results are cached by image content,
+    and images which differ only partially from a previously scanned image
+    are scanned only in the changed area.
+    """
+    key = ("lines", _digest(image))
+    lines = _CACHE.get(key)
+    if lines is not None:
+        return lines
+
+    image = image.convert("RGB")
+    rows = _row_digests(image)
+
+    best = None
+    for size, reference_rows, reference_lines in _REFERENCES.values():
+        if size == image.size:
+            top, bottom = _changed_band(reference_rows, reference_lines, rows)
+            if best is None or bottom - top < best[1] - best[0]:
+                best = (top, bottom, reference_lines)
+
+    if best is not None and best[1] - best[0] <= CHANGE_MAX_RATIO * image.height:
+        top, bottom, reference_lines = best
+        LOGGER.debug("Scanning changed area between %d and %d", top, bottom)
+
+        # Keep lines from outside the changed area as they were
+        lines = [
+            line
+            for line in reference_lines
+            if _line_bottom(line) <= top or _line_top(line) >= bottom
+        ]
+        if bottom > top:
+            band = image.crop((0, top, image.width, bottom))
+            for line in _image_to_lines(band):
+                for word in line:
+                    word["region"] = word["region"].move(0, top)
+                lines.append(line)
+        lines.sort(key=lambda line: (_line_top(line), line[0]["region"].left))
+    else:
+        lines = _image_to_lines(image)
+
+    _REFERENCES.set(key, (image.size, rows, lines))
+    _CACHE.set(key, lines)
+    return lines
+
+
+def _changed_band(
+    reference_rows: List[bytes], reference_lines: List, rows: List[bytes]
+) -> Tuple[int, int]:
+    """Find the full-width band of the image which has changed from
+    the reference image, and which does not cut any of the reference lines.
+    """
+    changed = [
+        index
+        for index, (reference, row) in enumerate(zip(reference_rows, rows))
+        if reference != row
+    ]
+    if not changed:
+        return (0, 0)
+
+    top = max(changed[0] - CHANGE_MARGIN, 0)
+    bottom = min(changed[-1] + 1 + CHANGE_MARGIN, len(rows))
+
+    expanded = True
+    while expanded:
+        expanded = False
+        for line in reference_lines:
+            line_top, line_bottom = _line_top(line), _line_bottom(line)
+            if line_bottom <= top or line_top >= bottom:
+                continue
+            if line_top < top or line_bottom > bottom:
+                top, bottom = min(top, line_top), max(bottom, line_bottom)
+                expanded = True
+
+    return (top, bottom)
+
+
+def _line_top(line: List[Dict]) -> int:
+    return min(word["region"].top for word in line)
+
+
+def _line_bottom(line: List[Dict]) -> int:
+    return max(word["region"].bottom for word in line)
+
+
 def _dict_lines(data: Dict) -> List:
     lines = defaultdict(list)
     for word in _iter_rows(data):
@@ -108,33 +425,56 @@ def _match_lines(lines: List[Dict], text: str, confidence: float) -> List[Dict]:
     and return resulting bounding boxes and confidences.
 
     A line of N words will be matched to the given text in all 1 to N
-    length sections, in every sequential position.
+    length sections, in every sequential position. Sections which can not
+    reach the required similarity are skipped based on upper bounds,
+    before calculating the actual similarity.
     """
+    # Information about the target text is calculated only once
+    matcher = SequenceMatcher(None, "", text)
+
     matches = []
     for line in lines:
-        match = {}
-
-        for window in range(1, len(line) + 1):
-            for index in range(len(line) - window + 1):
-                words = line[index : index + window]
-                regions = [word["region"] for word in words]
-
-                sentence = " ".join(word["text"] for word in words)
-                ratio = SequenceMatcher(None, sentence, text).ratio() * 100.0
+        best: Optional[Tuple[float, Tuple[int, int]]] = None
+
+        for index in range(len(line)):
+            sentence = ""
+            for end in range(index, len(line)):
+                word = line[end]["text"]
+                sentence = f"{sentence} {word}" if sentence else word
+
+                limit = confidence if best is None else max(confidence, best[0])
+
+                # Similarity can not be higher than the ratio of lengths,
+                # which only decreases after the section is longer than text
+                length = len(sentence) + len(text)
+                bound = 2.0 * min(len(sentence), len(text)) / length * 100.0
+                if bound < limit:
+                    if len(sentence) > len(text):
+                        break
+                    continue
 
-                if ratio < confidence:
+                matcher.set_seq1(sentence)
+                if matcher.quick_ratio() * 100.0 < limit:
                     continue
 
-                if match and match["confidence"] >= ratio:
+                ratio = matcher.ratio() * 100.0
+                if ratio < limit:
                     continue
 
-                match = {
-                    "text": sentence,
-                    "region": Region.merge(regions),
+                # Prefer shorter sections, then earlier sections
+                order = (end - index, index)
+                if best is None or ratio > best[0] or order < best[1]:
+                    best = (ratio, order)
+
+        if best is not None:
+            ratio, (window, index) = best
+            words = line[index : index + window + 1]
+            matches.append(
+                {
+                    "text": " ".join(word["text"] for word in words),
+                    "region": Region.merge([word["region"] for word in words]),
                     "confidence": ratio,
                 }
-
-        if match:
-            matches.append(match)
+            )
 
     return sorted(matches, key=lambda match: match["confidence"], reverse=True)
@@ -1,6 +1,7 @@
+import functools
 import logging
 from pathlib import Path
-from typing import Iterator, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import cv2
 import numpy
@@ -14,19 +15,104 @@ from RPA.recognition.utils import to_image, clamp, log2lin
 DEFAULT_CONFIDENCE = 80.0
 LIMIT_FAILSAFE = 256
 
+# Supported matching modes
+MODES = ("color", "grayscale", "edges")
+
+# Image pyramid limits, the template is never scaled smaller than
+# the minimum size (in pixels) on the coarsest level
+PYRAMID_MAX_LEVELS = 3
+PYRAMID_MIN_SIZE = 16
+# Candidates on the coarsest level are accepted with a lower
+# coefficient, and verified afterwards at full resolution
+PYRAMID_MARGIN = 0.2
+
+# Number of template files kept decoded and preprocessed in memory
+TEMPLATE_CACHE_SIZE = 32
+
+# Number of match candidates checked at once when removing overlapping matches
+SUPPRESS_CHUNK_SIZE = 1024
+
 LOGGER = logging.getLogger(__name__)
 
+# Match as (coefficient, left, top, width, height)
+Match = Tuple[float, int, int, int, int]
+
 
 class ImageNotFoundError(Exception):
     """Raised when template matching fails."""
 
 
+class Template:
+    """Template image, which stores the arrays converted for matching.
+
+    Each variant is created once, so repeated searches with the same
+    mode, scale, or pyramid level do no conversion work.
+    """
+
+    def __init__(self, image: Image.Image):
+        self.image = image
+        self._arrays: Dict[Tuple[str, float, int], numpy.ndarray] = {}
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.image.size
+
+    def array(self, mode: str, scale: float = 1.0, level: int = 0) -> numpy.ndarray:
+        """Template as an opencv array for the given matching mode,
+        scale factor, and image pyramid level.
+        """
+        key = (mode, scale, level)
+        if key not in self._arrays:
+            if level > 0:
+                array = _downscale(self.array(mode, scale, level - 1), 1)
+            elif scale != 1.0:
+                array = _scale(self.array(mode), scale)
+            else:
+                array = _to_array(self.image, mode)
+
+            # Arrays are shared between searches
+            array.setflags(write=False)
+            self._arrays[key] = array
+
+        return self._arrays[key]
+
+
+def to_template(obj: Union[Template, Image.Image, Path, str]) -> Template:
+    """Convert `obj` to a Template. Templates read from files are
+    cached, until the file is modified.
+    """
+    if isinstance(obj, Template):
+        return obj
+    if isinstance(obj, (str, Path)):
+        path = Path(obj).resolve()
+        stat = path.stat()
+        return _open_template(str(path), stat.st_mtime_ns, stat.st_size)
+    return Template(to_image(obj))
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _open_template(path: str, mtime: int, size: int) -> Template:
+    # pylint: disable=unused-argument
+    LOGGER.debug("Reading template: %s", path)
+    image = Image.open(path)
+    image.load()
+    return Template(image)
+
+
+def clear_template_cache():
+    """Remove all cached template files from memory."""
+    _open_template.cache_clear()
+
+
 def find(
     image: Union[Image.Image, Path],
-    template: Union[Image.Image, Path],
+    template: Union[Template, Image.Image, Path],
     region: Optional[Region] = None,
     limit: Optional[int] = None,
     confidence: float = DEFAULT_CONFIDENCE,
+    mode: str = "color",
+    scales: Optional[Sequence[float]] = None,
+    levels: Optional[int] = 0,
 ) -> List[Region]:
     """Attempt to find the template from the given image.
 
@@ -35,12 +121,26 @@ def find(
     :param limit:       Limit returned results to maximum of `limit`.
     :param region:      Area to search from. Can speed up search significantly.
     :param confidence:  Confidence for matching, value between 1 and 100
+    :param mode:        Matching mode, one of "color", "grayscale" or "edges"
+    :param scales:      Template scales to search with, e.g. [1.0, 1.25, 1.5]
+                        for templates captured with a different DPI
+    :param levels:      Number of image pyramid levels for a coarse search,
+                        None to select based on template size, or by default
+                        0 to compare every position at full resolution
     :return:            List of matching regions
     :raises ImageNotFoundError: No match was found
+
+    The coarse search is faster for large templates, but it can miss matches
+    which are only distinguishable at full resolution, e.g. templates with
+    fine details. All positions are compared at full resolution only if the
+    coarse search finds nothing, which is why it is not enabled by default.
     """
+    if mode not in MODES:
+        raise ValueError(f"Unknown matching mode: {mode}")
+
     # Ensure images are in Pillow format
     image = to_image(image)
-    template = to_image(template)
+    template = to_template(template)
 
     # Convert confidence value to tolerance
     tolerance = _to_tolerance(confidence)
@@ -51,12 +151,14 @@ def find(
         image = image.crop(region.as_tuple())
 
     # Verify template still fits in image
-    if template.size[0] > image.size[0] or template.size[1] > image.size[1]:
+    if scales is None and (
+        template.size[0] > image.size[0] or template.size[1] > image.size[1]
+    ):
         raise ValueError("Template is larger than search region")
 
     # Do the actual search
     matches: List[Region] = []
-    for match in _match_template(image, template, tolerance):
+    for match in _match_template(image, template, tolerance, mode, scales, levels):
         matches.append(match)
         if limit is not None and len(matches) >= int(limit):
             break
@@ -87,45 +189,251 @@ def _to_tolerance(confidence):
     return value
 
 
-def _match_template(
-    image: Image.Image, template: Image.Image, tolerance: float
-) -> Iterator[Region]:
-    """Use opencv's matchTemplate() to slide the `template` over
-    `image` to calculate correlation coefficients, and then
-    filter with a tolerance to find all relevant global maximums.
+def _to_array(image: Image.Image, mode: str) -> numpy.ndarray:
+    """Convert Pillow image to an opencv array for the given matching mode."""
+    if mode == "color":
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return cv2.cvtColor(numpy.array(image), cv2.COLOR_RGB2BGR)
+
+    array = numpy.array(image.convert("L"))
+    if mode == "edges":
+        # Gradient magnitude instead of binary edges, as thin edge
+        # lines are easily lost to compression artifacts and scaling
+        array = cv2.GaussianBlur(array, (3, 3), 0)
+        gradient_x = cv2.Sobel(array, cv2.CV_32F, 1, 0)
+        gradient_y = cv2.Sobel(array, cv2.CV_32F, 0, 1)
+        array = cv2.magnitude(gradient_x, gradient_y)
+    return array
+
+
+def _scale(array: numpy.ndarray, scale: float) -> numpy.ndarray:
+    """Resize array with the given scale factor."""
+    if scale == 1.0:
+        return array
+    height, width = array.shape[:2]
+    size = (max(int(round(width * scale)), 1), max(int(round(height * scale)), 1))
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+    return cv2.resize(array, size, interpolation=interpolation)
+
+
+def _pyramid_levels(template: numpy.ndarray) -> int:
+    """Number of pyramid levels, which still keep the template usable."""
+    size = min(template.shape[:2])
+    levels = 0
+    while levels < PYRAMID_MAX_LEVELS and (size >> (levels + 1)) >= PYRAMID_MIN_SIZE:
+        levels += 1
+    return levels
+
+
+def _downscale(array: numpy.ndarray, levels: int) -> numpy.ndarray:
+    """Downscale array by a factor of two for each pyramid level."""
+    for _ in range(levels):
+        array = cv2.pyrDown(array)
+    return array
+
+
+def _fits(image: numpy.ndarray, template: numpy.ndarray) -> bool:
+    return template.shape[0] <= image.shape[0] and template.shape[1] <= image.shape[1]
+
+
+def _unsuppressed(
+    order: numpy.ndarray, positions: numpy.ndarray, suppressed: numpy.ndarray
+) -> Iterator[int]:
+    """Iterate match indices in the given order, skipping matches which have
+    their position marked in the flattened `suppressed` map. The map can be
+    modified during iteration.
     """
-    template_width, template_height = template.size
+    # Candidates are filtered in chunks, so that the ones already
+    # suppressed are skipped without checking them one by one
+    for start in range(0, len(order), SUPPRESS_CHUNK_SIZE):
+        chunk = order[start : start + SUPPRESS_CHUNK_SIZE]
+        for index in chunk[~suppressed[positions[chunk]]]:
+            if not suppressed[positions[index]]:
+                yield index
 
-    if image.mode == "RGBA":
-        image = image.convert("RGB")
-    if template.mode == "RGBA":
-        template = template.convert("RGB")
 
-    image = numpy.array(image)
-    template = numpy.array(template)
+def _suppress_area(
+    suppressed: numpy.ndarray, left: int, top: int, width: int, height: int
+):
+    """Mark a template-sized area around the given top-left corner."""
+    suppressed[
+        max(top - height // 2, 0) : max(top + height // 2, 0),
+        max(left - width // 2, 0) : max(left + width // 2, 0),
+    ] = True
+    suppressed[top, left] = True
 
-    image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-    template = cv2.cvtColor(template, cv2.COLOR_RGB2BGR)
+
+def _find_peaks(
+    coefficients: numpy.ndarray, tolerance: float, width: int, height: int
+) -> List[Match]:
+    """Find all matches above tolerance from the coefficients, in confidence
+    order. Each match suppresses the weaker matches in a template-sized
+    area around it, to prevent duplicate matches for the same element.
+    """
+    values = coefficients.ravel()
+    positions = numpy.flatnonzero(values >= tolerance)
+    # Ties are resolved in row-major order, same as cv2.minMaxLoc()
+    order = numpy.argsort(-values[positions], kind="stable")
+
+    suppressed = numpy.zeros(coefficients.shape, dtype=bool)
+    matches: List[Match] = []
+    for index in _unsuppressed(order, positions, suppressed.ravel()):
+        top, left = divmod(int(positions[index]), coefficients.shape[1])
+        matches.append((float(values[positions[index]]), left, top, width, height))
+        if len(matches) >= LIMIT_FAILSAFE:
+            break
+        _suppress_area(suppressed, left, top, width, height)
+
+    return matches
+
+
+def _suppress(matches: List[Match]) -> List[Match]:
+    """Remove overlapping matches, keeping the best ones in confidence order.
+
+    A match suppresses all weaker matches, which have their top-left
+    corner within a template-sized area around its own top-left corner.
+    """
+    if not matches:
+        return []
+
+    coeffs = numpy.array([match[0] for match in matches])
+    lefts = numpy.array([match[1] for match in matches])
+    tops = numpy.array([match[2] for match in matches])
+
+    suppressed = numpy.zeros((tops.max() + 1, lefts.max() + 1), dtype=bool)
+    positions = tops * suppressed.shape[1] + lefts
+    order = numpy.argsort(-coeffs, kind="stable")
+
+    accepted: List[Match] = []
+    for index in _unsuppressed(order, positions, suppressed.ravel()):
+        accepted.append(matches[index])
+        if len(accepted) >= LIMIT_FAILSAFE:
+            break
+        _suppress_area(suppressed, *matches[index][1:])
+
+    return accepted
+
+
+def _search_full(
+    image: numpy.ndarray, template: numpy.ndarray, tolerance: float
+) -> List[Match]:
+    """Find all matches by comparing the template at every position."""
+    template_height, template_width = template.shape[:2]
 
     # Template matching result is a single channel array of shape:
     # Width:  Image width  - template width  + 1
     # Height: Image height - template height + 1
     coefficients = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
-    coeff_height, coeff_width = coefficients.shape
 
-    while True:
-        # The point (match_x, match_y) is the top-left of the best match
-        _, match_coeff, _, (match_x, match_y) = cv2.minMaxLoc(coefficients)
-        if match_coeff < tolerance:
-            break
+    return _find_peaks(coefficients, tolerance, template_width, template_height)
+
+
+def _search_pyramid(
+    image: numpy.ndarray,
+    template: numpy.ndarray,
+    small_template: numpy.ndarray,
+    tolerance: float,
+    levels: int,
+) -> List[Match]:
+    """Find candidates from downscaled images, and verify them
+    by comparing the template at full resolution around each candidate.
+    """
+    template_height, template_width = template.shape[:2]
+    image_height, image_width = image.shape[:2]
+    factor = 2**levels
+
+    small_image = _downscale(image, levels)
+    if not _fits(small_image, small_template):
+        return []
+
+    coefficients = cv2.matchTemplate(small_image, small_template, cv2.TM_CCOEFF_NORMED)
+    small_height, small_width = small_template.shape[:2]
+    candidates = _find_peaks(
+        coefficients, tolerance - PYRAMID_MARGIN, small_width, small_height
+    )
+
+    matches: List[Match] = []
+    for _, col, row, _, _ in candidates:
+        # Search area covers the rounding error of each downscaled level
+        left = max(col * factor - factor, 0)
+        top = max(row * factor - factor, 0)
+        right = min(col * factor + factor + template_width, image_width)
+        bottom = min(row * factor + factor + template_height, image_height)
+
+        area = image[top:bottom, left:right]
+        if not _fits(area, template):
+            continue
+
+        result = cv2.matchTemplate(area, template, cv2.TM_CCOEFF_NORMED)
+        _, match_coeff, _, (match_x, match_y) = cv2.minMaxLoc(result)
+        if match_coeff >= tolerance:
+            matches.append(
+                (
+                    match_coeff,
+                    left + match_x,
+                    top + match_y,
+                    template_width,
+                    template_height,
+                )
+            )
+
+    return matches
+
+
+def _search(
+    image: numpy.ndarray,
+    template: Template,
+    tolerance: float,
+    mode: str = "color",
+    scale: float = 1.0,
+    levels: Optional[int] = 0,
+) -> List[Match]:
+    array = template.array(mode, scale)
+    if levels is None:
+        levels = _pyramid_levels(array)
+
+    if levels > 0:
+        small_array = template.array(mode, scale, levels)
+        matches = _search_pyramid(image, array, small_array, tolerance, levels)
+        if matches:
+            return matches
+
+    # Fall back to comparing every position, in case the coarse
+    # search missed the only match because of lost details.
+    # Other missed matches are only found without the pyramid.
+    return _search_full(image, array, tolerance)
+
+
+def _match_template(
+    image: Image.Image,
+    template: Template,
+    tolerance: float,
+    mode: str = "color",
+    scales: Optional[Sequence[float]] = None,
+    levels: Optional[int] = 0,
+) -> Iterator[Region]:
+    """Use opencv's matchTemplate() to slide the `template` over
+    `image` to calculate correlation coefficients, and then
+    filter with a tolerance to find all relevant global maximums.
+
+    If pyramid levels are given, large templates are first searched from
+    downscaled images, and the candidates are then verified at full
+    resolution. This trades recall for speed, see `find()`.
+    """
+    image = _to_array(image, mode)
 
-        # Zero out values for a template-sized region around the best match
-        # to prevent duplicate matches for the same element.
-        left = clamp(0, match_x - template_width // 2, coeff_width)
-        top = clamp(0, match_y - template_height // 2, coeff_height)
-        right = clamp(0, match_x + template_width // 2, coeff_width)
-        bottom = clamp(0, match_y + template_height // 2, coeff_height)
+    matches: List[Match] = []
+    for scale in scales or (1.0,):
+        scale = float(scale)
+        if not _fits(image, template.array(mode, scale)):
+            LOGGER.debug("Template with scale %s is larger than image", scale)
+            continue
+        matches.extend(_search(image, template, tolerance, mode, scale, levels))
 
-        coefficients[top:bottom, left:right] = 0
+    # Matches from different scales, or verified pyramid candidates with
+    # overlapping search areas, can overlap each other and be out of order
+    matches = _suppress(matches)
 
-        yield Region.from_size(match_x, match_y, template_width, template_height)
+    for _, left, top, width, height in matches:
+        yield Region.from_size(left, top, width, height)
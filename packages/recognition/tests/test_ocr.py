@@ -1,9 +1,10 @@
 import logging
 import pytest
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from PIL import Image
+from PIL import Image, ImageDraw
 import pytesseract
 from pytesseract import TesseractNotFoundError
 
@@ -130,3 +131,128 @@ def test__match_lines():
     result = ocr._match_lines(lines, "New", 100)
 
     assert result == expected
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    ocr.clear_cache()
+    images = []
+    image_to_data = pytesseract.image_to_data
+
+    def spy(image, *args, **kwargs):
+        images.append(image)
+        return image_to_data(image, *args, **kwargs)
+
+    monkeypatch.setattr(pytesseract, "image_to_data", spy)
+    yield images
+    ocr.clear_cache()
+
+
+def test_find_cached(scanned):
+    image = Image.open(IMAGES / "source.png")
+
+    first = ocr.find(image, "Calculator")
+    second = ocr.find(image.copy(), "Calculator")
+
+    assert first == second
+    assert len(scanned) == 1
+
+
+def test_find_changed_area(scanned):
+    image = Image.open(IMAGES / "source.png").convert("RGB")
+    first = ocr.find(image, "Standard")
+
+    changed = image.copy()
+    ImageDraw.Draw(changed).rectangle((900, 1200, 1000, 1220), fill="white")
+    second = ocr.find(changed, "Standard")
+
+    assert first == second
+    assert len(scanned) == 2
+    assert scanned[1].width == image.width
+    assert scanned[1].height < image.height // 2
+    for reference in ocr._REFERENCES.values():
+        assert not any(isinstance(value, Image.Image) for value in reference)
+
+
+def test__changed_band():
+    image = Image.new("RGB", (100, 200), "white")
+    changed = image.copy()
+    ImageDraw.Draw(changed).rectangle((10, 100, 20, 110), fill="black")
+    lines = [[{"text": "Text", "region": Region(0, 95, 50, 130)}]]
+
+    band = ocr._changed_band(ocr._row_digests(image), lines, ocr._row_digests(changed))
+
+    assert band == (100 - ocr.CHANGE_MARGIN, 130)
+
+
+def test_cache_limit_bytes():
+    cache = ocr._Cache(max_bytes=1000)
+    for index in range(100):
+        cache.set(("string", index), "x" * 50)
+
+    assert cache.get(("string", 0)) is None
+    assert cache.get(("string", 99)) == "x" * 50
+    assert sum(ocr._sizeof(value) for value in cache.values()) <= 1000
+
+
+def test_cache_threads():
+    cache = ocr._Cache(max_bytes=10000)
+
+    def worker(offset):
+        for index in range(1000):
+            cache.set((offset, index % 50), str(index))
+            cache.get((offset, index % 50))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    assert sum(ocr._sizeof(value) for value in cache.values()) <= 10000
+
+
+def test_find_regions(scanned, monkeypatch):
+    monkeypatch.setattr(ocr, "BATCH_WORKERS", 1)
+    regions = [Region(146, 96, 344, 163), Region(16, 490, 1034, 611)]
+
+    results = ocr.find_regions(IMAGES / "source.png", "Standard", regions)
+
+    assert len(scanned) == 1
+    assert len(results) == 2
+    assert results[0][0]["text"] == "Standard"
+    assert regions[0].contains(results[0][0]["region"])
+    assert results[1] == []
+
+
+def test_read_regions():
+    regions = [Region(146, 96, 344, 163), Region(146, 96, 344, 163)]
+    texts = ocr.read_regions(IMAGES / "source.png", regions)
+    assert texts == ["Standard", "Standard"]
+
+
+def test__match_lines_section():
+    lines = [
+        [
+            {"text": "Open", "region": Region(1356, 440, 1417, 473)},
+            {"text": "Edit", "region": Region(1493, 440, 1536, 473)},
+            {"text": "New", "region": Region(1641, 446, 1690, 464)},
+            {"text": "Delete", "region": Region(1755, 444, 1831, 464)},
+        ],
+        [
+            {"text": "Edit", "region": Region(10, 10, 50, 30)},
+            {"text": "Nev", "region": Region(60, 10, 90, 30)},
+        ],
+    ]
+
+    result = ocr._match_lines(lines, "Edit New", 80)
+
+    assert result == [
+        {
+            "text": "Edit New",
+            "region": Region(1493, 440, 1690, 473),
+            "confidence": 100.0,
+        },
+        {
+            "text": "Edit Nev",
+            "region": Region(10, 10, 90, 30),
+            "confidence": 87.5,
+        },
+    ]
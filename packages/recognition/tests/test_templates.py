@@ -1,5 +1,9 @@
+import numpy
+import os
 import pytest
 from pathlib import Path
+from shutil import copyfile
+from PIL import Image
 
 from RPA.recognition import templates
 from RPA.core.geometry import Region
@@ -73,3 +77,150 @@ def test_find_template(region_and_template):
     assert len(matches) == 1
     match = matches[0]
     assert match.center == region.center
+
+
+def test_find_template_pyramid(region_and_template):
+    region, template = region_and_template
+    region = Region(*region)
+
+    matches = templates.find(
+        image=IMAGES / "source.png", template=IMAGES / template, levels=None
+    )
+
+    assert len(matches) == 1
+    assert matches[0].center == region.center
+
+
+def test_find_template_grayscale(region_and_template):
+    region, template = region_and_template
+    region = Region(*region)
+
+    matches = templates.find(
+        image=IMAGES / "source.png", template=IMAGES / template, mode="grayscale"
+    )
+
+    assert len(matches) == 1
+    assert matches[0].center == region.center
+
+
+def test_find_template_edges():
+    region = Region(26, 994, 274, 1115)
+    matches = templates.find(
+        image=IMAGES / "source.png",
+        template=IMAGES / "locator_Calculator_ctrl_One.jpg",
+        mode="edges",
+        confidence=60,
+    )
+
+    assert matches[0].center == region.center
+
+
+def test_find_template_scaled():
+    image = Image.open(IMAGES / "source.png")
+    image = image.resize((image.width * 5 // 4, image.height * 5 // 4))
+    region = Region(26, 994, 274, 1115).scale(1.25)
+
+    matches = templates.find(
+        image=image,
+        template=IMAGES / "locator_Calculator_ctrl_One.jpg",
+        scales=[0.8, 1.0, 1.25],
+    )
+
+    assert len(matches) == 1
+    assert abs(matches[0].center.x - region.center.x) <= 2
+    assert abs(matches[0].center.y - region.center.y) <= 2
+    assert matches[0].width == round(248 * 1.25)
+
+
+def test_find_template_unknown_mode():
+    with pytest.raises(ValueError):
+        templates.find(
+            image=IMAGES / "source.png",
+            template=IMAGES / "locator_Calculator_ctrl_One.jpg",
+            mode="unknown",
+        )
+
+
+def test_find_template_cached(tmp_path):
+    path = tmp_path / "template.jpg"
+    copyfile(IMAGES / "locator_Calculator_ctrl_One.jpg", path)
+    source = Image.open(IMAGES / "source.png")
+
+    templates.clear_template_cache()
+    first = templates.find(image=source, template=path)
+    second = templates.find(image=source, template=str(path))
+
+    assert first == second
+    assert templates.to_template(path) is templates.to_template(str(path))
+    assert templates._open_template.cache_info().misses == 1
+
+    # Modified file is read again
+    copyfile(IMAGES / "locator_Calculator_ctrl_Two.jpg", path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    matches = templates.find(image=source, template=path)
+    assert matches[0].center == Region(279, 994, 527, 1115).center
+    assert templates._open_template.cache_info().misses == 2
+
+
+def test_find_template_many_matches():
+    template = Image.open(IMAGES / "locator_Calculator_ctrl_Memory_Recall.jpg")
+    width, height = template.size
+
+    image = Image.new("RGB", (4 * (width + 10), 3 * (height + 10)), "white")
+    expected = []
+    for row in range(3):
+        for col in range(4):
+            position = (col * (width + 10) + 5, row * (height + 10) + 5)
+            image.paste(template, position)
+            expected.append(Region.from_size(*position, width, height))
+
+    matches = templates.find(image=image, template=template, levels=0)
+    assert sorted(matches, key=lambda r: (r.top, r.left)) == expected
+
+    matches = templates.find(image=image, template=template, limit=5)
+    assert len(matches) == 5
+
+
+def test_find_template_pyramid_overlapping(monkeypatch):
+    # Verified candidates can end at the same spot, and out of order
+    candidates = [
+        (0.90, 10, 10, 20, 20),
+        (0.95, 11, 10, 20, 20),
+        (0.95, 11, 10, 20, 20),
+        (0.99, 100, 100, 20, 20),
+    ]
+    monkeypatch.setattr(templates, "_search", lambda *args: list(candidates))
+
+    image = Image.new("RGB", (200, 200), "white")
+    template = Image.new("RGB", (20, 20), "black")
+
+    matches = templates.find(image=image, template=template)
+    assert matches == [
+        Region.from_size(100, 100, 20, 20),
+        Region.from_size(11, 10, 20, 20),
+    ]
+
+
+def test_find_template_lost_in_pyramid():
+    # Fine checkerboard on top of a faint shape, which is the only
+    # difference between the two copies after downscaling
+    yy, xx = numpy.mgrid[0:64, 0:64]
+    checker = numpy.where((xx + yy) % 2 == 0, 60, -60)
+    shape = numpy.where(xx < 32, 8, -8)
+    template = (128 + checker + shape).astype("uint8")
+
+    image = numpy.full((200, 300), 128, dtype="uint8")
+    image[20:84, 20:84] = template
+    image[100:164, 200:264] = 128 + checker
+
+    image = Image.fromarray(image).convert("RGB")
+    template = Image.fromarray(template).convert("RGB")
+    expected = [Region(20, 20, 84, 84), Region(200, 100, 264, 164)]
+
+    matches = templates.find(image=image, template=template)
+    assert sorted(matches, key=lambda r: r.left) == expected
+
+    matches = templates.find(image=image, template=template, levels=None)
+    assert matches == expected[:1]